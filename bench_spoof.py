@@ -0,0 +1,141 @@
+"""
+Benchmark latensi pipeline spoof (headless, tanpa UI Tk).
+
+Mengukur tiap tahap yang dijalankan START/STOP di GameSimulatorApp:
+  copy        - shutil.copy executable ke temp (cara lama)
+  cache_miss  - ArtifactCache.prepare saat entry belum ada (hardlink/reflink/copy)
+  cache_hit   - ArtifactCache.prepare saat entry sudah ada
+  spawn       - Popen dummy sampai return
+  first_alive - Popen sampai dummy mengirim sinyal ready
+  teardown    - SessionManager.stop (kill + reap + cleanup)
+
+Contoh:
+  python bench_spoof.py -n 50 --output bench.json
+  python bench_spoof.py -n 50 --output new.json --compare bench.json --threshold 20
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import discordGS as app
+
+STAGES = ("copy", "cache_miss", "cache_hit", "spawn", "first_alive", "teardown")
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "describe", "--always", "--dirty"],
+                                       cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(iterations, workdir):
+    samples = {stage: [] for stage in STAGES}
+    cache = app.ArtifactCache(os.path.join(workdir, "artifacts"))
+    manager = app.SessionManager(cache)
+
+    for i in range(iterations):
+        name = f"BenchGame{i}.exe"
+
+        # Cara lama: copy penuh ke folder temp
+        target = os.path.join(workdir, name)
+        t0 = time.perf_counter()
+        shutil.copy(sys.executable, target)
+        samples["copy"].append(time.perf_counter() - t0)
+        os.remove(target)
+
+        t0 = time.perf_counter()
+        cache.prepare(name)
+        samples["cache_miss"].append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        cache.prepare(name)
+        samples["cache_hit"].append(time.perf_counter() - t0)
+
+        # Spawn & first-alive: prepare sudah hit, jadi yang terukur hanya Popen + startup dummy
+        wall0, t0 = time.time(), time.perf_counter()
+        session = manager.start_process(name)
+        samples["spawn"].append(time.perf_counter() - t0)
+        if not session.wait_ready(30) or session.process.poll() is not None:
+            raise RuntimeError(f"dummy {name} did not become ready")
+        samples["first_alive"].append(session.ready_at - wall0)
+        with manager.lock:
+            manager.sessions[name] = session
+
+        t0 = time.perf_counter()
+        manager.stop(name)
+        samples["teardown"].append(time.perf_counter() - t0)
+
+    return samples
+
+def summarize(samples):
+    result = {}
+    for stage, values in samples.items():
+        result[stage] = {
+            "count": len(values),
+            "p50_ms": app.percentile(values, 50) * 1000,
+            "p95_ms": app.percentile(values, 95) * 1000,
+            "p99_ms": app.percentile(values, 99) * 1000,
+            "max_ms": max(values) * 1000,
+        }
+    return result
+
+def compare(current, baseline, threshold):
+    """Cetak perbandingan p50/p95; return daftar stage yang regresi melebihi threshold (%)"""
+    regressions = []
+    print(f"\n{'stage':<12} {'base p50':>10} {'new p50':>10} {'base p95':>10} {'new p95':>10}")
+    for stage in STAGES:
+        old, new = baseline["stages"].get(stage), current["stages"].get(stage)
+        if not old or not new: continue
+        print(f"{stage:<12} {old['p50_ms']:>10.2f} {new['p50_ms']:>10.2f} {old['p95_ms']:>10.2f} {new['p95_ms']:>10.2f}")
+        if old["p95_ms"] > 0 and (new["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100 > threshold:
+            regressions.append(stage)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Launch/stop latency benchmark for discordGS")
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    parser.add_argument("--output", help="Simpan hasil sebagai JSON")
+    parser.add_argument("--compare", help="File JSON hasil sebelumnya sebagai baseline")
+    parser.add_argument("--threshold", type=float, default=25.0, help="Batas regresi p95 dalam persen")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="dgs-bench-")
+    try:
+        samples = run(args.iterations, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "timestamp": time.time(),
+        "stages": summarize(samples),
+    }
+
+    print(f"{'stage':<12} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for stage, s in report["stages"].items():
+        print(f"{stage:<12} {s['p50_ms']:>9.2f} {s['p95_ms']:>9.2f} {s['p99_ms']:>9.2f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\nREGRESSION (> {args.threshold:.0f}% p95): {', '.join(regressions)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Harness latensi deteksi (offline, tanpa Discord).
+
+MockDetector meniru cara detector game Discord melihat proses: enumerasi semua proses
+(nama proses / path executable / argv[0]) lalu mencocokkannya dengan daftar detectable.
+Harness menjalankan N dummy sekaligus lewat SessionManager (jalur yang sama dengan
+start_simulation / stop_simulation) dan mengukur:
+  detect   - dari launch batch sampai dummy terlihat oleh scanner
+  undetect - dari stop batch sampai dummy hilang dari scanner
+
+Discord sendiri memindai secara periodik; --interval mensimulasikan periode tersebut
+(default 10 ms untuk mengukur latensi intrinsik spoofer).
+
+Contoh:
+  python detect_harness.py -c 1 4 8 -r 3
+  python detect_harness.py -c 1 8 --interval 1.0 --detectable detectable.json --output detect.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import tempfile
+import threading
+import time
+
+import discordGS as app
+
+class MockDetector:
+    """Scanner proses sederhana: cocokkan nama executable (case-insensitive) dengan daftar detectable"""
+    def __init__(self, detectable):
+        self.detectable = {name.lower() for name in detectable}
+        # comm di Linux dipotong 15 *byte* (bisa di tengah karakter UTF-8) lalu di-decode dengan
+        # errors="replace" oleh process_names, jadi potong nama detectable dengan cara yang sama
+        self.truncated = {name.encode("utf-8")[:15].decode(errors="replace").lower(): name.lower()
+                          for name in detectable}
+
+    def process_names(self):
+        """Yield (pid, [kandidat nama]) untuk tiap proses yang bisa dibaca"""
+        if os.name != 'nt' and os.path.isdir("/proc"):
+            for entry in os.listdir("/proc"):
+                if not entry.isdigit(): continue
+                names = []
+                try:
+                    with open(f"/proc/{entry}/comm", "rb") as f:
+                        names.append(f.read().decode(errors="replace").strip())
+                    with open(f"/proc/{entry}/cmdline", "rb") as f:
+                        argv0 = f.read().split(b"\0", 1)[0].decode(errors="replace")
+                    if argv0:
+                        names.append(os.path.basename(argv0.replace("\\", "/")))
+                    names.append(os.path.basename(os.readlink(f"/proc/{entry}/exe")))
+                except OSError:
+                    if not names: continue # Proses sudah keluar / bukan milik kita
+                yield int(entry), names
+        else:
+            for pid, _, name in app.list_processes():
+                yield pid, [name]
+
+    def scan(self):
+        """Return set nama detectable yang sedang berjalan"""
+        found = set()
+        for _, names in self.process_names():
+            for name in names:
+                key = name.lower()
+                if key in self.detectable:
+                    found.add(key)
+                elif key in self.truncated:
+                    found.add(self.truncated[key])
+        return found
+
+class ScanLoop:
+    """Thread yang memindai tiap `interval` detik dan mencatat kapan tiap nama muncul / hilang"""
+    def __init__(self, detector, interval):
+        self.detector = detector
+        self.interval = interval
+        self.seen_at = {}
+        self.gone_at = {}
+        self.visible = set()
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self.stopping.is_set():
+            found = self.detector.scan()
+            now = time.perf_counter()
+            for name in found - self.visible:
+                self.seen_at.setdefault(name, now)
+            for name in self.visible - found:
+                self.gone_at.setdefault(name, now)
+            self.visible = found
+            self.stopping.wait(self.interval)
+
+    def wait_for(self, predicate, timeout):
+        end = time.perf_counter() + timeout
+        while time.perf_counter() < end:
+            if predicate():
+                return True
+            time.sleep(0.005)
+        return False
+
+def run_round(manager, detector, names, interval, timeout):
+    loop = ScanLoop(detector, interval)
+    loop.thread.start()
+    keys = [n.lower() for n in names]
+    try:
+        t0 = time.perf_counter()
+        started, errors = manager.launch_many(names)
+        if errors:
+            raise RuntimeError(f"launch failed: {errors}")
+        if not loop.wait_for(lambda: all(k in loop.seen_at for k in keys), timeout):
+            raise RuntimeError("dummies were not detected in time")
+
+        t1 = time.perf_counter()
+        manager.stop_all()
+        if not loop.wait_for(lambda: all(k in loop.gone_at for k in keys), timeout):
+            raise RuntimeError("dummies were still detected after stop")
+    finally:
+        manager.stop_all()
+        loop.stopping.set()
+        loop.thread.join()
+    return ([loop.seen_at[k] - t0 for k in keys], [loop.gone_at[k] - t1 for k in keys])
+
+def summarize(values):
+    return {"count": len(values),
+            "p50_ms": app.percentile(values, 50) * 1000,
+            "p95_ms": app.percentile(values, 95) * 1000,
+            "max_ms": max(values) * 1000}
+
+def main():
+    parser = argparse.ArgumentParser(description="Time-to-detect / time-to-undetect harness for discordGS")
+    parser.add_argument("-c", "--concurrency", type=int, nargs="+", default=[1, 4, 8],
+                        help="Jumlah dummy yang dijalankan bersamaan (boleh lebih dari satu)")
+    parser.add_argument("-r", "--rounds", type=int, default=3)
+    parser.add_argument("--interval", type=float, default=0.01, help="Periode scan detector (detik)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--detectable", help="File daftar detectable Discord (JSON); default: nama dummy saja")
+    parser.add_argument("--output", help="Simpan hasil sebagai JSON")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="dgs-detect-")
+    manager = app.SessionManager(app.ArtifactCache(os.path.join(workdir, "artifacts")))
+    results = {}
+    try:
+        for n in args.concurrency:
+            names = [f"DetectProbe{i}.exe" for i in range(n)]
+            detectable = set(names)
+            if args.detectable:
+                detectable.update(exe for exe, _ in app.load_catalog_json(args.detectable))
+            detector = MockDetector(detectable)
+            detect, undetect = [], []
+            for _ in range(args.rounds):
+                d, u = run_round(manager, detector, names, args.interval, args.timeout)
+                detect.extend(d)
+                undetect.extend(u)
+            results[n] = {"detect": summarize(detect), "undetect": summarize(undetect)}
+    finally:
+        manager.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{'dummies':>7} {'detect p50':>11} {'p95':>8} {'max':>8} {'undetect p50':>13} {'p95':>8} {'max':>8}  (ms)")
+    for n, r in results.items():
+        d, u = r["detect"], r["undetect"]
+        print(f"{n:>7} {d['p50_ms']:>11.1f} {d['p95_ms']:>8.1f} {d['max_ms']:>8.1f} "
+              f"{u['p50_ms']:>13.1f} {u['p95_ms']:>8.1f} {u['max_ms']:>8.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "interval": args.interval, "rounds": args.rounds, "timestamp": time.time(),
+                       "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -1,67 +1,2831 @@
-import tkinter as tk
-from tkinter import messagebox
+import time
+STARTUP_T0 = time.perf_counter() # Titik nol untuk ukuran time-to-interactive
+
 import os
 import sys
-import shutil
-import subprocess
-import time
-import tempfile
+
+# --- FUNGSI DUMMY MODE (CHILD PROCESS) ---
+# Bagian ini sengaja diletakkan sebelum import berat (tkinter, ctypes, json, dll)
+# agar proses dummy hanya memuat modul seminimal mungkin.
+def run_dummy_mode():
+    """
+    Fungsi ini akan dijalankan oleh proses 'palsu' (file yang dicopy menjadi nama game).
+    Default-nya headless: tidak ada window, tidak ada event loop, hanya blok sampai dibunuh.
+    Window Tk hanya dibuat jika diminta secara eksplisit lewat --dummy-window.
+    """
+    if "--dummy-window" in sys.argv:
+        run_dummy_window()
+        return
+
+    set_process_name()
+    apply_resource_policy()
+    signal_dummy_ready()
+    if "--dummy-watch-parent" in sys.argv:
+        wait_parent_exit()
+        return
+    try:
+        import signal
+        if hasattr(signal, "pause"):
+            # POSIX: tidur total sampai ada sinyal (tanpa wakeup periodik)
+            while True:
+                signal.pause()
+        else:
+            # Windows: wait tanpa timeout = WaitForSingleObject(INFINITE)
+            import threading
+            threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+
+def wait_parent_exit():
+    """
+    Blok di stdin: controller memegang ujung tulis pipe-nya. Jika controller mati (crash, kill,
+    Task Manager) OS menutup pipe tersebut, read() return EOF dan dummy ikut keluar.
+    """
+    try:
+        while os.read(0, 64):
+            pass
+    except (OSError, KeyboardInterrupt):
+        pass
+
+RESOURCE_POLICY_ENV = "DGS_RESOURCE_POLICY"
+
+def apply_resource_policy():
+    """
+    POSIX: dummy menerapkan sendiri policy dari controller (env DGS_RESOURCE_POLICY,
+    'nice=19;cpus=0,1;memory_mb=64'). Hanya modul bawaan os/resource, tanpa json.
+    """
+    raw = os.environ.pop(RESOURCE_POLICY_ENV, None)
+    if not raw or os.name == 'nt':
+        return
+    policy = dict(item.split("=", 1) for item in raw.split(";") if "=" in item)
+    try:
+        nice = int(policy.get("nice") or 0)
+        if nice > 0:
+            os.setpriority(os.PRIO_PROCESS, 0, max(nice, os.getpriority(os.PRIO_PROCESS, 0)))
+        cpus = [int(c) for c in policy.get("cpus", "").split(",") if c]
+        if cpus and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+        memory_mb = int(policy.get("memory_mb") or 0)
+        if memory_mb:
+            import resource
+            limit = memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (OSError, ValueError):
+        pass # Controller tetap memverifikasi & melaporkan policy yang gagal
+
+def set_process_name():
+    """
+    Linux: comm (/proc/<pid>/comm, max 15 byte) diambil kernel dari nama file yang di-exec.
+    Jika dummy di-exec lewat nama lain (mis. bootloader PyInstaller me-re-exec binary aslinya),
+    samakan lagi dengan nama game dari --dummy-name lewat prctl(PR_SET_NAME).
+    """
+    if not sys.platform.startswith("linux") or "--dummy-name" not in sys.argv:
+        return
+    name = sys.argv[sys.argv.index("--dummy-name") + 1].encode("utf-8")[:15]
+    try:
+        with open("/proc/self/comm", "rb") as f:
+            if f.read().rstrip(b"\n") == name:
+                return # Kasus normal: tidak perlu memuat ctypes
+        import ctypes
+        PR_SET_NAME = 15
+        ctypes.CDLL(None).prctl(PR_SET_NAME, ctypes.c_char_p(name), 0, 0, 0)
+    except (OSError, AttributeError):
+        pass
+
+def signal_dummy_ready():
+    """Beri tahu controller bahwa dummy sudah siap (1 byte ke stdout pipe, hanya jika --dummy-ready)"""
+    if "--dummy-ready" in sys.argv:
+        try: os.write(1, b"R")
+        except OSError: pass
+
+def run_dummy_window():
+    """Mode lama: window tkinter minimalis yang di-minimize ke taskbar"""
+    try:
+        import tkinter as tk
+        # Kita buat window tkinter minimalis
+        root = tk.Tk()
+        # Set judul sesuai nama file executable saat ini (misal: Valorant.exe)
+        current_exe_name = os.path.basename(sys.executable)
+        root.title(current_exe_name)
+        root.geometry("300x100")
+        root.configure(bg="#121212")
+        
+        # Pesan status
+        lbl = tk.Label(root, text=f"Game Simulator Running...\n({current_exe_name})", 
+                       fg="#03DAC6", bg="#121212", font=("Segoe UI", 10))
+        lbl.pack(expand=True)
+        
+        # Minimize window agar tidak mengganggu, tapi tetap ada di taskbar
+        # Gunakan after agar event loop jalan dulu baru minimize
+        root.after(100, root.iconify)
+        
+        # Bind close event agar proses benar-benar mati saat ditutup manual
+        root.protocol("WM_DELETE_WINDOW", root.destroy)
+        
+        signal_dummy_ready()
+        if "--dummy-watch-parent" in sys.argv:
+            import threading
+            def watch_parent():
+                wait_parent_exit()
+                os._exit(0)
+            threading.Thread(target=watch_parent, daemon=True).start()
+        root.mainloop()
+    except Exception as e:
+        # Jika terjadi error di background process, kita bisa log atau abaikan
+        pass
+
+if __name__ == "__main__" and "--dummy-mode" in sys.argv:
+    run_dummy_mode()
+    sys.exit(0)
+
+import tkinter as tk
 import math
-import ctypes 
-import webbrowser
 import json
+import threading
+import queue
+import collections
+import struct
+import re
+import bisect
+import itertools
+
+class LazyModule:
+    """Modul yang baru benar-benar di-import saat atributnya pertama kali dipakai (hemat cold-start)"""
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        import importlib
+        return getattr(importlib.import_module(self._name), attr)
+
+# Hanya dibutuhkan saat klik tertentu (launch/stop/source) atau khusus Windows
+messagebox = LazyModule("tkinter.messagebox")
+shutil = LazyModule("shutil")
+subprocess = LazyModule("subprocess")
+tempfile = LazyModule("tempfile")
+ctypes = LazyModule("ctypes")
+webbrowser = LazyModule("webbrowser")
+
+# --- KONFIGURASI TEMA MODERN (Deep Dark / Cyberpunk Minimalist) ---
+THEME = {
+    "bg_main": "#121212",       # Hampir hitam
+    "bg_surface": "#1E1E1E",    # Abu gelap untuk card/input
+    "bg_popup": "#252525",      # Abu sedikit terang untuk dropdown
+    "primary": "#BB86FC",       # Ungu pastel (aksen modern)
+    "primary_dark": "#3700B3",  # Ungu gelap untuk hover
+    "secondary": "#00E676",     # Hijau terang (Online Status)
+    "secondary_dim": "#004D40", # Hijau gelap
+    "danger": "#CF6679",        # Merah soft
+    "danger_hover": "#B00020",  # Merah gelap
+    "blue": "#2979FF",          # Biru modern (Tombol Source)
+    "blue_hover": "#0055FF",    # Biru gelap hover
+    "text_main": "#E1E1E1",     # Putih tulang
+    "text_dim": "#B0B0B0",      # Abu muda
+    "font_family": "Segoe UI"
+}
+
+HISTORY_FILE = "game_history.json" # Format lama (relatif ke cwd), hanya untuk migrasi
+HISTORY_LIMIT = 5 # Jumlah game yang ditampilkan di popup riwayat
+EXITED_ROW_MS = 8000 # Baris dummy yang mati sendiri tetap tampil (dengan exit code) selama ini
+SUGGEST_LIMIT = 50 # Saran katalog per keystroke; popup hanya menampilkan 6 baris sekaligus
+
+# Dummy hanya membuat window jika diminta (python discordGS.py --dummy-window)
+DUMMY_WINDOW = "--dummy-window" in sys.argv
+USAGE_SAMPLE_INTERVAL = 2.0 # Detik antar pembacaan RSS/CPU dummy
+APP_WIDTH, APP_HEIGHT = 450, 560
+
+# Fast-start: tanpa fade-in & pekerjaan non-esensial ditunda setelah frame pertama
+FAST_START = "--fast-start" in sys.argv
+# Budget cold-start (ms) untuk --check-startup
+STARTUP_BUDGET_MS = {"import": 80, "first_frame": 500}
+
+# --- DIREKTORI DATA & KONFIGURASI USER ---
+APP_DIR_NAME = "DiscordGameSpoofer"
+
+def user_data_dir():
+    """Direktori data per-user (bisa di-override dengan env DGS_DATA_DIR)"""
+    if os.environ.get("DGS_DATA_DIR"):
+        return os.environ["DGS_DATA_DIR"]
+    if os.name == 'nt':
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, APP_DIR_NAME)
+
+DEFAULT_CONFIG = {
+    "cache_budget_mb": 512,     # Batas disk untuk cache executable game
+    "cache_max_entries": 256,   # Batas jumlah entry cache (hardlink/symlink tidak memakan disk tapi tetap menumpuk)
+    "launch_concurrency": 4,    # Maksimal launch paralel saat batch
+    "pool_size": 0,             # Jumlah dummy warm per game (0 = pool mati)
+    "pool_idle_timeout": 600,   # Detik sebelum dummy warm yang tidak dipakai dimatikan
+    "pool_games": [],           # Nama game yang dijaga tetap warm
+    "fast_start": False,        # Sama dengan --fast-start
+    "use_daemon": False,        # GUI menjadi client daemon (sama dengan --connect)
+    "quest_concurrency": 2,     # Maksimal game quest yang jalan bersamaan
+    "metrics_file": "",         # Path file teks Prometheus (kosong = mati)
+    "metrics_port": 0,          # Port HTTP /metrics di 127.0.0.1 (0 = mati)
+    "metrics_interval": 15,     # Detik antar sampling RSS/CPU dummy untuk export
+    "dummy_nice": 19,           # Prioritas dummy: nice POSIX (19 = terendah) / Windows >=10 idle, 1-9 below normal, 0 = normal
+    "dummy_cpus": [],           # Pin dummy ke core ini, mis. [3] (kosong = semua core)
+    "dummy_memory_mb": 0,       # Batas address space (POSIX) / memori proses (Windows) per dummy, 0 = tanpa batas
+}
+
+def load_config():
+    """Gabungkan config.json di direktori data user dengan DEFAULT_CONFIG"""
+    config = dict(DEFAULT_CONFIG)
+    try:
+        with open(os.path.join(user_data_dir(), "config.json"), 'r') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            config.update(data)
+    except (OSError, ValueError):
+        pass
+    return config
+
+CONFIG = load_config()
+FAST_START = FAST_START or bool(CONFIG["fast_start"])
+
+# --- RIWAYAT & STATISTIK PEMAKAIAN (APPEND-ONLY) ---
+class HistoryStore:
+    """
+    Riwayat launch yang tahan crash, disimpan di direktori data user.
+      history.<gen>.log : append-only JSONL, satu event per baris (launch / end + durasi)
+      history.idx       : ringkasan terkompaksi; baris pertama header {"gen", "offset"},
+                          lalu satu baris per game, diurutkan dari skor tertinggi
+    Startup hanya membaca N baris teratas index + ekor log sejak kompaksi terakhir.
+    Skor = frecency: tiap launch +1, meluruh setengahnya tiap HALF_LIFE_DAYS.
+    """
+    HALF_LIFE_DAYS = 14
+    COMPACT_EVERY = 50 # Kompaksi di background setelah sekian event baru
+
+    def __init__(self, root, load_limit=50):
+        self.root = root
+        self.lock = threading.Lock()
+        self.entries = {} # game -> {"count", "last", "total", "score"}
+        self.gen, self.offset = 0, 0
+        self.pending_events = 0
+        self.compacting = False
+        self.rotated = None # Event yang masuk ke generasi log baru selama kompaksi berjalan
+        os.makedirs(root, exist_ok=True)
+        self._load(load_limit)
+        self._migrate_legacy()
+
+    @property
+    def index_path(self):
+        return os.path.join(self.root, "history.idx")
+
+    def log_path(self, gen):
+        return os.path.join(self.root, f"history.{gen}.log")
+
+    def _read_index(self, limit=None):
+        """Return (gen, offset, entries) dari index; hanya `limit` game teratas jika diberikan"""
+        entries = {}
+        try:
+            with open(self.index_path, 'r', encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                for i, line in enumerate(f):
+                    if limit is not None and i >= limit: break
+                    row = json.loads(line)
+                    entries[row.pop("game")] = row
+            return header["gen"], header["offset"], entries
+        except (OSError, ValueError, KeyError):
+            return 0, 0, entries
+
+    def _read_log(self, gen, offset):
+        events = []
+        try:
+            with open(self.log_path(gen), 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        continue # Baris terpotong akibat crash saat menulis
+        except OSError:
+            pass
+        return events
+
+    def _load(self, limit):
+        gen, self.offset, self.entries = self._read_index(limit)
+        tail = self._read_log(gen, self.offset)
+        while os.path.exists(self.log_path(gen + 1)): # Kompaksi terputus setelah rotasi log
+            gen += 1
+            tail += self._read_log(gen, 0)
+        self.gen = gen
+        for event in tail:
+            self._apply(self.entries, event)
+        self.pending_events = len(tail)
+
+    def _migrate_legacy(self):
+        """Import game_history.json lama (list nama) sekali saja"""
+        if self.entries or os.path.exists(self.index_path) or not os.path.exists(HISTORY_FILE):
+            return
+        try:
+            with open(HISTORY_FILE, 'r') as f:
+                names = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(names, list):
+            now = time.time()
+            for i, name in enumerate(reversed(names)):
+                self.record_launch(str(name), ts=now - len(names) + i)
+
+    def _decayed(self, entry, now):
+        age = max(0.0, now - entry["last"])
+        return entry["score"] * 0.5 ** (age / (self.HALF_LIFE_DAYS * 86400))
+
+    def _apply(self, entries, event):
+        entry = entries.setdefault(event.get("g"), {"count": 0, "last": 0, "total": 0.0, "score": 0.0})
+        ts = event.get("t", 0)
+        if event.get("e") == "launch":
+            entry["score"] = self._decayed(entry, ts) + 1
+            entry["count"] += 1
+            entry["last"] = max(entry["last"], ts)
+        elif event.get("e") == "end":
+            entry["total"] += event.get("d", 0)
+            if "x" in event:
+                entry["last_exit"] = event["x"]
+
+    def _append(self, event):
+        line = (json.dumps(event, separators=(",", ":")) + "\n").encode("utf-8")
+        with self.lock:
+            self._apply(self.entries, event)
+            # O_APPEND + satu write() = baris utuh, tidak menimpa data lama walau crash
+            fd = os.open(self.log_path(self.gen), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+            self.pending_events += 1
+            if self.rotated is not None:
+                self.rotated.append(event)
+            should_compact = self.pending_events >= self.COMPACT_EVERY and not self.compacting
+        if should_compact:
+            self.compact_async()
+
+    def record_launch(self, game_name, ts=None):
+        self._append({"e": "launch", "g": game_name, "t": ts or time.time()})
+
+    def record_end(self, game_name, duration, exit_code=None):
+        event = {"e": "end", "g": game_name, "t": time.time(), "d": round(duration, 1)}
+        if exit_code is not None:
+            event["x"] = exit_code
+        self._append(event)
+
+    def ranked(self, now=None):
+        now = now or time.time()
+        with self.lock:
+            items = list(self.entries.items())
+        items.sort(key=lambda kv: (self._decayed(kv[1], now), kv[1]["last"]), reverse=True)
+        return [name for name, _ in items]
+
+    def top(self, n=HISTORY_LIMIT):
+        return self.ranked()[:n]
+
+    def most_recent(self):
+        with self.lock:
+            if not self.entries: return None
+            return max(self.entries.items(), key=lambda kv: kv[1]["last"])[0]
+
+    def stats(self, game_name):
+        with self.lock:
+            entry = self.entries.get(game_name)
+            return dict(entry) if entry else None
+
+    def compact_async(self):
+        threading.Thread(target=self.compact, daemon=True).start()
+
+    def compact(self):
+        """
+        Gabungkan index penuh + log lama ke index baru. Di bawah lock hanya rotasi ke generasi log baru;
+        baca, merge & fsync index berjalan di luar lock agar record_launch (thread Tk) tidak ikut menunggu.
+        """
+        with self.lock:
+            if self.compacting: return
+            self.compacting = True
+            gen = self.gen
+            self.gen, self.pending_events, self.rotated = gen + 1, 0, []
+        try:
+            first_gen, offset, entries = self._read_index()
+            for g in range(first_gen, gen + 1):
+                for event in self._read_log(g, offset if g == first_gen else 0):
+                    self._apply(entries, event)
+            now = time.time()
+            rows = sorted(entries.items(), key=lambda kv: self._decayed(kv[1], now), reverse=True)
+
+            tmp = self.index_path + ".tmp"
+            with open(tmp, 'w', encoding="utf-8") as f:
+                f.write(json.dumps({"gen": gen + 1, "offset": 0}) + "\n")
+                for name, entry in rows:
+                    f.write(json.dumps(dict(entry, game=name), separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.index_path)
+
+            with self.lock:
+                for event in self.rotated:
+                    self._apply(entries, event)
+                self.offset, self.entries = 0, entries
+            for g in range(first_gen, gen + 1):
+                try: os.remove(self.log_path(g))
+                except OSError: pass
+        finally:
+            with self.lock:
+                self.compacting, self.rotated = False, None
+
+# --- MONITOR RESOURCE PROSES ---
+def list_processes():
+    """Daftar (pid, ppid, nama) semua proses. Linux via /proc, Windows via Toolhelp32."""
+    procs = []
+    if os.name == 'nt':
+        from ctypes import wintypes
+
+        class PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [("dwSize", wintypes.DWORD), ("cntUsage", wintypes.DWORD),
+                        ("th32ProcessID", wintypes.DWORD), ("th32DefaultHeapID", ctypes.c_void_p),
+                        ("th32ModuleID", wintypes.DWORD), ("cntThreads", wintypes.DWORD),
+                        ("th32ParentProcessID", wintypes.DWORD), ("pcPriClassBase", ctypes.c_long),
+                        ("dwFlags", wintypes.DWORD), ("szExeFile", ctypes.c_wchar * 260)]
+
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        TH32CS_SNAPPROCESS = 0x00000002
+        snap = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if snap in (None, wintypes.HANDLE(-1).value):
+            return procs
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            ok = kernel32.Process32FirstW(snap, ctypes.byref(entry))
+            while ok:
+                procs.append((entry.th32ProcessID, entry.th32ParentProcessID, entry.szExeFile))
+                ok = kernel32.Process32NextW(snap, ctypes.byref(entry))
+        finally:
+            kernel32.CloseHandle(snap)
+    elif os.path.isdir("/proc"):
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit(): continue
+            try:
+                with open(f"/proc/{entry}/stat", "rb") as f:
+                    stat = f.read().decode(errors="replace")
+                # Format: pid (comm) state ppid ... ; comm bisa mengandung spasi/kurung
+                name = stat[stat.index("(") + 1:stat.rindex(")")]
+                ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+                procs.append((int(entry), ppid, name))
+            except (OSError, ValueError):
+                continue
+    return procs
+
+def _single_process_usage(pid):
+    """(rss_bytes, cpu_seconds) untuk satu PID, atau None jika tidak bisa dibaca"""
+    if os.name == 'nt':
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        kernel32 = ctypes.windll.kernel32
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return None
+            creation, exit_, kernel, user = (wintypes.FILETIME() for _ in range(4))
+            kernel32.GetProcessTimes(handle, ctypes.byref(creation), ctypes.byref(exit_),
+                                     ctypes.byref(kernel), ctypes.byref(user))
+            ticks = sum((t.dwHighDateTime << 32) | t.dwLowDateTime for t in (kernel, user))
+            return counters.WorkingSetSize, ticks / 1e7 # FILETIME = 100ns
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            rss_pages = int(f.read().split()[1])
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read().decode(errors="replace")
+        fields = stat[stat.rindex(")") + 2:].split()
+        clk = os.sysconf("SC_CLK_TCK")
+        # utime & stime = field ke-14 & ke-15 (index 11 & 12 setelah comm)
+        cpu = (int(fields[11]) + int(fields[12])) / clk
+        return rss_pages * os.sysconf("SC_PAGE_SIZE"), cpu
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+def process_children():
+    """Tabel ppid -> [pid anak] dari satu kali enumerasi proses"""
+    children = {}
+    for cpid, ppid, _ in list_processes():
+        children.setdefault(ppid, []).append(cpid)
+    return children
+
+def process_usage(pid, children=None):
+    """
+    Total RSS & CPU untuk PID beserta seluruh anaknya.
+    Pada build PyInstaller one-file, PID Popen hanyalah bootloader; payload Python ada di child-nya.
+    Untuk banyak PID sekaligus, berikan `children` dari process_children() agar /proc cukup dipindai sekali.
+    """
+    tree = {pid}
+    if children is None:
+        children = process_children()
+    stack = [pid]
+    while stack:
+        for cpid in children.get(stack.pop(), []):
+            if cpid not in tree:
+                tree.add(cpid)
+                stack.append(cpid)
+
+    rss, cpu, found = 0, 0.0, False
+    for p in tree:
+        usage = _single_process_usage(p)
+        if usage:
+            rss += usage[0]
+            cpu += usage[1]
+            found = True
+    return (rss, cpu) if found else None
+
+def format_bytes(num):
+    for unit in ("B", "KB", "MB", "GB"):
+        if num < 1024 or unit == "GB":
+            return f"{num:.1f} {unit}" if unit != "B" else f"{int(num)} B"
+        num /= 1024
+
+def dummy_command(exe_path, window=False, ready=False, watch_parent=False, name=None):
+    """Command line untuk menjalankan dummy dari exe_path (frozen atau mode script)"""
+    if getattr(sys, 'frozen', False):
+        # MODE EXE (Compiled): tidak bisa pakai -c, gunakan argumen khusus --dummy-mode
+        cmd = [exe_path, "--dummy-mode"]
+    else:
+        # MODE SCRIPT (Development): exe_path adalah copy python.exe, sertakan script ini sendiri
+        cmd = [exe_path, os.path.abspath(__file__), "--dummy-mode"]
+    if window:
+        cmd.append("--dummy-window")
+    if ready:
+        cmd.append("--dummy-ready")
+    if watch_parent:
+        cmd.append("--dummy-watch-parent")
+    if name:
+        cmd += ["--dummy-name", name]
+    return cmd
+
+def measure_dummy_footprint(settle=1.5):
+    """
+    Jalankan dummy headless & dummy window berdampingan lalu cetak RSS/CPU masing-masing.
+    Dipakai lewat: discordGS.py --measure-dummy
+    """
+    results = {}
+    for label, window in (("headless", False), ("window", True)):
+        proc = subprocess.Popen(dummy_command(sys.executable, window=window),
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        time.sleep(settle)
+        usage = process_usage(proc.pid) if proc.poll() is None else None
+        proc.terminate()
+        try: proc.wait(timeout=5)
+        except subprocess.TimeoutExpired: proc.kill()
+        results[label] = usage
+        if usage:
+            print(f"{label:>8}: RSS {format_bytes(usage[0])}, CPU {usage[1]:.2f}s")
+        else:
+            print(f"{label:>8}: tidak dapat diukur (proses keluar lebih awal?)")
+    return results
+
+# --- CACHE EXECUTABLE GAME (CONTENT-ADDRESSED) ---
+def _reflink(src, dst):
+    """Copy-on-write clone (Linux FICLONE: btrfs/xfs). Raise OSError jika tidak didukung."""
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflink not supported")
+    import fcntl
+    FICLONE = 0x40049409
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+
+class ArtifactCache:
+    """
+    Cache persisten executable game yang sudah disiapkan.
+    Entry disimpan di <root>/<hash source>/<nama game>, jadi dipakai ulang lintas launch & sesi,
+    dan otomatis tidak valid lagi jika executable sumber berubah (versi baru).
+    """
+    INDEX_NAME = "index.json"
+
+    def __init__(self, root, source=None, budget_bytes=None, max_entries=None):
+        self.root = root
+        # realpath: os.link pada symlink (mis. python venv/pyenv) akan me-link symlink-nya, bukan binary
+        self.source = os.path.realpath(source or sys.executable)
+        self.budget_bytes = budget_bytes if budget_bytes is not None else int(CONFIG["cache_budget_mb"]) * 1024 * 1024
+        self.max_entries = int(CONFIG["cache_max_entries"] if max_entries is None else max_entries)
+        self.lock = threading.Lock()
+        # Statistik sesi ini
+        self.hits = 0
+        self.misses = 0
+        self.bytes_copied = 0
+        self.bytes_saved = 0
+        self._index = None
+
+    @property
+    def index(self):
+        # Index baru dibaca saat pertama kali dibutuhkan (bukan saat app startup)
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.root, self.INDEX_NAME), 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                data.setdefault("entries", {})
+                data.setdefault("sources", {})
+                data.setdefault("totals", {"hits": 0, "misses": 0, "bytes_saved": 0})
+                return data
+        except (OSError, ValueError):
+            pass
+        return {"entries": {}, "sources": {}, "totals": {"hits": 0, "misses": 0, "bytes_saved": 0}}
+
+    def _save_index(self):
+        path = os.path.join(self.root, self.INDEX_NAME)
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(self.index, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def source_digest(self):
+        """SHA-256 executable sumber; di-cache per (size, mtime) agar tidak di-hash tiap launch"""
+        st = os.stat(self.source)
+        stamp = [st.st_size, st.st_mtime_ns]
+        known = self.index["sources"].get(self.source)
+        if known and known[:2] == stamp:
+            return known[2]
+
+        import hashlib
+        h = hashlib.sha256()
+        with open(self.source, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self.index["sources"][self.source] = stamp + [digest]
+        return digest
+
+    def owns(self, path):
+        """True jika path adalah entry cache (jangan dihapus saat cleanup)"""
+        root = os.path.abspath(self.root)
+        return os.path.abspath(path).startswith(root + os.sep)
+
+    def prepare(self, game_name):
+        """Kembalikan path executable bernama game_name, membuatnya hanya jika belum ada di cache"""
+        with self.lock:
+            digest = self.source_digest()[:16]
+            filename = safe_exe_filename(game_name)
+            key = f"{digest}/{filename}"
+            path = os.path.join(self.root, digest, filename)
+            size = os.path.getsize(self.source)
+
+            entry = self.index["entries"].get(key)
+            if entry and os.path.isfile(path) and os.path.getsize(path) == size:
+                self.hits += 1
+                self.bytes_saved += size
+                self.index["totals"]["hits"] += 1
+                self.index["totals"]["bytes_saved"] += size
+                entry["last_used"] = time.time()
+            else:
+                self.misses += 1
+                self.index["totals"]["misses"] += 1
+                method = self._materialize(path, size)
+                # Pemakaian disk dihitung sekali saat entry dibuat, bukan stat semua entry tiap launch
+                self.index["entries"][key] = {"last_used": time.time(), "method": method, "size": size,
+                                              "disk": self.disk_usage(key)}
+                self.evict(protect={key})
+            self._save_index()
+            return path
+
+    def _materialize(self, path, size):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".part"
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+
+        # Urutan: hardlink (0 byte) -> [Linux] symlink -> reflink (CoW) -> copy biasa
+        try:
+            os.link(self.source, tmp)
+            method = "hardlink"
+        except (OSError, AttributeError):
+            try:
+                if not sys.platform.startswith("linux"):
+                    raise OSError("symlink launcher is Linux-only")
+                # Beda filesystem: kernel mengambil comm & argv[0] dari nama symlink, dan semua dummy
+                # berbagi page cache binary yang sama. Hanya /proc/<pid>/exe yang menunjuk ke binary asli.
+                # (Windows memakai nama image target symlink, jadi di sana tetap reflink/copy.)
+                os.symlink(self.source, tmp)
+                method = "symlink"
+            except OSError:
+                try:
+                    _reflink(self.source, tmp)
+                    method = "reflink"
+                except OSError:
+                    if os.path.lexists(tmp):
+                        os.remove(tmp)
+                    shutil.copy2(self.source, tmp)
+                    method = "copy"
+
+        if method == "copy":
+            self.bytes_copied += size
+        else:
+            self.bytes_saved += size
+            self.index["totals"]["bytes_saved"] += size
+        os.replace(tmp, path)
+        return method
+
+    def disk_usage(self, key):
+        """Byte yang benar-benar dipakai entry (hardlink ke source = 0 byte tambahan)"""
+        path = os.path.join(self.root, *key.split("/", 1))
+        try:
+            st = os.stat(path)
+            src = os.stat(self.source)
+        except OSError:
+            return 0
+        if (st.st_dev, st.st_ino) == (src.st_dev, src.st_ino):
+            return 0
+        return st.st_size
+
+    def _entry_disk(self, key):
+        entry = self.index["entries"][key]
+        if "disk" not in entry: # Index lama sebelum pemakaian disk disimpan per entry
+            entry["disk"] = self.disk_usage(key)
+        return entry["disk"]
+
+    def evict(self, protect=()):
+        """Hapus entry yang paling lama tidak dipakai sampai total di bawah budget & jumlah entry di bawah batas"""
+        entries = self.index["entries"]
+        total = sum(self._entry_disk(key) for key in entries)
+        for key in sorted(entries, key=lambda k: entries[k].get("last_used", 0)):
+            over_count = len(entries) > self.max_entries
+            if total <= self.budget_bytes and not over_count:
+                break
+            usage = entries[key]["disk"]
+            if key in protect or not (usage or over_count):
+                continue # Entry 0 byte hanya dihapus demi batas jumlah
+            path = os.path.join(self.root, *key.split("/", 1))
+            try:
+                if os.path.lexists(path):
+                    os.remove(path)
+                if not os.listdir(os.path.dirname(path)):
+                    os.rmdir(os.path.dirname(path))
+            except OSError:
+                continue # Masih dipakai (Windows mengunci exe yang sedang jalan)
+            total -= usage
+            del entries[key]
+
+    def stats(self):
+        totals = self.index["totals"]
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "bytes_copied": self.bytes_copied, "bytes_saved": self.bytes_saved,
+            "total_hits": totals["hits"], "total_misses": totals["misses"],
+            "total_bytes_saved": totals["bytes_saved"],
+            "entries": len(self.index["entries"]),
+            "disk_bytes": sum(self._entry_disk(k) for k in self.index["entries"]),
+        }
+
+def print_cache_stats():
+    """discordGS.py --cache-stats"""
+    cache = ArtifactCache(os.path.join(user_data_dir(), "artifacts"))
+    stats = cache.stats()
+    print(f"Cache     : {cache.root}")
+    print(f"Entries   : {stats['entries']} ({format_bytes(stats['disk_bytes'])} on disk, budget {format_bytes(cache.budget_bytes)})")
+    print(f"Hits/miss : {stats['total_hits']}/{stats['total_misses']}")
+    print(f"Saved     : {format_bytes(stats['total_bytes_saved'])}")
+
+# --- MANAJER SESI (BANYAK GAME SEKALIGUS) ---
+def safe_exe_filename(game_name):
+    """
+    Nama file executable untuk game_name: karakter pemisah path (dan karakter terlarang di Windows)
+    diganti '_', sehingga nama seperti 'a/b.exe' atau '..' tidak keluar dari folder cache.
+    Spasi & unicode dipertahankan karena Discord mencocokkan nama proses apa adanya.
+    """
+    forbidden = '<>:"/\\|?*' if os.name == 'nt' else "/"
+    name = "".join("_" if ch in forbidden or ord(ch) < 32 else ch for ch in game_name)
+    return "_" + name if name in (".", "..") else name
+
+def normalize_game_name(text):
+    name = text.strip()
+    if name and not name.endswith(".exe"): name += ".exe"
+    return name
+
+def parse_game_list(text):
+    """'Valorant, destiny2.exe' -> ['Valorant.exe', 'destiny2.exe'] (unik, urutan dipertahankan)"""
+    names = []
+    for part in text.replace(";", ",").split(","):
+        name = normalize_game_name(part)
+        if name and name not in names:
+            names.append(name)
+    return names
+
+def kill_process_tree(proc):
+    """
+    Gunakan TASKKILL untuk mematikan tree process secara paksa di Windows.
+    Ini mengatasi masalah pada PyInstaller one-file dimana child process (Python payload)
+    tidak ikut mati saat terminate() dipanggil pada parent (Bootloader).
+    """
+    try:
+        if os.name == 'nt':
+            # /F = Force, /T = Tree (Kill children), /PID = Process ID
+            # Gunakan creationflags=0x08000000 untuk menyembunyikan console window taskkill
+            subprocess.call(
+                ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                stdout=subprocess.DEVNULL, 
+                stderr=subprocess.DEVNULL,
+                creationflags=0x08000000
+            )
+        else:
+            proc.terminate()
+    except Exception:
+        # Fallback jika taskkill gagal
+        try: proc.terminate() 
+        except: pass
+
+def kill_pid_tree(pid):
+    """Seperti kill_process_tree, tapi untuk proses yang bukan child kita (hanya PID yang diketahui)"""
+    try:
+        if os.name == 'nt':
+            subprocess.call(["taskkill", "/F", "/T", "/PID", str(pid)],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=0x08000000)
+        else:
+            import signal
+            os.kill(pid, signal.SIGTERM)
+    except Exception:
+        pass
+
+def percentile(values, q):
+    """Percentile sederhana (nearest-rank) tanpa numpy"""
+    if not values: return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+class LatencyRecorder:
+    """
+    Kumpulan sampel latensi (detik) per jenis, mis. launch_cold / launch_warm / teardown.
+    Sampel mentah dibatasi (untuk percentile); histogram bucket kumulatif untuk export Prometheus.
+    """
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    MAX_SAMPLES = 1000
+
+    def __init__(self):
+        self.samples = {}
+        self.histograms = {} # jenis -> [count per bucket (+Inf terakhir), sum]
+        self.lock = threading.Lock()
+
+    def record(self, kind, seconds):
+        with self.lock:
+            self.samples.setdefault(kind, collections.deque(maxlen=self.MAX_SAMPLES)).append(seconds)
+            hist = self.histograms.setdefault(kind, [[0] * (len(self.BUCKETS) + 1), 0.0])
+            for i, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    hist[0][i] += 1
+                    break
+            else:
+                hist[0][-1] += 1
+            hist[1] += seconds
+
+    def histogram(self, kind):
+        """Return ([(batas, jumlah kumulatif)], count, sum) seperti format histogram Prometheus"""
+        with self.lock:
+            counts, total = self.histograms.get(kind, [[0] * (len(self.BUCKETS) + 1), 0.0])
+            counts = list(counts)
+        cumulative, running = [], 0
+        for bound, n in zip(self.BUCKETS + (float("inf"),), counts):
+            running += n
+            cumulative.append((bound, running))
+        return cumulative, running, total
+
+    def kinds(self):
+        with self.lock:
+            return list(self.histograms)
+
+    def summary(self, kind):
+        with self.lock:
+            values = list(self.samples.get(kind, []))
+        return {"count": len(values), "p50": percentile(values, 50),
+                "p95": percentile(values, 95), "max": max(values) if values else None}
+
+class Session:
+    """Satu dummy game yang sedang berjalan beserta state & pemakaian resource-nya"""
+    def __init__(self, name, exe_path, process, state="running"):
+        self.name = name
+        self.exe_path = exe_path
+        self.process = process
+        self.state = state
+        self.started_at = time.time()
+        self.ready_at = None
+        self.ready = threading.Event()
+        self.warm = False # True jika diambil dari DummyPool
+        self.usage = None # (rss_bytes, cpu_seconds)
+        self.policy_problems = [] # Policy resource yang tidak berlaku (hasil verify)
+        self.exit_code = None
+        self.ended_at = None
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def uptime(self):
+        return (self.ended_at or time.time()) - self.started_at
+
+    def wait_ready(self, timeout=None):
+        return self.ready.wait(timeout)
+
+class ProcessRegistry:
+    """
+    Daftar PID dummy & path executable milik controller ini, disimpan di <data>/sessions/<pid>.json.
+    Jika controller crash, on_close tidak pernah jalan; file ini yang dipakai reap_orphans()
+    di startup berikutnya untuk mematikan sisa dummy & menghapus file temp-nya.
+    """
+    def __init__(self, root):
+        self.dir = os.path.join(root, "sessions")
+        self.path = os.path.join(self.dir, f"{os.getpid()}.json")
+        self.lock = threading.Lock()
+        self.dummies = {} # pid -> {"name", "exe", "cached"}
+
+    def add(self, session, cached):
+        with self.lock:
+            self.dummies[session.pid] = {"name": session.name, "exe": session.exe_path, "cached": cached}
+            self._save()
+
+    def remove(self, session):
+        with self.lock:
+            if self.dummies.pop(session.pid, None) is not None:
+                self._save()
+
+    def _save(self):
+        try:
+            if not self.dummies:
+                os.remove(self.path)
+                return
+            os.makedirs(self.dir, exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, 'w') as f:
+                json.dump({"pid": os.getpid(), "dummies": self.dummies}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+def process_name_matches(proc_name, game_name):
+    # Nama proses dummy = nama file-nya (safe_exe_filename); Windows case-insensitive
+    name = safe_exe_filename(game_name)
+    if os.name == 'nt':
+        return proc_name.lower() == name.lower()
+    # comm dipotong kernel jadi 15 *byte* lalu di-decode list_processes dengan errors="replace";
+    # potong & decode nama game dengan cara yang sama agar nama non-ASCII tetap cocok
+    return proc_name == name.encode("utf-8")[:15].decode(errors="replace")
+
+def reap_orphans(root=None):
+    """
+    Matikan dummy yang ditinggalkan controller yang sudah mati & hapus executable temp-nya.
+    Hanya PID yang namanya masih cocok dengan nama game yang dibunuh (PID bisa dipakai ulang OS).
+    Return jumlah dummy yang dimatikan.
+    """
+    folder = os.path.join(root or user_data_dir(), "sessions")
+    try:
+        files = [f for f in os.listdir(folder) if f.endswith(".json")]
+    except OSError:
+        return 0
+    procs = {pid: name for pid, _, name in list_processes()}
+    killed = 0
+    for filename in files:
+        path = os.path.join(folder, filename)
+        try:
+            owner = int(filename[:-5])
+            with open(path, 'r') as f:
+                dummies = json.load(f).get("dummies", {})
+        except (OSError, ValueError, AttributeError):
+            continue
+        if owner == os.getpid() or owner in procs:
+            continue # Controller masih hidup (GUI lain / daemon)
+        for pid, info in dummies.items():
+            pid = int(pid)
+            if pid in procs and process_name_matches(procs[pid], info["name"]):
+                kill_pid_tree(pid)
+                killed += 1
+            if info.get("cached") or not info.get("exe"):
+                continue # Entry ArtifactCache dipakai ulang, bukan sampah
+            for _ in range(3):
+                try:
+                    os.remove(info["exe"])
+                    break
+                except FileNotFoundError:
+                    break
+                except OSError:
+                    time.sleep(0.5) # Windows: file masih terkunci sampai proses benar-benar mati
+        try: os.remove(path)
+        except OSError: pass
+    return killed
+
+class ResourcePolicy:
+    """
+    Batas resource per dummy dari config: prioritas (dummy_nice), pin core (dummy_cpus),
+    batas memori (dummy_memory_mb). Diterapkan controller ke PID begitu Popen return, dan di POSIX
+    juga oleh dummy sendiri lewat env DGS_RESOURCE_POLICY (mencakup payload PyInstaller one-file
+    yang PID-nya tidak kita pegang). verify() membaca ulang nilainya setelah dummy ready.
+    Windows: priority class lewat creationflags, affinity mask, dan job object untuk batas memori.
+    """
+    def __init__(self, nice=None, cpus=None, memory_mb=None):
+        self.nice = int(CONFIG["dummy_nice"] if nice is None else nice)
+        cpus = CONFIG["dummy_cpus"] if cpus is None else cpus
+        self.cpus = sorted({int(c) for c in cpus if 0 <= int(c) < (os.cpu_count() or 1)})
+        self.memory_mb = int(CONFIG["dummy_memory_mb"] if memory_mb is None else memory_mb)
+        self.job = None # Windows job object (dibuat saat pertama dibutuhkan)
+
+    @property
+    def memory_bytes(self):
+        return self.memory_mb * 1024 * 1024
+
+    def env(self):
+        """Environment untuk Popen (None = warisi environment controller apa adanya)"""
+        if os.name == 'nt' or not (self.nice or self.cpus or self.memory_mb):
+            return None
+        env = dict(os.environ)
+        env[RESOURCE_POLICY_ENV] = f"nice={self.nice};cpus={','.join(map(str, self.cpus))};memory_mb={self.memory_mb}"
+        return env
+
+    def creationflags(self):
+        if os.name != 'nt' or self.nice <= 0:
+            return 0
+        # IDLE_PRIORITY_CLASS untuk nice tinggi, BELOW_NORMAL_PRIORITY_CLASS untuk sisanya
+        return 0x00000040 if self.nice >= 10 else 0x00004000
+
+    def apply(self, process):
+        """Terapkan policy ke proses yang baru di-spawn, return daftar error"""
+        errors = []
+        if os.name == 'nt':
+            if self.cpus or self.memory_mb:
+                errors += self._apply_windows(process)
+            return errors
+        pid = process.pid
+        if self.nice:
+            try: os.setpriority(os.PRIO_PROCESS, pid, self.nice)
+            except OSError as e: errors.append(f"nice: {e}")
+        if self.cpus and hasattr(os, "sched_setaffinity"):
+            try: os.sched_setaffinity(pid, self.cpus)
+            except OSError as e: errors.append(f"affinity: {e}")
+        if self.memory_mb:
+            import resource
+            if hasattr(resource, "prlimit"):
+                try: resource.prlimit(pid, resource.RLIMIT_AS, (self.memory_bytes, self.memory_bytes))
+                except (OSError, ValueError) as e: errors.append(f"memory: {e}")
+        return errors
+
+    def _apply_windows(self, process):
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        errors = []
+        handle = int(process._handle)
+        if self.cpus and not kernel32.SetProcessAffinityMask(handle, ctypes.c_size_t(sum(1 << c for c in self.cpus))):
+            errors.append(f"affinity: error {kernel32.GetLastError()}")
+        if self.memory_mb:
+            job = self._windows_job()
+            if not job or not kernel32.AssignProcessToJobObject(wintypes.HANDLE(job), handle):
+                errors.append(f"memory: job object error {kernel32.GetLastError()}")
+        return errors
+
+    def _windows_job(self):
+        """Satu job object untuk semua dummy: batas memori per proses + kill saat controller mati"""
+        if self.job is not None:
+            return self.job
+        from ctypes import wintypes
+
+        class IO_COUNTERS(ctypes.Structure):
+            _fields_ = [(name, ctypes.c_ulonglong) for name in
+                        ("ReadOperationCount", "WriteOperationCount", "OtherOperationCount",
+                         "ReadTransferCount", "WriteTransferCount", "OtherTransferCount")]
+
+        class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+            _fields_ = [("PerProcessUserTimeLimit", ctypes.c_int64), ("PerJobUserTimeLimit", ctypes.c_int64),
+                        ("LimitFlags", wintypes.DWORD), ("MinimumWorkingSetSize", ctypes.c_size_t),
+                        ("MaximumWorkingSetSize", ctypes.c_size_t), ("ActiveProcessLimit", wintypes.DWORD),
+                        ("Affinity", ctypes.c_size_t), ("PriorityClass", wintypes.DWORD),
+                        ("SchedulingClass", wintypes.DWORD)]
+
+        class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+            _fields_ = [("BasicLimitInformation", JOBOBJECT_BASIC_LIMIT_INFORMATION), ("IoInfo", IO_COUNTERS),
+                        ("ProcessMemoryLimit", ctypes.c_size_t), ("JobMemoryLimit", ctypes.c_size_t),
+                        ("PeakProcessMemoryUsed", ctypes.c_size_t), ("PeakJobMemoryUsed", ctypes.c_size_t)]
+
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+        job = kernel32.CreateJobObjectW(None, None)
+        if not job:
+            self.job = 0
+            return self.job
+        info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+        JOB_OBJECT_LIMIT_PROCESS_MEMORY, JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x100, 0x2000
+        info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_PROCESS_MEMORY | JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+        info.ProcessMemoryLimit = self.memory_bytes
+        JobObjectExtendedLimitInformation = 9
+        if not kernel32.SetInformationJobObject(wintypes.HANDLE(job), JobObjectExtendedLimitInformation,
+                                                ctypes.byref(info), ctypes.sizeof(info)):
+            kernel32.CloseHandle(wintypes.HANDLE(job))
+            job = 0
+        self.job = job
+        return self.job
+
+    def verify(self, process):
+        """Baca ulang priority/affinity/limit proses; return daftar policy yang tidak berlaku"""
+        problems = []
+        if os.name == 'nt':
+            from ctypes import wintypes
+            kernel32 = ctypes.windll.kernel32
+            handle = int(process._handle)
+            if self.nice > 0 and kernel32.GetPriorityClass(handle) != self.creationflags():
+                problems.append("priority")
+            if self.cpus:
+                proc_mask, sys_mask = ctypes.c_size_t(), ctypes.c_size_t()
+                kernel32.GetProcessAffinityMask(handle, ctypes.byref(proc_mask), ctypes.byref(sys_mask))
+                if proc_mask.value != sum(1 << c for c in self.cpus):
+                    problems.append("affinity")
+            if self.memory_mb:
+                in_job = wintypes.BOOL()
+                if not self.job or not kernel32.IsProcessInJob(handle, wintypes.HANDLE(self.job), ctypes.byref(in_job)) \
+                        or not in_job.value:
+                    problems.append("memory")
+            return problems
+        pid = process.pid
+        try:
+            if self.nice and os.getpriority(os.PRIO_PROCESS, pid) < self.nice:
+                problems.append("nice")
+            if self.cpus and hasattr(os, "sched_getaffinity") and os.sched_getaffinity(pid) != set(self.cpus):
+                problems.append("affinity")
+            if self.memory_mb:
+                import resource
+                if hasattr(resource, "prlimit") and resource.prlimit(pid, resource.RLIMIT_AS)[0] != self.memory_bytes:
+                    problems.append("memory")
+        except (OSError, ValueError):
+            pass # Dummy sudah keluar
+        return problems
+
+class SessionManager:
+    """Melacak banyak proses dummy sekaligus; satu sesi per nama game"""
+    def __init__(self, artifacts, max_parallel=None, registry=None):
+        self.artifacts = artifacts
+        self.registry = registry # ProcessRegistry opsional (untuk reap setelah crash)
+        self.policy = ResourcePolicy()
+        self.max_parallel = max(1, int(max_parallel or CONFIG["launch_concurrency"]))
+        self.sessions = {}
+        self.lock = threading.Lock()
+        self.latency = LatencyRecorder()
+        self.pool = None # DummyPool opsional
+        self.ended = collections.deque(maxlen=50) # Sesi yang sudah selesai (exit code & uptime)
+        self.on_exit = None # Callback(session) saat dummy keluar sendiri (bukan lewat stop)
+        self.counters = collections.Counter() # launches / launch_failures / unexpected_exits / cleanup_removed
+        self.starting = set() # Nama yang sedang di-spawn (slot sudah dipesan, sesi belum terdaftar)
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def names(self):
+        with self.lock:
+            return list(self.sessions)
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.sessions)
+
+    def prepare(self, game_name):
+        """Ambil executable dari cache (hardlink/reflink/copy hanya saat miss)"""
+        try:
+            return self.artifacts.prepare(game_name)
+        except OSError:
+            # Fallback ke cara lama: copy ke folder temp
+            target_path = os.path.join(tempfile.gettempdir(), safe_exe_filename(game_name))
+            if os.path.exists(target_path):
+                try:
+                    os.remove(target_path)
+                except OSError:
+                    raise RuntimeError("File is locked. Close it in Task Manager.")
+            shutil.copy(sys.executable, target_path)
+            return target_path
+
+    def start_process(self, game_name, state="running", launch_t0=None):
+        """Siapkan executable & jalankan satu dummy (belum didaftarkan sebagai sesi)"""
+        exe_path = self.prepare(game_name)
+
+        # Dummy berjalan headless kecuali app dijalankan dengan --dummy-window.
+        # stdin = pipe heartbeat: dummy keluar sendiri begitu controller mati
+        # --dummy-name memakai nama file yang sama dengan exe_path agar comm hasil prctl cocok dengan file-nya
+        cmd = dummy_command(exe_path, window=DUMMY_WINDOW, ready=True, watch_parent=True,
+                            name=safe_exe_filename(game_name))
+        creation_flags = self.policy.creationflags()
+        if os.name == 'nt':
+            # 0x08000000 = CREATE_NO_WINDOW
+            creation_flags |= 0x08000000
+        try:
+            process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                       creationflags=creation_flags, env=self.policy.env())
+        except Exception:
+            self.cleanup(exe_path)
+            raise
+
+        session = Session(game_name, exe_path, process, state=state)
+        session.policy_problems = self.policy.apply(process)
+        if self.registry:
+            self.registry.add(session, self.artifacts.owns(exe_path))
+        threading.Thread(target=self._watch, args=(session, launch_t0), daemon=True).start()
+        return session
+
+    def _watch(self, session, launch_t0=None):
+        """
+        Satu thread per dummy yang hanya blok (baca pipe ready, lalu waitpid / WaitForSingleObject),
+        jadi tidak ada biaya selama dummy hidup. Begitu dummy mati, sesi langsung diperbarui.
+        """
+        process = session.process
+        try:
+            process.stdout.read(1)
+        except (OSError, ValueError):
+            pass
+        finally:
+            session.ready_at = time.time()
+            session.ready.set()
+            try: process.stdout.close()
+            except OSError: pass
+        if launch_t0 is not None and process.poll() is None:
+            self.latency.record("launch_cold", time.perf_counter() - launch_t0)
+        if process.poll() is None:
+            # Dummy menerapkan policy sendiri sebelum ready, jadi baca ulang di sini
+            problems = self.policy.verify(process)
+            if problems:
+                session.policy_problems = problems
+                self.counters["policy_failures"] += 1
+            elif session.policy_problems:
+                session.policy_problems = [] # Gagal di controller tapi berhasil di dummy
+
+        session.exit_code = process.wait()
+        session.ended_at = time.time()
+        try: process.stdin.close()
+        except OSError: pass
+        if self.registry:
+            self.registry.remove(session)
+        with self.lock:
+            unexpected = self.sessions.get(session.name) is session
+            if unexpected:
+                del self.sessions[session.name]
+        if unexpected:
+            # Dummy keluar sendiri / window-nya ditutup user
+            self.counters["unexpected_exits"] += 1
+            session.state = "exited"
+            self.cleanup(session.exe_path)
+        if session.state != "standby":
+            self.ended.append(session)
+        if unexpected and self.on_exit:
+            self.on_exit(session)
+
+    def spawn(self, game_name):
+        # Pesan slot nama di bawah lock agar spawn paralel untuk nama yang sama (client daemon,
+        # batch) tidak menjalankan dua dummy lalu saling menimpa di self.sessions
+        with self.lock:
+            if game_name in self.sessions or game_name in self.starting:
+                raise RuntimeError(f"{game_name} is already running.")
+            self.starting.add(game_name)
+        t0 = time.perf_counter()
+
+        try:
+            session = self.pool.acquire(game_name) if self.pool else None
+            if session:
+                # Worker warm sudah siap: latensi = waktu hand-off saja
+                self.latency.record("launch_warm", time.perf_counter() - t0)
+            else:
+                session = self.start_process(game_name, launch_t0=t0)
+        except Exception:
+            with self.lock:
+                self.starting.discard(game_name)
+                self.counters["launch_failures"] += 1
+            raise
+
+        with self.lock:
+            self.starting.discard(game_name)
+            self.sessions[game_name] = session
+            self.counters["launches"] += 1
+        return session
+
+    def launch_many(self, names):
+        """Launch batch secara paralel (maksimal max_parallel sekaligus). Return (sessions, errors)."""
+        from concurrent.futures import ThreadPoolExecutor
+        names = list(dict.fromkeys(names)) # Nama ganda cukup sekali
+        started, errors = [], {}
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, max(1, len(names)))) as pool:
+            futures = {name: pool.submit(self.spawn, name) for name in names}
+            for name, future in futures.items():
+                try:
+                    started.append(future.result())
+                except Exception as e:
+                    errors[name] = str(e)
+        return started, errors
+
+    def stop(self, game_name):
+        if self.pool:
+            self.pool.discard([game_name]) # Worker standby bernama sama tetap terlihat "playing"
+        with self.lock:
+            session = self.sessions.pop(game_name, None)
+        if not session: return None
+        t0 = time.perf_counter()
+        session.state = "stopping"
+        kill_process_tree(session.process)
+        try: session.exit_code = session.process.wait(timeout=2) # Reap agar tidak jadi zombie
+        except subprocess.TimeoutExpired: pass
+        self.cleanup(session.exe_path)
+        session.state = "stopped"
+        self.latency.record("teardown", time.perf_counter() - t0)
+        return session
+
+    def stop_all(self):
+        for name in self.names():
+            self.stop(name)
+        if self.pool:
+            self.pool.discard()
+
+    def shutdown(self):
+        """Stop semua sesi & matikan worker pool (dipanggil saat app ditutup)"""
+        self.stop_all()
+        if self.pool:
+            self.pool.shutdown()
+
+    def discard_process(self, session):
+        """Matikan proses yang bukan sesi aktif (mis. worker pool yang kedaluwarsa)"""
+        kill_process_tree(session.process)
+        try: session.process.wait(timeout=2)
+        except subprocess.TimeoutExpired: pass
+        self.cleanup(session.exe_path)
+
+    def cleanup(self, exe_path):
+        # Entry cache sengaja dipertahankan untuk launch berikutnya
+        if not exe_path or self.artifacts.owns(exe_path):
+            return
+        if os.path.exists(exe_path):
+            t0 = time.perf_counter()
+            for _ in range(3):
+                try:
+                    os.remove(exe_path)
+                    self.counters["cleanup_removed"] += 1
+                    break
+                except OSError: time.sleep(0.5)
+            self.latency.record("cleanup", time.perf_counter() - t0)
+
+    def sample_usage(self):
+        with self.lock:
+            sessions = list(self.sessions.values())
+        if not sessions:
+            return sessions
+        children = process_children() # Sekali per sampel, bukan sekali per sesi
+        for session in sessions:
+            session.usage = process_usage(session.pid, children)
+        return sessions
+
+class DummyPool:
+    """
+    Pool dummy yang sudah di-start lebih dulu (warm) per nama game.
+    Launch cukup mengambil worker yang sudah siap, tanpa menunggu startup interpreter / unpack PyInstaller.
+    Catatan: worker standby sudah terlihat sebagai proses game oleh Discord (nama image di Windows,
+    argv[0] & /proc/<pid>/exe di Linux mengikuti nama file, jadi tidak bisa di-rename saat hand-off).
+    Karena itu pool hanya diisi untuk nama di config "pool_games", tidak diisi ulang setelah acquire,
+    worker-nya dimatikan saat game itu di-stop (atau STOP ALL) dan yang menganggur setelah idle_timeout.
+    """
+    def __init__(self, manager, size=None, idle_timeout=None):
+        self.manager = manager
+        self.size = int(CONFIG["pool_size"] if size is None else size)
+        self.idle_timeout = float(CONFIG["pool_idle_timeout"] if idle_timeout is None else idle_timeout)
+        self.idle = {} # nama -> [Session standby]
+        self.pending = collections.Counter() # nama -> jumlah start yang sedang berjalan (belum masuk idle)
+        self.generation = collections.Counter() # nama -> naik tiap discard; start yang lebih lama dibuang
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.closed = False
+        self.reaper = threading.Thread(target=self._reap_loop, daemon=True)
+        self.reaper.start()
+
+    def warm(self, names):
+        """Isi pool sampai `size` worker per nama (di background thread)"""
+        for name in names:
+            threading.Thread(target=self._fill, args=(name,), daemon=True).start()
+
+    def _fill(self, name):
+        while not self.closed:
+            with self.lock:
+                # Hitung juga start yang sedang berjalan agar warm() beruntun tidak mengisi lebih dari size
+                if len(self.idle.get(name, [])) + self.pending[name] >= self.size:
+                    return
+                self.pending[name] += 1
+                generation = self.generation[name]
+            try:
+                session = self.manager.start_process(name, state="standby")
+            except Exception:
+                with self.lock:
+                    self.pending[name] -= 1
+                return
+            session.warm = True
+            with self.lock:
+                self.pending[name] -= 1
+                closed = self.closed or self.generation[name] != generation
+                if not closed:
+                    self.idle.setdefault(name, []).append(session)
+            if closed:
+                self.manager.discard_process(session) # Pool shutdown / nama ini di-stop saat worker ini start
+                return
+            self.wakeup.set()
+
+    def acquire(self, name):
+        """Ambil worker warm yang sudah siap & masih hidup (tidak diisi ulang, lihat docstring kelas)"""
+        session, dead = None, []
+        with self.lock:
+            workers = self.idle.get(name, [])
+            while workers and not session:
+                worker = workers.pop(0)
+                if worker.ready.is_set() and worker.process.poll() is None:
+                    session = worker
+                else:
+                    dead.append(worker)
+        for worker in dead:
+            self.manager.discard_process(worker)
+        if not session:
+            return None
+        session.state = "running"
+        session.started_at = time.time()
+        return session
+
+    def discard(self, names=None):
+        """Matikan worker standby untuk `names` (None = semua), termasuk yang masih dalam proses start"""
+        with self.lock:
+            names = list(set(self.idle) | set(self.pending)) if names is None else names
+            parked = []
+            for name in names:
+                self.generation[name] += 1
+                parked += self.idle.pop(name, [])
+        for session in parked:
+            self.manager.discard_process(session)
+
+    def _reap_loop(self):
+        # Tidur sampai worker idle paling tua kedaluwarsa (tidak ada wakeup jika pool kosong)
+        while not self.closed:
+            with self.lock:
+                parked = [s for workers in self.idle.values() for s in workers]
+            timeout = None
+            if parked:
+                timeout = max(0, min(s.started_at for s in parked) + self.idle_timeout - time.time())
+            self.wakeup.wait(timeout)
+            self.wakeup.clear()
+
+            now = time.time()
+            with self.lock:
+                expired = [s for workers in self.idle.values() for s in workers
+                           if now - s.started_at >= self.idle_timeout]
+                for workers in self.idle.values():
+                    workers[:] = [s for s in workers if s not in expired]
+            for session in expired:
+                self.manager.discard_process(session)
+
+    def shutdown(self):
+        self.closed = True
+        self.wakeup.set()
+        with self.lock:
+            parked = [s for workers in self.idle.values() for s in workers]
+            self.idle.clear()
+        for session in parked:
+            self.manager.discard_process(session)
+
+class LifecycleWorker:
+    """
+    Menjalankan lifecycle proses dummy (prepare, spawn, kill, hapus file temp) di thread pool,
+    supaya thread Tk tidak pernah freeze. Hasil dikirim balik lewat `post(callback, *args)`.
+    Job untuk nama game yang sama dijalankan berurutan: launch yang datang saat teardown masih
+    berjalan akan antri di belakangnya, dan job identik yang masih antri digabung (coalesce).
+    """
+    def __init__(self, manager, post, max_workers=None):
+        from concurrent.futures import ThreadPoolExecutor
+        self.manager = manager
+        self.post = post
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or manager.max_parallel,
+                                           thread_name_prefix="lifecycle")
+        self.lock = threading.Lock()
+        self.tails = {}  # nama -> Future job terakhir untuk nama tsb
+        self.queued = {} # nama -> aksi terakhir yang masih antri (belum mulai)
+
+    def launch(self, name, on_done):
+        return self._submit("launch", name, self.manager.spawn, on_done)
+
+    def stop(self, name, on_done):
+        return self._submit("stop", name, self.manager.stop, on_done)
+
+    def _submit(self, action, name, fn, on_done):
+        with self.lock:
+            if self.queued.get(name) == action:
+                return False # Sudah ada job yang sama di antrian
+            self.queued[name] = action
+            prev = self.tails.get(name)
+            job = self.tails[name] = self.executor.submit(self._run, prev, action, name, fn, on_done)
+        # Di luar lock: callback langsung dijalankan di thread ini jika job sudah selesai
+        job.add_done_callback(lambda future: self._prune(name, future))
+        return True
+
+    def _prune(self, name, future):
+        """Lupakan job yang sudah selesai jika masih jadi ekor antrian nama tsb (tails tidak tumbuh terus)"""
+        with self.lock:
+            if self.tails.get(name) is future:
+                del self.tails[name]
+
+    def _run(self, prev, action, name, fn, on_done):
+        if prev:
+            try: prev.result()
+            except Exception: pass
+        with self.lock:
+            if self.queued.get(name) == action:
+                del self.queued[name]
+        result, error = None, None
+        try:
+            result = fn(name)
+        except Exception as e:
+            error = str(e)
+        self.post(on_done, name, result, error)
+
+    def busy(self, name):
+        with self.lock:
+            future = self.tails.get(name)
+        return bool(future and not future.done())
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+def local_session_manager(artifacts=None):
+    """SessionManager untuk controller (GUI / daemon / quest): dengan registry PID & reap sisa crash"""
+    root = user_data_dir()
+    artifacts = artifacts or ArtifactCache(os.path.join(root, "artifacts"))
+    threading.Thread(target=reap_orphans, args=(root,), daemon=True).start()
+    return SessionManager(artifacts, registry=ProcessRegistry(root))
+
+def measure_launch_latency(game_name="LatencyProbe.exe", rounds=5):
+    """
+    Bandingkan latensi launch tanpa pool (cold) vs dengan pool (warm).
+    Dipakai lewat: discordGS.py --measure-launch
+    """
+    manager = SessionManager(ArtifactCache(os.path.join(user_data_dir(), "artifacts")))
+    for _ in range(rounds):
+        session = manager.spawn(game_name)
+        session.wait_ready(30)
+        time.sleep(0.05) # Beri waktu thread pencatat latensi
+        manager.stop(game_name)
+
+    manager.pool = DummyPool(manager, size=1, idle_timeout=60)
+    for _ in range(rounds):
+        manager.pool.warm([game_name])
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            with manager.pool.lock:
+                workers = manager.pool.idle.get(game_name, [])
+                if workers and workers[0].ready.is_set(): break
+            time.sleep(0.02)
+        manager.spawn(game_name)
+        manager.stop(game_name)
+    manager.shutdown()
+
+    for kind in ("launch_cold", "launch_warm"):
+        s = manager.latency.summary(kind)
+        if s["count"]:
+            print(f"{kind:>12}: n={s['count']} p50={s['p50'] * 1000:.1f} ms p95={s['p95'] * 1000:.1f} ms")
+
+# --- METRICS (FORMAT TEKS PROMETHEUS) ---
+def _prom_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def render_metrics(manager):
+    """
+    Snapshot metrics SessionManager dalam format teks Prometheus.
+    Pemakaian RSS/CPU diambil dari sampel terakhir (tidak membaca /proc saat di-scrape).
+    """
+    lines = []
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            label_text = ",".join(f'{k}="{_prom_label(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+    latency = manager.latency
+    lines.append("# HELP dgs_latency_seconds Launch/teardown/cleanup latency")
+    lines.append("# TYPE dgs_latency_seconds histogram")
+    for kind in latency.kinds():
+        buckets, count, total = latency.histogram(kind)
+        for bound, n in buckets:
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'dgs_latency_seconds_bucket{{kind="{kind}",le="{le}"}} {n}')
+        lines.append(f'dgs_latency_seconds_sum{{kind="{kind}"}} {total:.6f}')
+        lines.append(f'dgs_latency_seconds_count{{kind="{kind}"}} {count}')
+
+    counters = getattr(manager, "counters", {})
+    for key in ("launches", "launch_failures", "unexpected_exits", "cleanup_removed", "policy_failures"):
+        metric(f"dgs_{key}_total", "counter", key.replace("_", " ").capitalize(), [({}, counters.get(key, 0))])
+
+    artifacts = getattr(manager, "artifacts", None)
+    if artifacts:
+        metric("dgs_artifact_cache_hits_total", "counter", "ArtifactCache hits", [({}, artifacts.hits)])
+        metric("dgs_artifact_cache_misses_total", "counter", "ArtifactCache misses", [({}, artifacts.misses)])
+        metric("dgs_artifact_bytes_copied_total", "counter", "Bytes physically copied for artifacts",
+               [({}, artifacts.bytes_copied)])
+        metric("dgs_artifact_bytes_saved_total", "counter", "Bytes not copied thanks to links/reflinks",
+               [({}, artifacts.bytes_saved)])
+
+    sessions = list(manager.snapshot().values())
+    metric("dgs_sessions", "gauge", "Running dummy sessions", [({}, len(sessions))])
+    with_usage = [s for s in sessions if s.usage]
+    metric("dgs_session_rss_bytes", "gauge", "Resident memory per dummy (process tree)",
+           [({"game": s.name}, s.usage[0]) for s in with_usage])
+    metric("dgs_session_cpu_seconds_total", "counter", "CPU time per dummy (process tree)",
+           [({"game": s.name}, f"{s.usage[1]:.3f}") for s in with_usage])
+    return "\n".join(lines) + "\n"
+
+class MetricsExporter:
+    """
+    Thread sampler tunggal: tiap `interval` detik membaca RSS/CPU semua dummy, lalu menulis
+    file teks (untuk node_exporter textfile collector) dan/atau melayani GET /metrics di localhost.
+    Nonaktif kecuali CONFIG "metrics_file" atau "metrics_port" diisi.
+    """
+    def __init__(self, manager, path=None, port=None, interval=None):
+        self.manager = manager
+        self.path = path if path is not None else CONFIG["metrics_file"]
+        self.port = int(port if port is not None else CONFIG["metrics_port"])
+        self.interval = float(interval or CONFIG["metrics_interval"])
+        self.stopping = threading.Event()
+        self.server = None
+        self.started = False
+
+    @property
+    def enabled(self):
+        return bool(self.path or self.port)
+
+    def start(self):
+        if not self.enabled:
+            return self
+        self.started = True
+        if self.port:
+            self._start_server()
+        threading.Thread(target=self._sample_loop, daemon=True).start()
+        return self
+
+    def _start_server(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = render_metrics(exporter.manager).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            self.server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        except OSError as e:
+            print(f"Metrics endpoint disabled: {e}")
+            return
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _sample_loop(self):
+        while not self.stopping.wait(self.interval):
+            self.manager.sample_usage()
+            if self.path:
+                self.write()
+
+    def write(self):
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, 'w') as f:
+                f.write(render_metrics(self.manager))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def stop(self):
+        self.stopping.set()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+        if self.path and self.started:
+            self.write() # Snapshot terakhir (sesi sudah 0)
+
+def metrics_summary(manager):
+    """Ringkasan satu baris untuk panel stats di GUI"""
+    parts = []
+    for kind, label in (("launch_cold", "cold"), ("launch_warm", "warm"), ("launch_remote", "launch"),
+                        ("teardown", "stop")):
+        s = manager.latency.summary(kind)
+        if s["count"]:
+            parts.append(f"{label} {s['p50'] * 1000:.0f}/{s['p95'] * 1000:.0f} ms")
+    artifacts = getattr(manager, "artifacts", None)
+    if artifacts and (artifacts.hits or artifacts.misses):
+        parts.append(f"cache {artifacts.hits}/{artifacts.hits + artifacts.misses}")
+        parts.append(f"copied {format_bytes(artifacts.bytes_copied)}")
+    return "  ·  ".join(parts)
+
+# --- DAEMON MODE (TANPA GUI) & IPC ---
+def daemon_address():
+    """Unix socket di direktori data user (POSIX) atau named pipe per user (Windows)"""
+    if os.name == 'nt':
+        user = os.environ.get("USERNAME", "user")
+        return rf"\\.\pipe\{APP_DIR_NAME}-{user}"
+    return os.path.join(user_data_dir(), "daemon.sock")
+
+def session_info(session):
+    """Representasi JSON sebuah Session untuk client IPC"""
+    return {
+        "name": session.name, "pid": session.pid, "state": session.state,
+        "started_at": session.started_at, "uptime": round(session.uptime(), 1),
+        "rss": session.usage[0] if session.usage else None,
+        "cpu": session.usage[1] if session.usage else None,
+        "exit_code": session.exit_code,
+        "policy_problems": session.policy_problems,
+    }
+
+class SpooferDaemon:
+    """
+    Pemilik proses dummy tanpa GUI. Menerima request JSON lewat Unix socket / named pipe
+    (framing multiprocessing.connection: send_bytes/recv_bytes), satu thread per client
+    sehingga client yang sedang menunggu stop tidak memblok client lain.
+    Request: {"op": "ping"|"start"|"stop"|"list"|"batch"|"stop_all"|"quest"|"quest_status"|"metrics"|"shutdown", ...}
+    """
+    def __init__(self, address=None):
+        self.address = address or daemon_address()
+        self.manager = local_session_manager()
+        if int(CONFIG["pool_size"]) > 0:
+            self.manager.pool = DummyPool(self.manager)
+            self.manager.pool.warm([normalize_game_name(n) for n in CONFIG["pool_games"]])
+        self.listener = None
+        self.stopping = threading.Event()
+        self.quests = QuestScheduler(self.manager)
+        self.quest_thread = None
+        self.metrics = MetricsExporter(self.manager)
+
+    def run_quests(self):
+        """Jalankan QuestScheduler di thread terpisah (sekali jalan sampai antrian habis)"""
+        if self.quest_thread and self.quest_thread.is_alive():
+            return
+        self.quest_thread = threading.Thread(target=self.quests.run, daemon=True)
+        self.quest_thread.start()
+
+    def serve_forever(self):
+        from multiprocessing.connection import Listener
+        if os.name != 'nt':
+            os.makedirs(os.path.dirname(self.address), exist_ok=True)
+            if os.path.exists(self.address):
+                if daemon_request({"op": "ping"}, self.address, quiet=True):
+                    raise RuntimeError(f"Daemon already running at {self.address}")
+                os.remove(self.address) # Socket basi dari daemon yang crash
+        old_umask = os.umask(0o077) if os.name != 'nt' else None
+        try:
+            self.listener = Listener(self.address)
+        finally:
+            if old_umask is not None: os.umask(old_umask)
+        print(f"Daemon listening on {self.address}")
+        owner = self.quests.acquire()
+        if owner:
+            print(f"quests.json is in use by pid {owner}; quest requests fail until it exits")
+        sys.stdout.flush()
+        self.metrics.start()
+        if not owner and self.quests.pending():
+            self.run_quests() # Lanjutkan rotasi yang terputus (crash/reboot)
+
+        try:
+            while not self.stopping.is_set():
+                try:
+                    conn = self.listener.accept()
+                except OSError:
+                    break
+                if self.stopping.is_set():
+                    conn.close()
+                    break
+                threading.Thread(target=self.handle, args=(conn,), daemon=True).start()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def _wake_listener(self):
+        # accept() tidak terbangun oleh close() dari thread lain, jadi sambungkan satu koneksi kosong
+        from multiprocessing.connection import Client
+        try: Client(self.address).close()
+        except OSError: pass
+
+    def close(self):
+        self.stopping.set()
+        try: self.listener.close()
+        except (OSError, AttributeError): pass
+        if self.quest_thread and self.quest_thread.is_alive():
+            self.quests.stop()
+            self.quest_thread.join(timeout=10)
+        self.quests.release()
+        self.manager.shutdown()
+        self.metrics.stop()
+
+    def handle(self, conn):
+        with conn:
+            while True:
+                try:
+                    raw = conn.recv_bytes()
+                except (EOFError, OSError):
+                    return
+                try:
+                    response = self.dispatch(json.loads(raw))
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                try:
+                    conn.send_bytes(json.dumps(response).encode("utf-8"))
+                except OSError:
+                    return
+
+    def dispatch(self, request):
+        op = request.get("op")
+        manager = self.manager
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "start":
+            session = manager.spawn(normalize_game_name(request["game"]))
+            return {"ok": True, "session": session_info(session)}
+        if op == "stop":
+            session = manager.stop(normalize_game_name(request["game"]))
+            return {"ok": session is not None, "session": session_info(session) if session else None}
+        if op == "list":
+            sessions = manager.sample_usage() if request.get("usage") else list(manager.snapshot().values())
+            return {"ok": True, "sessions": [session_info(s) for s in sessions],
+                    "ended": [session_info(s) for s in list(manager.ended)]}
+        if op == "batch":
+            started, errors = manager.launch_many([normalize_game_name(g) for g in request["games"]])
+            return {"ok": not errors, "sessions": [session_info(s) for s in started], "errors": errors}
+        if op == "stop_all":
+            manager.stop_all()
+            return {"ok": True}
+        if op in ("quest", "quest_status") and not self.quests.owns_lock:
+            owner = self.quests.acquire() # Coba lagi: `--quest` lokal yang memegang lock mungkin sudah selesai
+            if owner:
+                return {"ok": False, "error": f"quest queue is owned by pid {owner}"}
+        if op == "quest":
+            for item in request.get("entries", []):
+                self.quests.add(item["game"], float(item["minutes"]) * 60,
+                                int(item.get("priority", 0)), item.get("deadline"))
+            self.run_quests()
+            return {"ok": True, "entries": self.quests.pending()}
+        if op == "quest_status":
+            return {"ok": True, "entries": self.quests.entries}
+        if op == "metrics":
+            return {"ok": True, "text": render_metrics(manager)}
+        if op == "shutdown":
+            self.stopping.set()
+            threading.Thread(target=self._wake_listener, daemon=True).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+def run_daemon(address=None):
+    """discordGS.py --daemon; return exit code (1 jika daemon lain sudah berjalan di address ini)"""
+    address = address or daemon_address()
+    # Cek sebelum SpooferDaemon dibuat: constructor sudah menjalankan reaper & mengisi pool (spawn dummy)
+    if daemon_request({"op": "ping"}, address, quiet=True):
+        print(f"Daemon already running at {address}")
+        return 1
+    daemon = SpooferDaemon(address)
+    try:
+        daemon.serve_forever()
+    except RuntimeError as e: # Daemon lain mulai listen duluan di antara cek & bind
+        daemon.close()
+        print(e)
+        return 1
+    return 0
+
+def daemon_request(request, address=None, quiet=False):
+    """Kirim satu request ke daemon, return dict response (None jika daemon tidak bisa dihubungi & quiet)"""
+    from multiprocessing.connection import Client
+    try:
+        with Client(address or daemon_address()) as conn:
+            conn.send_bytes(json.dumps(request).encode("utf-8"))
+            return json.loads(conn.recv_bytes())
+    except (OSError, EOFError):
+        if quiet: return None
+        raise
+
+class RemoteSession:
+    """Salinan read-only Session dari daemon (punya atribut yang dipakai UI)"""
+    def __init__(self, info):
+        self.name = info["name"]
+        self.pid = info["pid"]
+        self.state = info["state"]
+        self.started_at = info["started_at"]
+        self.exit_code = info.get("exit_code")
+        self.usage = (info["rss"], info["cpu"]) if info.get("rss") is not None else None
+        self.policy_problems = info.get("policy_problems", [])
+
+    def uptime(self):
+        return time.time() - self.started_at
+
+class RemoteSessionManager:
+    """
+    Pengganti SessionManager untuk GameSimulatorApp saat memakai daemon: app hanya menjadi
+    salah satu client, dan sesi tetap berjalan di daemon saat window ditutup.
+    """
+    detached = True
+
+    def __init__(self, address=None):
+        self.address = address or daemon_address()
+        self.max_parallel = max(1, int(CONFIG["launch_concurrency"]))
+        self.latency = LatencyRecorder()
+        self.pool = None
+        self.on_exit = None
+        self.cache = {} # nama -> RemoteSession, diperbarui tiap request
+        self.ended = [] # Sesi yang sudah selesai di daemon (exit code & uptime), dari request list terakhir
+        self.lock = threading.Lock()
+
+    def _call(self, request):
+        response = daemon_request(request, self.address)
+        if not response.get("ok") and response.get("error"):
+            raise RuntimeError(response["error"])
+        return response
+
+    def _refresh(self, usage=False):
+        response = self._call({"op": "list", "usage": usage})
+        sessions = [RemoteSession(info) for info in response["sessions"]]
+        with self.lock:
+            self.cache = {s.name: s for s in sessions}
+            self.ended = [RemoteSession(info) for info in response.get("ended", [])]
+        return sessions
+
+    def __len__(self):
+        return len(self.cache)
+
+    def names(self):
+        with self.lock:
+            return list(self.cache)
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.cache)
+
+    def spawn(self, game_name):
+        t0 = time.perf_counter()
+        session = RemoteSession(self._call({"op": "start", "game": game_name})["session"])
+        self.latency.record("launch_remote", time.perf_counter() - t0)
+        with self.lock:
+            self.cache[session.name] = session
+        return session
+
+    def stop(self, game_name):
+        response = self._call({"op": "stop", "game": game_name})
+        with self.lock:
+            self.cache.pop(game_name, None)
+        return RemoteSession(response["session"]) if response.get("session") else None
+
+    def launch_many(self, names):
+        response = self._call({"op": "batch", "games": names})
+        started = [RemoteSession(info) for info in response["sessions"]]
+        self._refresh()
+        return started, response.get("errors", {})
+
+    def stop_all(self):
+        self._call({"op": "stop_all"})
+        self._refresh()
+
+    def sample_usage(self):
+        try:
+            return self._refresh(usage=True)
+        except (OSError, EOFError, RuntimeError):
+            with self.lock:
+                self.cache = {} # Daemon mati: anggap tidak ada sesi
+            return []
+
+    def shutdown(self):
+        pass # Sesi milik daemon, bukan milik window ini
+
+def daemon_ctl(args):
+    """discordGS.py --ctl <op> [game ...] : client CLI sederhana untuk daemon"""
+    usage = "usage: --ctl ping|list|start|stop|batch|stop_all|metrics|shutdown [game ...]"
+    if not args or (args[0] in ("start", "stop") and len(args) < 2):
+        print(usage) # start/stop butuh nama game
+        return 2
+    op, games = args[0], args[1:]
+    request = {"op": op}
+    if op in ("start", "stop"):
+        request["game"] = games[0]
+    elif op == "batch":
+        request["games"] = games
+    elif op == "list":
+        request["usage"] = True
+    response = daemon_request(request, quiet=True)
+    if response is None:
+        print(f"Daemon not reachable at {daemon_address()}")
+        return 1
+    if op == "metrics" and response.get("ok"):
+        print(response["text"], end="")
+        return 0
+    print(json.dumps(response, indent=2))
+    return 0 if response.get("ok") else 1
+
+# --- QUEST ROTATION SCHEDULER ---
+def parse_quest_spec(spec):
+    """'Valorant.exe:15' -> ('Valorant.exe', 900.0); 'Valorant:15:2' -> prioritas 2"""
+    parts = spec.rsplit(":", 2) if spec.count(":") >= 2 else spec.rsplit(":", 1)
+    if len(parts) < 2:
+        raise ValueError(f"Invalid quest entry '{spec}', expected GAME:MINUTES[:PRIORITY]")
+    priority = int(parts[2]) if len(parts) > 2 else 0
+    return normalize_game_name(parts[0]), float(parts[1]) * 60, priority
+
+class QuestScheduler:
+    """
+    Menjalankan antrian (game, durasi) di atas SessionManager dengan batas paralel.
+    Urutan: prioritas tertinggi, lalu deadline terdekat, lalu sisa waktu terpendek
+    (shortest-first = paling banyak quest selesai per jam). Sisa detik tiap entry di-checkpoint
+    secara atomik ke quests.json, jadi setelah crash/reboot rotasi lanjut dari sisa waktunya.
+    Hanya satu proses yang boleh menjalankan antrian ini (lihat acquire()).
+    """
+    CHECKPOINT_INTERVAL = 15 # Detik; progress maksimal yang hilang saat crash
+    RETRY_DELAY = 30
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, manager, state_path=None, max_parallel=None):
+        self.manager = manager
+        self.state_path = state_path or os.path.join(user_data_dir(), "quests.json")
+        self.max_parallel = max(1, int(max_parallel or CONFIG["quest_concurrency"]))
+        self.cond = threading.Condition()
+        self.running = {} # nama -> (entry, monotonic terakhir dihitung)
+        self.stopping = False
+        self.on_change = None # Callback(entry) saat status entry berubah
+        self.owns_lock = False
+        self.entries = self._load()
+
+    def acquire(self):
+        """
+        Klaim quests.json lewat <quests.json>.lock berisi PID pemilik.
+        Dua scheduler di atas file yang sama saling menimpa entry & menjalankan game yang sama dua kali.
+        Return None jika berhasil (entry dibaca ulang dari disk), atau PID pemilik lain yang masih hidup.
+        """
+        lock = self.state_path + ".lock"
+        tmp = f"{lock}.{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(lock), exist_ok=True)
+            with open(tmp, 'w') as f:
+                f.write(str(os.getpid()))
+            while True:
+                try:
+                    os.link(tmp, lock) # Atomik & gagal jika lock sudah ada; isinya langsung lengkap
+                    break
+                except FileExistsError:
+                    pass
+                try:
+                    with open(lock, 'r') as f:
+                        owner = int(f.read())
+                except FileNotFoundError:
+                    continue
+                except (OSError, ValueError):
+                    owner = 0
+                if owner == os.getpid():
+                    return None
+                if owner and owner in {pid for pid, _, _ in list_processes()}:
+                    return owner
+                try: os.remove(lock) # Lock basi dari pemilik yang crash
+                except FileNotFoundError: pass
+        finally:
+            try: os.remove(tmp)
+            except OSError: pass
+        with self.cond:
+            self.owns_lock = True
+            self.entries = self._load() # Pemilik sebelumnya mungkin sudah mengubah antrian
+        return None
+
+    def release(self):
+        if self.owns_lock:
+            self.owns_lock = False
+            try: os.remove(self.state_path + ".lock")
+            except OSError: pass
+
+    def _load(self):
+        try:
+            with open(self.state_path, 'r') as f:
+                entries = json.load(f).get("entries", [])
+        except (OSError, ValueError, AttributeError):
+            return []
+        for entry in entries:
+            if entry.get("status") == "running":
+                entry["status"] = "queued" # Terputus oleh crash/reboot: lanjutkan sisanya
+        return entries
+
+    def save(self):
+        tmp = self.state_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump({"entries": self.entries, "updated_at": time.time()}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.state_path)
+        except OSError:
+            pass
+
+    def add(self, game, seconds, priority=0, deadline=None):
+        with self.cond:
+            entry = {"game": normalize_game_name(game), "duration": seconds, "remaining": seconds,
+                     "priority": priority, "deadline": deadline, "status": "queued",
+                     "attempts": 0, "not_before": 0, "order": len(self.entries)}
+            self.entries.append(entry)
+            self.save()
+            self.cond.notify()
+        return entry
+
+    def pending(self):
+        with self.cond:
+            return [e for e in self.entries if e["status"] in ("queued", "running")]
+
+    def _set_status(self, entry, status):
+        entry["status"] = status
+        if self.on_change:
+            self.on_change(entry)
+
+    def _tick(self, now):
+        for game, (entry, last) in self.running.items():
+            entry["remaining"] = max(0.0, entry["remaining"] - (now - last))
+            self.running[game] = (entry, now)
+
+    def _fail(self, entry, error):
+        entry["attempts"] += 1
+        entry["error"] = error
+        entry["not_before"] = time.time() + self.RETRY_DELAY
+        self._set_status(entry, "failed" if entry["attempts"] >= self.MAX_ATTEMPTS else "queued")
+
+    def _next_entries(self, n):
+        import heapq
+        wall = time.time()
+        busy = set(self.running) | set(self.manager.names())
+        ready = [e for e in self.entries
+                 if e["status"] == "queued" and e["not_before"] <= wall and e["game"] not in busy]
+        picked, games = [], set()
+        for e in heapq.nsmallest(len(ready), ready, key=lambda e: (-e["priority"], e["deadline"] or float("inf"),
+                                                                   e["remaining"], e["order"])):
+            if len(picked) >= n: break
+            if e["game"] not in games: # Satu game hanya bisa jalan satu kali sekaligus
+                games.add(e["game"])
+                picked.append(e)
+        return picked
+
+    def run(self):
+        """Blok sampai antrian habis atau stop() dipanggil"""
+        with self.cond:
+            try:
+                self._loop()
+            finally:
+                self.drain() # Juga saat KeyboardInterrupt / error di tengah loop
+
+    def _loop(self):
+        while not self.stopping:
+            now = time.monotonic()
+            self._tick(now)
+            alive = {s.name for s in self.manager.sample_usage()}
+
+            for game, (entry, _) in list(self.running.items()):
+                if entry["remaining"] <= 0:
+                    del self.running[game]
+                    self.manager.stop(game)
+                    self._set_status(entry, "done")
+                elif game not in alive:
+                    # Dummy mati di tengah jalan: sisa waktu tetap, coba lagi nanti
+                    del self.running[game]
+                    self._fail(entry, "dummy exited early")
+
+            for entry in self._next_entries(self.max_parallel - len(self.running)):
+                try:
+                    self.manager.spawn(entry["game"])
+                except Exception as e:
+                    self._fail(entry, str(e))
+                    continue
+                self.running[entry["game"]] = (entry, time.monotonic())
+                self._set_status(entry, "running")
+            self.save()
+
+            queued = [e for e in self.entries if e["status"] == "queued"]
+            if not self.running and not queued:
+                break
+            waits = [self.CHECKPOINT_INTERVAL] + [e["remaining"] for e, _ in self.running.values()]
+            waits += [e["not_before"] - time.time() for e in queued if e["not_before"] > time.time()]
+            self.cond.wait(max(0.05, min(waits)))
+
+    def drain(self):
+        """Hitung progress terakhir, matikan game yang jalan & simpan sisanya sebagai queued"""
+        with self.cond:
+            self._tick(time.monotonic())
+            for game, (entry, _) in list(self.running.items()):
+                self.manager.stop(game)
+                self._set_status(entry, "queued")
+            self.running.clear()
+            self.save()
+
+    def stop(self):
+        with self.cond:
+            self.stopping = True
+            self.cond.notify()
+
+def report_quest(entry):
+    left = int(entry["remaining"])
+    print(f"[{time.strftime('%H:%M:%S')}] {entry['game']}: {entry['status']} ({left // 60}m{left % 60:02d}s left)")
+    sys.stdout.flush()
+
+def run_quests(specs):
+    """
+    discordGS.py --quest GAME:MINUTES[:PRIORITY] ... [--connect]
+    Tanpa entry: lanjutkan antrian yang tersimpan di quests.json.
+    """
+    if "--connect" in sys.argv and daemon_request({"op": "ping"}, quiet=True):
+        return watch_daemon_quests(specs)
+    scheduler = QuestScheduler(None)
+    owner = scheduler.acquire()
+    if owner:
+        print(f"Quest queue is owned by pid {owner} (daemon?); add quests with --quest ... --connect")
+        return 1
+    scheduler.manager = manager = local_session_manager()
+    try:
+        for spec in specs:
+            scheduler.add(*parse_quest_spec(spec))
+        scheduler.on_change = report_quest
+        if not scheduler.pending():
+            print("No pending quests.")
+            return 0
+        try:
+            scheduler.run() # run() sendiri men-drain (stop game & simpan sisa waktu) saat Ctrl+C
+        except KeyboardInterrupt:
+            pass
+    finally:
+        manager.shutdown()
+        scheduler.release()
+    failed = [e for e in scheduler.entries if e["status"] == "failed"]
+    return 1 if failed else 0
+
+def watch_daemon_quests(specs, address=None, interval=2.0):
+    """
+    --quest ... --connect: entry dikirim ke QuestScheduler milik daemon (satu-satunya penulis quests.json),
+    lalu status di-poll lewat quest_status. Ctrl+C hanya melepas client; antrian tetap jalan di daemon.
+    """
+    entries = []
+    for spec in specs:
+        game, seconds, priority = parse_quest_spec(spec)
+        entries.append({"game": game, "minutes": seconds / 60, "priority": priority})
+    response = daemon_request({"op": "quest", "entries": entries}, address)
+    if not response["ok"]:
+        print(response["error"])
+        return 1
+    watched = {e["order"]: e["status"] for e in response["entries"]}
+    if not watched:
+        print("No pending quests.")
+        return 0
+    for entry in response["entries"]:
+        report_quest(entry)
+    try:
+        while True:
+            time.sleep(interval)
+            response = daemon_request({"op": "quest_status"}, address)
+            if not response["ok"]:
+                print(response["error"])
+                return 1
+            current = [e for e in response["entries"] if e["order"] in watched]
+            for entry in current:
+                if entry["status"] != watched[entry["order"]]:
+                    watched[entry["order"]] = entry["status"]
+                    report_quest(entry)
+            if not any(e["status"] in ("queued", "running") for e in current):
+                break
+    except KeyboardInterrupt:
+        print("Detached; quests keep running in the daemon.")
+        return 0
+    except (OSError, EOFError) as e:
+        print(f"Lost connection to daemon: {e}")
+        return 1
+    return 1 if any(e["status"] == "failed" for e in current) else 0
+
+def self_command(*args):
+    """Command untuk menjalankan app ini sendiri (frozen atau mode script)"""
+    if getattr(sys, 'frozen', False):
+        return [sys.executable, *args]
+    return [sys.executable, os.path.abspath(__file__), *args]
+
+def measure_import_ms(runs=3):
+    """Median waktu `import discordGS` (ms) di proses baru, None jika frozen / gagal"""
+    if getattr(sys, 'frozen', False):
+        return None
+    code = ("import time; t = time.perf_counter(); import discordGS; "
+            "print((time.perf_counter() - t) * 1000)")
+    # Run pertama meng-compile & menulis .pyc (juga jika PYTHONDONTWRITEBYTECODE aktif), seperti app terpasang
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    samples = []
+    for _ in range(runs + 1):
+        out = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                             capture_output=True, text=True, env=env)
+        if out.returncode == 0:
+            samples.append(float(out.stdout.strip().splitlines()[-1]))
+    samples = samples[1:]
+    return percentile(samples, 50) if samples else None
+
+def measure_first_frame_ms(runs=3):
+    """Median {"first_frame", "interactive"} (ms) lewat --startup-probe, None jika tidak ada display"""
+    samples = []
+    for _ in range(runs):
+        try:
+            out = subprocess.run(self_command("--startup-probe", "--fast-start"), capture_output=True, text=True, timeout=30)
+        except subprocess.TimeoutExpired:
+            continue
+        if out.returncode == 0 and out.stdout.strip():
+            samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    if not samples:
+        return None
+    return {"first_frame": percentile([s["first_frame"] for s in samples], 50),
+            "interactive": percentile([s.get("interactive", s["first_frame"]) for s in samples], 50)}
+
+def check_startup(runs=3):
+    """
+    Ukur import time & time-to-first-frame di proses baru, bandingkan dengan STARTUP_BUDGET_MS.
+    Exit code 1 jika melebihi budget (bisa dipakai di CI). Dipakai lewat: discordGS.py --check-startup
+    Versi otomatisnya ada di tests/test_startup.py.
+    """
+    results, failed = {}, False
+    import_ms = measure_import_ms(runs)
+    if import_ms is not None:
+        results["import"] = import_ms
+    results.update(measure_first_frame_ms(runs) or {})
+
+    for stage, budget in STARTUP_BUDGET_MS.items():
+        value = results.get(stage)
+        if value is None:
+            print(f"{stage:>12}: skipped (no display?)")
+            continue
+        status = "OK" if value <= budget else "OVER BUDGET"
+        failed = failed or value > budget
+        print(f"{stage:>12}: {value:7.1f} ms (budget {budget} ms) {status}")
+    if "interactive" in results:
+        print(f"{'interactive':>12}: {results['interactive']:7.1f} ms")
+    return 1 if failed else 0
+
+# --- KATALOG GAME & AUTOCOMPLETE ---
+def catalog_exe_name(raw):
+    """'destiny2/destiny2.exe' -> 'destiny2.exe'; entry launcher ('>steam...') diabaikan"""
+    if not raw or raw.startswith(">"): return None
+    return raw.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1] or None
+
+def parse_catalog(data):
+    """
+    Parse katalog: format daftar 'detectable applications' Discord
+    ([{"name": ..., "executables": [{"os": "win32", "name": ...}]}]) atau dict {exe: judul}.
+    Return list (exe, judul).
+    """
+    entries = []
+    if isinstance(data, dict):
+        entries = [(exe, str(title or "")) for exe, title in data.items() if exe]
+    elif isinstance(data, list):
+        for app in data:
+            if not isinstance(app, dict): continue
+            for executable in app.get("executables") or []:
+                if executable.get("os", "win32") != "win32": continue
+                exe = catalog_exe_name(executable.get("name", ""))
+                if exe:
+                    entries.append((exe, app.get("name", "")))
+    return entries
+
+def load_catalog_json(path):
+    with open(path, 'r', encoding="utf-8") as f:
+        return parse_catalog(json.load(f))
+
+def fuzzy_key(exe, title):
+    """Key fuzzy sebuah entry: "exe judul" lowercase, UTF-8, satu baris"""
+    return f"{exe} {title}".lower().replace("\n", " ").encode("utf-8")
+
+def fuzzy_blob(keys):
+    """Gabungkan key fuzzy jadi b"\nkey1\nkey2..." + offset b"\n" milik tiap key"""
+    starts, pos = [], 0
+    for key in keys:
+        starts.append(pos)
+        pos += len(key) + 1
+    return b"\n" + b"\n".join(keys), starts
+
+def fuzzy_pattern(query):
+    """
+    Regex (bytes) subsequence match untuk query lowercase. Tiap karakter diambil kemunculan paling kirinya,
+    jadi panjang match = skor (makin pendek = celah makin sedikit = makin mirip). Diawali b"\n" agar regex
+    melompat antar awal key dengan pencarian literal yang cepat.
+    """
+    parts = [b"\n"]
+    for ch in query:
+        c = re.escape(ch.encode("utf-8"))
+        # ASCII: kelas negasi tanpa backtracking; multi-byte tidak bisa dinegasi per byte, pakai lazy
+        parts.append(b"[^\n" + c + b"]*" + c if ord(ch) < 128 else b"[^\n]*?" + c)
+    return re.compile(b"".join(parts))
 
-# --- KONFIGURASI TEMA MODERN (Deep Dark / Cyberpunk Minimalist) ---
-THEME = {
-    "bg_main": "#121212",       # Hampir hitam
-    "bg_surface": "#1E1E1E",    # Abu gelap untuk card/input
-    "bg_popup": "#252525",      # Abu sedikit terang untuk dropdown
-    "primary": "#BB86FC",       # Ungu pastel (aksen modern)
-    "primary_dark": "#3700B3",  # Ungu gelap untuk hover
-    "secondary": "#00E676",     # Hijau terang (Online Status)
-    "secondary_dim": "#004D40", # Hijau gelap
-    "danger": "#CF6679",        # Merah soft
-    "danger_hover": "#B00020",  # Merah gelap
-    "blue": "#2979FF",          # Biru modern (Tombol Source)
-    "blue_hover": "#0055FF",    # Biru gelap hover
-    "text_main": "#E1E1E1",     # Putih tulang
-    "text_dim": "#B0B0B0",      # Abu muda
-    "font_family": "Segoe UI"
-}
+def fuzzy_scan(pattern, buf, start, end, starts, candidates=None, max_matches=None):
+    """
+    [(skor, index row)] untuk key fuzzy di buf[start:end] (bisa mmap) yang cocok dengan pattern.
+    candidates: hanya cek ulang row ini (hasil query sebelumnya yang diperpanjang), bukan scan semua.
+    max_matches: berhenti setelah sekian match (query pendek bisa cocok dengan hampir semua key).
+    """
+    if candidates is None:
+        found = itertools.islice(pattern.finditer(buf, start, end), max_matches)
+        return [(m.end() - m.start(), bisect.bisect_left(starts, m.start() - start)) for m in found]
+    matched = []
+    for i in candidates:
+        m = pattern.match(buf, start + starts[i], end)
+        if m:
+            matched.append((m.end() - m.start(), i))
+    return matched
 
-HISTORY_FILE = "game_history.json"
+def _bisect_range(key_at, n, prefix):
+    """Range [lo, hi) key yang diawali prefix, key_at(i) harus terurut (lowercase)"""
+    def bound(target):
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_at(mid) < target: lo = mid + 1
+            else: hi = mid
+        return lo
+    return bound(prefix), bound(prefix + "\uffff")
 
-# --- FUNGSI DUMMY MODE (CHILD PROCESS) ---
-def run_dummy_mode():
+class MemoryCatalog:
+    """Katalog kecil di memori (riwayat, delta update, katalog JSON)"""
+    def __init__(self, entries):
+        rows = {}
+        for exe, title in entries:
+            rows.setdefault(exe.lower(), (exe, title or ""))
+        self.exe_keys = sorted(rows)
+        self.rows = [rows[key] for key in self.exe_keys]
+        titles = sorted((title.lower(), i) for i, (_, title) in enumerate(self.rows) if title)
+        self.title_keys = [t for t, _ in titles]
+        self.title_rows = [i for _, i in titles]
+        self._fuzzy = None # (blob, starts), dibangun saat fuzzy pertama kali dipakai
+
+    def __len__(self):
+        return len(self.rows)
+
+    def row(self, i):
+        return self.rows[i]
+
+    def prefix(self, q, limit):
+        lo, hi = _bisect_range(self.exe_keys.__getitem__, len(self.exe_keys), q)
+        return range(lo, min(hi, lo + limit))
+
+    def title_prefix(self, q, limit):
+        lo, hi = _bisect_range(self.title_keys.__getitem__, len(self.title_keys), q)
+        return [self.title_rows[j] for j in range(lo, min(hi, lo + limit))]
+
+    def fuzzy(self, pattern, candidates=None, max_matches=None):
+        if self._fuzzy is None:
+            self._fuzzy = fuzzy_blob([fuzzy_key(exe, title) for exe, title in self.rows])
+        blob, starts = self._fuzzy
+        return fuzzy_scan(pattern, blob, 0, len(blob), starts, candidates, max_matches)
+
+class CatalogFile:
     """
-    Fungsi ini akan dijalankan oleh proses 'palsu' (file yang dicopy menjadi nama game).
-    Ini menggantikan logika '-c' script string yang lama agar kompatibel dengan PyInstaller.
+    Katalog biner yang di-mmap; query tanpa memuat semua entry ke objek Python.
+    Layout (little-endian):
+      header   : magic "DGSC", version, flags, count, title_count, titles_off, strings_off
+      records  : count x (u32 exe_off, u32 title_off), urut exe lowercase
+      titles   : title_count x u32 index record, urut judul lowercase
+      strings  : UTF-8 dipisah NUL (offset relatif ke strings_off)
+    Jika flags & FLAG_FUZZY, menyusul section fuzzy (di-scan regex langsung di atas mmap):
+      starts   : count x u32 offset b"\n" key fuzzy tiap record (relatif ke keys_off)
+      keys     : b"\nkey" per record (fuzzy_key), urutan sama dengan records
+      trailer  : u32 starts_off, u32 keys_off (8 byte terakhir file)
+    Update inkremental disimpan di <path>.delta (JSONL add/del) dan di-overlay saat dibuka,
+    jadi import snapshot baru tidak perlu menulis ulang file utama.
+    """
+    MAGIC = b"DGSC"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHIIII")
+    RECORD = struct.Struct("<II")
+    U32 = struct.Struct("<I")
+    FUZZY_TRAILER = struct.Struct("<II")
+    FLAG_FUZZY = 1
+
+    def __init__(self, path):
+        import mmap
+        self.path = path
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < self.HEADER.size:
+                raise ValueError(f"{path}: katalog kosong / terpotong ({size} byte)")
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.fuzzy_starts, self.fuzzy_range = None, None # Tetap None untuk katalog lama tanpa section fuzzy
+        magic, version, flags, self.count, self.title_count, self.titles_off, self.strings_off = \
+            self.HEADER.unpack_from(self.mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"{path}: bukan katalog DGSC v{self.VERSION}")
+        if (self.titles_off < self.HEADER.size + self.count * self.RECORD.size
+                or self.strings_off < self.titles_off + self.title_count * 4 or self.strings_off > size):
+            self.close()
+            raise ValueError(f"{path}: katalog terpotong")
+        if flags & self.FLAG_FUZZY:
+            starts_off, keys_off = self.FUZZY_TRAILER.unpack_from(self.mm, size - self.FUZZY_TRAILER.size)
+            if not (self.strings_off <= starts_off and starts_off + self.count * 4 == keys_off
+                    and keys_off <= size - self.FUZZY_TRAILER.size):
+                self.close()
+                raise ValueError(f"{path}: section fuzzy terpotong")
+            starts = memoryview(self.mm)[starts_off:starts_off + self.count * 4]
+            if sys.byteorder == "little":
+                self.fuzzy_starts = starts.cast("I") # Tanpa copy
+            else:
+                import array
+                self.fuzzy_starts = array.array("I", starts.tobytes())
+                self.fuzzy_starts.byteswap()
+                starts.release()
+            self.fuzzy_range = (keys_off, size - self.FUZZY_TRAILER.size)
+        self.added, self.removed = self._load_delta()
+
+    def _load_delta(self):
+        added, removed = {}, set()
+        try:
+            with open(self.path + ".delta", 'r', encoding="utf-8") as f:
+                for line in f:
+                    try: op = json.loads(line)
+                    except ValueError: continue
+                    key = op.get("exe", "").lower()
+                    if op.get("op") == "add":
+                        added[key] = (op["exe"], op.get("title", ""))
+                        removed.add(key) # Versi lama di file utama (jika ada) digantikan
+                    elif op.get("op") == "del":
+                        added.pop(key, None)
+                        removed.add(key)
+        except OSError:
+            pass
+        return MemoryCatalog(added.values()), removed
+
+    def close(self):
+        if isinstance(self.fuzzy_starts, memoryview):
+            self.fuzzy_starts.release() # mmap tidak bisa ditutup selama masih ada view
+        self.mm.close()
+
+    def __len__(self):
+        return self.count
+
+    def _string(self, off):
+        start = self.strings_off + off
+        return self.mm[start:self.mm.find(b"\0", start)].decode("utf-8")
+
+    def row(self, i):
+        exe_off, title_off = self.RECORD.unpack_from(self.mm, self.HEADER.size + i * self.RECORD.size)
+        return self._string(exe_off), self._string(title_off)
+
+    def _exe_key(self, i):
+        return self.row(i)[0].lower()
+
+    def _title_row(self, j):
+        return self.U32.unpack_from(self.mm, self.titles_off + j * 4)[0]
+
+    def prefix(self, q, limit):
+        lo, hi = _bisect_range(self._exe_key, self.count, q)
+        return range(lo, min(hi, lo + limit))
+
+    def title_prefix(self, q, limit):
+        lo, hi = _bisect_range(lambda j: self.row(self._title_row(j))[1].lower(), self.title_count, q)
+        return [self._title_row(j) for j in range(lo, min(hi, lo + limit))]
+
+    def fuzzy(self, pattern, candidates=None, max_matches=None):
+        if self.fuzzy_range is None:
+            return [] # Katalog lama: fuzzy baru tersedia setelah import berikutnya menulis ulang file
+        return fuzzy_scan(pattern, self.mm, *self.fuzzy_range, self.fuzzy_starts, candidates, max_matches)
+
+    def sources(self):
+        """Sumber untuk CompletionIndex: delta (prioritas) lalu file utama"""
+        return [self.added, self]
+
+    def entries(self):
+        """Semua entry efektif (file utama + delta); dipakai import tool, bukan saat startup"""
+        merged = {}
+        for i in range(self.count):
+            exe, title = self.row(i)
+            if exe.lower() not in self.removed:
+                merged[exe.lower()] = (exe, title)
+        for exe, title in self.added.rows:
+            merged[exe.lower()] = (exe, title)
+        return merged
+
+def write_catalog(path, entries):
+    """Tulis katalog biner baru (atomic) dari iterable (exe, judul), lalu hapus delta lama"""
+    rows = {}
+    for exe, title in entries:
+        rows.setdefault(exe.lower(), (exe, title or ""))
+    keys = sorted(rows)
+    blob, offsets, string_offsets = bytearray(), [], {}
+
+    def intern(s):
+        if s not in string_offsets:
+            string_offsets[s] = len(blob)
+            blob.extend(s.encode("utf-8") + b"\0")
+        return string_offsets[s]
+
+    for key in keys:
+        exe, title = rows[key]
+        offsets.append((intern(exe), intern(title)))
+    titled = sorted((rows[k][1].lower(), i) for i, k in enumerate(keys) if rows[k][1])
+
+    fuzzy_keys, fuzzy_starts = fuzzy_blob([fuzzy_key(*rows[key]) for key in keys])
+
+    H, R = CatalogFile.HEADER, CatalogFile.RECORD
+    titles_off = H.size + len(keys) * R.size
+    strings_off = titles_off + len(titled) * 4
+    starts_off = strings_off + len(blob)
+    keys_off = starts_off + len(keys) * 4
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(H.pack(CatalogFile.MAGIC, CatalogFile.VERSION, CatalogFile.FLAG_FUZZY, len(keys), len(titled),
+                       titles_off, strings_off))
+        for exe_off, title_off in offsets:
+            f.write(R.pack(exe_off, title_off))
+        for _, i in titled:
+            f.write(CatalogFile.U32.pack(i))
+        f.write(blob)
+        f.write(struct.pack(f"<{len(fuzzy_starts)}I", *fuzzy_starts))
+        f.write(fuzzy_keys)
+        f.write(CatalogFile.FUZZY_TRAILER.pack(starts_off, keys_off))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    try: os.remove(path + ".delta")
+    except OSError: pass
+    return len(keys)
+
+def fetch_catalog_snapshot(source, meta):
+    """
+    Ambil snapshot dari file lokal atau URL http(s). Untuk URL dipakai ETag/Last-Modified dari meta,
+    return None jika server menjawab 304 (tidak berubah).
     """
+    if not source.startswith(("http://", "https://")):
+        with open(source, 'rb') as f:
+            return f.read()
+    import urllib.request, urllib.error
+    request = urllib.request.Request(source)
+    if meta.get("source") == source:
+        if meta.get("etag"): request.add_header("If-None-Match", meta["etag"])
+        if meta.get("last_modified"): request.add_header("If-Modified-Since", meta["last_modified"])
     try:
-        # Kita buat window tkinter minimalis
-        root = tk.Tk()
-        # Set judul sesuai nama file executable saat ini (misal: Valorant.exe)
-        current_exe_name = os.path.basename(sys.executable)
-        root.title(current_exe_name)
-        root.geometry("300x100")
-        root.configure(bg="#121212")
-        
-        # Pesan status
-        lbl = tk.Label(root, text=f"Game Simulator Running...\n({current_exe_name})", 
-                       fg="#03DAC6", bg="#121212", font=("Segoe UI", 10))
-        lbl.pack(expand=True)
-        
-        # Minimize window agar tidak mengganggu, tapi tetap ada di taskbar
-        # Gunakan after agar event loop jalan dulu baru minimize
-        root.after(100, root.iconify)
-        
-        # Bind close event agar proses benar-benar mati saat ditutup manual
-        root.protocol("WM_DELETE_WINDOW", root.destroy)
-        
-        root.mainloop()
-    except Exception as e:
-        # Jika terjadi error di background process, kita bisa log atau abaikan
-        pass
+        with urllib.request.urlopen(request, timeout=30) as response:
+            meta["etag"] = response.headers.get("ETag")
+            meta["last_modified"] = response.headers.get("Last-Modified")
+            return response.read()
+    except urllib.error.HTTPError as e:
+        if e.code == 304: return None
+        raise
+
+def import_catalog(source, path=None, compact=False, compact_ratio=0.25):
+    """
+    Terapkan snapshot katalog baru sebagai diff: hanya entry yang ditambah/berubah/dihapus yang
+    di-append ke <catalog>.delta. File utama baru ditulis ulang jika belum ada, diminta (--compact),
+    atau delta sudah melebihi compact_ratio dari jumlah entry.
+    Dipakai lewat: discordGS.py --import-catalog <file|url> [--compact]
+    """
+    path = path or os.path.join(user_data_dir(), "catalog.bin")
+    meta_path = path + ".meta.json"
+    try:
+        with open(meta_path, 'r') as f: meta = json.load(f)
+    except (OSError, ValueError):
+        meta = {}
+
+    raw = fetch_catalog_snapshot(source, meta)
+    if raw is None:
+        print("Catalog is up to date (304 Not Modified).")
+        return {"added": 0, "removed": 0, "changed": 0}
+    snapshot = {exe.lower(): (exe, title) for exe, title in parse_catalog(json.loads(raw))}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    catalog = None
+    if os.path.exists(path):
+        try:
+            catalog = CatalogFile(path)
+        except ValueError as e:
+            print(f"Existing catalog is unreadable ({e}); rebuilding it")
+    if catalog is None:
+        count = write_catalog(path, snapshot.values())
+        print(f"Catalog created: {count} entries")
+        result = {"added": count, "removed": 0, "changed": 0}
+    else:
+        try:
+            current = catalog.entries()
+            base_count = len(catalog)
+            compact = compact or catalog.fuzzy_range is None # Katalog lama: tulis ulang dengan section fuzzy
+        finally:
+            catalog.close()
+        ops = []
+        for key, (exe, title) in snapshot.items():
+            if key not in current:
+                ops.append({"op": "add", "exe": exe, "title": title})
+            elif current[key] != (exe, title):
+                ops.append({"op": "add", "exe": exe, "title": title, "changed": True})
+        for key, (exe, _) in current.items():
+            if key not in snapshot:
+                ops.append({"op": "del", "exe": exe})
+        if ops:
+            with open(path + ".delta", 'a', encoding="utf-8") as f:
+                for op in ops:
+                    f.write(json.dumps(op, separators=(",", ":")) + "\n")
+
+        try:
+            with open(path + ".delta", 'r', encoding="utf-8") as f:
+                delta_size = sum(1 for _ in f)
+        except OSError:
+            delta_size = 0
+        if compact or delta_size > compact_ratio * max(1, base_count):
+            try:
+                write_catalog(path, snapshot.values())
+                print(f"Catalog compacted: {len(snapshot)} entries")
+            except OSError as e:
+                # Windows: file utama masih di-mmap oleh app yang sedang jalan; delta tetap berlaku
+                print(f"Compaction skipped ({e}); delta kept")
+
+        result = {"added": sum(1 for o in ops if o["op"] == "add" and not o.get("changed")),
+                  "changed": sum(1 for o in ops if o.get("changed")),
+                  "removed": sum(1 for o in ops if o["op"] == "del")}
+        print(f"Catalog updated: +{result['added']} ~{result['changed']} -{result['removed']}")
+
+    meta.update({"source": source, "imported_at": time.time()})
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+    return result
+
+class CompletionIndex:
+    """
+    Index autocomplete di atas beberapa sumber katalog (riwayat, delta, file mmap).
+    Prefix: binary search pada key terurut (tanpa scan). Fuzzy: subsequence match sebagai cadangan,
+    satu regex per sumber di atas key fuzzy yang sudah lowercase (section di file katalog, di-scan langsung
+    di mmap); jika query baru memperpanjang query sebelumnya, hanya kandidat hasil fuzzy sebelumnya yang dicek ulang.
+    """
+    FUZZY_MIN_CHARS = 2
+    FUZZY_MAX_MATCHES = 2000 # Per sumber per keystroke; sisanya tidak di-ranking
+
+    def __init__(self, sources, removed=()):
+        self.sources = sources
+        self.removed = removed # key exe yang sudah dihapus dari sumber terakhir (delta katalog)
+        self._last_fuzzy = None # (query, [[index row] per sumber])
+
+    def __len__(self):
+        return sum(len(s) for s in self.sources)
+
+    def query(self, text, limit=200):
+        q = text.strip().lower()
+        if not q: return []
+        picked, seen = [], set()
+
+        def add(si, i):
+            if len(picked) >= limit: return
+            exe, title = self.sources[si].row(i)
+            key = exe.lower()
+            if key in seen or (si == len(self.sources) - 1 and key in self.removed): return
+            seen.add(key)
+            picked.append((exe, title))
+
+        for si, source in enumerate(self.sources):
+            for i in source.prefix(q, limit):
+                add(si, i)
+        for si, source in enumerate(self.sources):
+            for i in source.title_prefix(q, limit):
+                add(si, i)
+
+        if len(picked) < limit and len(q) >= self.FUZZY_MIN_CHARS:
+            pattern = fuzzy_pattern(q)
+            last = self._last_fuzzy
+            narrowed = last[1] if last and q.startswith(last[0]) else [None] * len(self.sources)
+            found = [source.fuzzy(pattern, candidates, self.FUZZY_MAX_MATCHES)
+                     for source, candidates in zip(self.sources, narrowed)]
+            # Hasil yang terpotong tidak bisa jadi kandidat query berikutnya: sumber itu di-scan ulang
+            self._last_fuzzy = (q, [None if candidates is None and len(matches) >= self.FUZZY_MAX_MATCHES
+                                    else [i for _, i in matches] for candidates, matches in zip(narrowed, found)])
+            matched = sorted((score, si, i) for si, matches in enumerate(found) for score, i in matches)
+            for _, si, i in matched:
+                if len(picked) >= limit: break
+                add(si, i)
+        return picked
+
+def build_completion_index(history_names=()):
+    """
+    Gabungkan riwayat dengan katalog lokal di direktori data user:
+    catalog.bin (mmap, hasil --import-catalog) atau catalog.json sebagai cadangan.
+    """
+    sources, removed = [MemoryCatalog((name, "") for name in history_names)], ()
+    root = user_data_dir()
+    try:
+        catalog = CatalogFile(os.path.join(root, "catalog.bin"))
+        sources += catalog.sources()
+        removed = catalog.removed
+    except (OSError, ValueError, struct.error):
+        try:
+            sources.append(MemoryCatalog(load_catalog_json(os.path.join(root, "catalog.json"))))
+        except (OSError, ValueError):
+            pass
+    return CompletionIndex(sources, removed)
 
 def hex_to_rgb(hex_val):
     hex_val = hex_val.lstrip('#')
@@ -81,6 +2845,260 @@ def interpolate_color(start_hex, end_hex, t):
     )
     return rgb_to_hex(cur_rgb)
 
+class ColorRamp:
+    """Gradien dua warna yang dihitung sekali jadi lookup table (tanpa parsing hex tiap frame)"""
+    STEPS = 64
+    _cache = {}
+
+    def __init__(self, start_hex, end_hex):
+        self.colors = [interpolate_color(start_hex, end_hex, i / (self.STEPS - 1)) for i in range(self.STEPS)]
+
+    @classmethod
+    def get(cls, start_hex, end_hex):
+        key = (start_hex.lower(), end_hex.lower())
+        ramp = cls._cache.get(key)
+        if ramp is None:
+            ramp = cls._cache[key] = cls(start_hex, end_hex)
+        return ramp
+
+    def at(self, t):
+        t = 0.0 if t < 0 else 1.0 if t > 1 else t
+        return self.colors[int(t * (self.STEPS - 1) + 0.5)]
+
+class AnimationScheduler:
+    """
+    Satu timer after() yang menjalankan semua animasi aktif.
+    Callback menerima waktu sekarang (perf_counter) dan return False jika animasinya selesai.
+    Jika tidak ada animasi aktif, tidak ada timer sama sekali.
+    """
+    FRAME_MS = 16 # ~60 FPS
+
+    def __init__(self, root):
+        self.root = root
+        self.animations = {} # key -> [callback, interval_s, next_due]
+        self.job = None
+
+    @classmethod
+    def for_widget(cls, widget):
+        """Scheduler bersama per root Tk"""
+        root = widget._root()
+        scheduler = getattr(root, "_animation_scheduler", None)
+        if scheduler is None:
+            scheduler = root._animation_scheduler = cls(root)
+        return scheduler
+
+    def start(self, key, callback, interval_ms=None):
+        interval = (interval_ms or self.FRAME_MS) / 1000
+        self.animations[key] = [callback, interval, time.perf_counter()]
+        self._schedule()
+
+    def stop(self, key):
+        self.animations.pop(key, None)
+        if not self.animations and self.job:
+            self.root.after_cancel(self.job)
+            self.job = None
+
+    def is_active(self, key):
+        return key in self.animations
+
+    def _schedule(self):
+        if self.job:
+            self.root.after_cancel(self.job)
+            self.job = None
+        if not self.animations:
+            return
+        delay = min(entry[2] for entry in self.animations.values()) - time.perf_counter()
+        self.job = self.root.after(max(1, int(delay * 1000)), self._tick)
+
+    def _tick(self):
+        self.job = None
+        now = time.perf_counter()
+        for key, entry in list(self.animations.items()):
+            if entry[2] > now + 0.001:
+                continue
+            try:
+                alive = entry[0](now)
+            except tk.TclError:
+                alive = False # Widget sudah di-destroy
+            if not alive:
+                self.animations.pop(key, None)
+            elif key in self.animations:
+                entry[2] = now + entry[1]
+        self._schedule()
+
+class ViewModel:
+    """
+    State UI terpusat untuk properti widget yang sering di-set ulang (status, tombol, panel sesi).
+    set() hanya mencatat nilai yang berbeda dari yang terakhir dikirim ke Tk; flush()
+    menjalankan apply untuk key yang berubah saja, paling sering sekali per frame.
+    """
+    FRAME_MS = 16
+
+    def __init__(self, root):
+        self.root = root
+        self.appliers = {} # key -> fungsi(value) yang mengubah widget
+        self.applied = {}  # key -> nilai yang sedang tampil
+        self.dirty = {}
+        self.job = None
+        self.last_flush = 0
+
+    def bind(self, key, apply):
+        self.appliers[key] = apply
+
+    def unbind(self, key):
+        self.appliers.pop(key, None)
+        self.applied.pop(key, None)
+        self.dirty.pop(key, None)
+
+    def set(self, key, value):
+        if key in self.applied and self.applied[key] == value:
+            self.dirty.pop(key, None) # Kembali ke nilai yang sudah tampil
+            return
+        self.dirty[key] = value
+        if self.job is None:
+            delay = self.last_flush + self.FRAME_MS / 1000 - time.perf_counter()
+            self.job = self.root.after(max(0, int(delay * 1000)), self.flush)
+
+    def flush(self):
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+        self.last_flush = time.perf_counter()
+        dirty, self.dirty = self.dirty, {}
+        for key, value in dirty.items():
+            apply = self.appliers.get(key)
+            if apply is None: continue
+            try:
+                apply(value)
+            except tk.TclError:
+                continue # Widget sudah di-destroy
+            self.applied[key] = value
+
+# --- PROFILER EVENT LOOP TK (--profile) ---
+class TkProfiler:
+    """
+    Mode profiling opt-in: membungkus callback after/after_idle/bind/trace_add & animasi
+    AnimationScheduler untuk mencatat durasi tiap callback beserta lokasi kode yang menjadwalkannya,
+    plus probe lag event loop (selisih waktu after() seharusnya jalan vs kenyataannya).
+    Hasilnya file timeline format Chrome trace (buka di chrome://tracing atau ui.perfetto.dev).
+    Tanpa --profile tidak ada yang di-patch, jadi tidak ada biaya sama sekali.
+    """
+    PROBE_MS = 50
+    SLOW_MS = 16 # Lebih lama dari satu frame = terasa stutter
+    MAX_EVENTS = 200000
+
+    def __init__(self, path):
+        self.path = path
+        self.events = collections.deque(maxlen=self.MAX_EVENTS)
+        self.stats = {} # (nama, site) -> [count, total_s, max_s, slow]
+        self.lags = []
+        self.root = None
+        self.originals = []
+
+    def install(self):
+        profiler = self
+        def patch(owner, attr, make):
+            original = getattr(owner, attr)
+            self.originals.append((owner, attr, original))
+            setattr(owner, attr, make(original))
+
+        def caller_site(depth=2):
+            frame = sys._getframe(depth)
+            return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+
+        def make_after(original):
+            def after(widget, ms, func=None, *args):
+                if func is not None:
+                    # after_idle() memanggil after("idle", ...): site-nya adalah pemanggil after_idle
+                    idle = ms == "idle"
+                    func = profiler.wrap(func, "after_idle" if idle else "after", caller_site(3 if idle else 2))
+                return original(widget, ms, func, *args)
+            return after
+
+        def make_bind(original):
+            def bind(widget, sequence=None, func=None, add=None):
+                if callable(func):
+                    func = profiler.wrap(func, f"bind {sequence}", caller_site())
+                return original(widget, sequence, func, add)
+            return bind
+
+        def make_trace_add(original):
+            def trace_add(var, mode, callback):
+                return original(var, mode, profiler.wrap(callback, f"trace {mode}", caller_site()))
+            return trace_add
+
+        def make_animation_start(original):
+            def start(scheduler, key, callback, interval_ms=None):
+                return original(scheduler, key, profiler.wrap(callback, f"animation {key}", caller_site()), interval_ms)
+            return start
+
+        patch(tk.Misc, "after", make_after)
+        patch(tk.Misc, "bind", make_bind)
+        patch(tk.Variable, "trace_add", make_trace_add)
+        patch(AnimationScheduler, "start", make_animation_start)
+        return self
+
+    def uninstall(self):
+        for owner, attr, original in reversed(self.originals):
+            setattr(owner, attr, original)
+        self.originals = []
+
+    def wrap(self, func, kind, site):
+        name = f"{kind}: {getattr(func, '__qualname__', repr(func))}"
+        def profiled(*args):
+            t0 = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.record(name, site, t0, time.perf_counter())
+        return profiled
+
+    def record(self, name, site, t0, t1):
+        duration = t1 - t0
+        self.events.append({"name": name, "cat": "callback", "ph": "X", "pid": 1, "tid": 1,
+                            "ts": (t0 - STARTUP_T0) * 1e6, "dur": duration * 1e6, "args": {"site": site}})
+        entry = self.stats.setdefault((name, site), [0, 0.0, 0.0, 0])
+        entry[0] += 1
+        entry[1] += duration
+        entry[2] = max(entry[2], duration)
+        if duration * 1000 > self.SLOW_MS:
+            entry[3] += 1
+
+    def start_probe(self, root):
+        """Probe lag: after(PROBE_MS) berantai, lag = keterlambatan dari jadwal"""
+        self.root = root
+        original_after = next((o for owner, attr, o in self.originals if attr == "after"), tk.Misc.after)
+        def probe(due):
+            now = time.perf_counter()
+            lag = max(0.0, now - due)
+            self.lags.append(lag)
+            self.events.append({"name": "loop_lag_ms", "ph": "C", "pid": 1, "tid": 1,
+                                "ts": (now - STARTUP_T0) * 1e6, "args": {"lag": round(lag * 1000, 3)}})
+            try:
+                original_after(root, self.PROBE_MS, probe, time.perf_counter() + self.PROBE_MS / 1000)
+            except tk.TclError:
+                pass # Window sudah di-destroy
+        original_after(root, self.PROBE_MS, probe, time.perf_counter() + self.PROBE_MS / 1000)
+
+    def write(self):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, f)
+        except OSError as e:
+            print(f"Cannot write profile: {e}")
+            return
+        print(f"Timeline written to {self.path}")
+
+    def report(self, top=15):
+        if self.lags:
+            print(f"Loop lag: p50 {percentile(self.lags, 50) * 1000:.1f} ms  p95 {percentile(self.lags, 95) * 1000:.1f} ms  "
+                  f"max {max(self.lags) * 1000:.1f} ms ({len(self.lags)} probes)")
+        rows = sorted(self.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+        print(f"{'max ms':>8} {'total ms':>9} {'calls':>6} {'slow':>5}  callback  <-  scheduled at")
+        for (name, site), (count, total, worst, slow) in rows:
+            print(f"{worst * 1000:>8.1f} {total * 1000:>9.1f} {count:>6} {slow:>5}  {name}  <-  {site}")
+
 class SmoothButton(tk.Canvas):
     """Tombol Custom dengan animasi hover yang fluid"""
     def __init__(self, master, text, command, width=200, height=45, bg_color=THEME["primary"], hover_color=THEME["primary_dark"], text_color="black"):
@@ -93,10 +3111,10 @@ class SmoothButton(tk.Canvas):
         
         # State
         self.is_disabled = False
-        self.animating = False
         self.anim_start_time = 0
         self.target_hex = bg_color
-        self.start_hex = bg_color
+        self.ramp = None
+        self.scheduler = AnimationScheduler.for_widget(master)
 
         # Draw Elements
         self.rect = self.create_rectangle(2, 2, width-2, height-2, fill=bg_color, outline="", width=0)
@@ -112,7 +3130,7 @@ class SmoothButton(tk.Canvas):
 
     def set_state(self, state):
         """Mengatur status aktif/mati tombol secara visual dan fungsional"""
-        self.animating = False
+        self.scheduler.stop(self)
         
         if state == "disabled":
             if not self.is_disabled: 
@@ -143,101 +3161,210 @@ class SmoothButton(tk.Canvas):
         if self.is_disabled: return 
         
         self.target_hex = target_hex
-        self.start_hex = self.itemcget(self.rect, "fill")
-        self.anim_start_time = time.time()
-        if not self.animating:
-            self.animating = True
-            self.animate()
-
-    def animate(self):
-        if not self.animating: return
-        if self.is_disabled: 
-            self.animating = False
-            return
+        self.ramp = ColorRamp.get(self.itemcget(self.rect, "fill"), target_hex)
+        self.anim_start_time = time.perf_counter()
+        self.scheduler.start(self, self.animate)
+
+    def animate(self, now):
+        if self.is_disabled: return False
         
         # Durasi animasi 200ms
-        elapsed = (time.time() - self.anim_start_time) / 0.2
+        elapsed = (now - self.anim_start_time) / 0.2
         if elapsed >= 1.0:
-            elapsed = 1.0
-            self.animating = False
             self.itemconfig(self.rect, fill=self.target_hex)
+            return False
+        self.itemconfig(self.rect, fill=self.ramp.at(elapsed))
+        return True
+
+class VirtualList(tk.Frame):
+    """Listbox tervirtualisasi: hanya baris yang terlihat yang di-insert ke Tk, berapapun jumlah item"""
+    def __init__(self, master, rows=6, on_pick=None):
+        super().__init__(master, bg=THEME["primary"]) # Frame tipis untuk border ungu
+        self.rows = rows
+        self.on_pick = on_pick
+        self.items = [] # list (value, label)
+        self.top = 0
+        self.selected = -1
+        self.rendered = None
+
+        self.listbox = tk.Listbox(self, font=(THEME["font_family"], 11),
+                                  bg=THEME["bg_popup"], fg=THEME["text_main"],
+                                  selectbackground=THEME["primary"], selectforeground="white",
+                                  highlightthickness=0, bd=0, activestyle="none", height=rows)
+        self.listbox.pack(side="left", fill="both", expand=True, padx=1, pady=1)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.on_scrollbar)
+
+        self.listbox.bind("<<ListboxSelect>>", self.on_select)
+        self.listbox.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self.listbox.bind("<Button-4>", lambda e: self.scroll(-1))
+        self.listbox.bind("<Button-5>", lambda e: self.scroll(1))
+
+    def set_items(self, items):
+        self.items = items
+        self.top = 0
+        self.selected = -1
+        self.listbox.config(height=max(1, min(self.rows, len(items))))
+        if len(items) > self.rows:
+            self.scrollbar.pack(side="right", fill="y")
         else:
-            new_col = interpolate_color(self.start_hex, self.target_hex, elapsed)
-            self.itemconfig(self.rect, fill=new_col)
-            self.after(16, self.animate) # ~60 FPS
+            self.scrollbar.pack_forget()
+        self.render()
+
+    def render(self):
+        visible = [label for _, label in self.items[self.top:self.top + self.rows]]
+        if visible != self.rendered:
+            self.listbox.delete(0, tk.END)
+            self.listbox.insert(tk.END, *visible)
+            self.rendered = visible
+        self.listbox.selection_clear(0, tk.END)
+        if self.top <= self.selected < self.top + self.rows:
+            self.listbox.selection_set(self.selected - self.top)
+        if self.items:
+            total = len(self.items)
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.rows) / total))
+
+    def scroll(self, delta):
+        self.top = max(0, min(self.top + delta, len(self.items) - self.rows))
+        self.render()
+        return "break"
+
+    def on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.top = int(float(value) * len(self.items))
+            self.scroll(0)
+        elif action == "scroll":
+            self.scroll(int(value) * (self.rows if unit == "pages" else 1))
+
+    def move_selection(self, delta):
+        if not self.items: return
+        self.selected = max(0, min(self.selected + delta, len(self.items) - 1))
+        if self.selected < self.top:
+            self.top = self.selected
+        elif self.selected >= self.top + self.rows:
+            self.top = self.selected - self.rows + 1
+        self.render()
+
+    def on_select(self, event=None):
+        selection = self.listbox.curselection()
+        if selection:
+            self.selected = self.top + selection[0]
+            self.pick()
+
+    def pick(self):
+        if 0 <= self.selected < len(self.items) and self.on_pick:
+            self.on_pick(self.items[self.selected][0])
 
 class GameSimulatorApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Game Presence Simulator")
-        self.root.geometry("450x420")
+        self.root.geometry(f"{APP_WIDTH}x{APP_HEIGHT}")
         self.root.configure(bg=THEME["bg_main"])
         
-        # Fade In Effect variables
-        self.alpha = 0.0
+        self.startup_marks = {}
+        
+        # Fade In Effect variables (fast-start: langsung tampil penuh)
+        self.alpha = 1.0 if FAST_START else 0.0
         self.root.attributes("-alpha", self.alpha)
         
         # Frameless Logic
         self.root.overrideredirect(True)
         self.center_window()
-        self.force_taskbar_appearance() 
+        if FAST_START:
+            self.root.after_idle(self.force_taskbar_appearance)
+        else:
+            self.force_taskbar_appearance() 
 
         # Drag Logic
         self.offset_x = 0
         self.offset_y = 0
 
         # App Logic
-        self.running_process = None
-        self.temp_exe_name = "" 
-        self.anim_job = None
-        self.pulse_time = 0
-        self.history = self.load_history() # Load History
+        self.artifacts = ArtifactCache(os.path.join(user_data_dir(), "artifacts"))
+        self.sessions = self.create_session_manager()
+        self.ui_queue = queue.SimpleQueue()
+        self.lifecycle = LifecycleWorker(self.sessions, self.post_to_ui)
+        self.sessions.on_exit = lambda session: self.post_to_ui(self.on_session_exited, session)
+        self.pending = {}       # nama -> "starting" / "stopping"
+        self.closing = False    # True setelah on_close: worker tidak boleh menyentuh Tk lagi
+        self.teardown_done = threading.Event()
+        self.launch_errors = {} # error launch yang dikumpulkan sampai batch selesai
+        if int(CONFIG["pool_size"]) > 0 and not getattr(self.sessions, "detached", False):
+            self.root.after_idle(self.start_pool)
+        self.metrics = MetricsExporter(self.sessions)
+        if not getattr(self.sessions, "detached", False):
+            self.root.after_idle(self.metrics.start)
+        self.scheduler = AnimationScheduler.for_widget(self.root)
+        self.pulse_ramp = ColorRamp.get("#006400", "#00FF00")
+        self.pulse_start = 0
+        self.usage_text = ""
+        self.last_usage_sample = 0
+        self.usage_sampling = False # True selagi thread sampler berjalan
+        # Load History (hanya top-N dari index, kompaksi ekor log di background)
+        self.history_store = HistoryStore(user_data_dir())
+        self.history = self.history_store.top(HISTORY_LIMIT)
+        if self.history_store.pending_events:
+            self.root.after_idle(self.history_store.compact_async)
         
         # Input Variable untuk Real-time Tracking
         self.game_name_var = tk.StringVar()
         self.game_name_var.trace_add("write", self.update_button_states)
+        self.completion = None # CompletionIndex, dibangun di background
+        self.suppress_suggest = True # Jangan tampilkan saran saat nilai awal di-set
 
         self.setup_ui()
         self.fade_in_window()
         
         # Set initial value based on history or default
-        last_game = self.history[0] if self.history else "Valorant.exe"
+        last_game = self.history_store.most_recent() or "Valorant.exe"
         self.game_name_var.set(last_game)
+        self.suppress_suggest = False
+        self.game_name_var.trace_add("write", self.on_query_changed)
+        self.root.after_idle(self.load_completion_index)
         
         # Global click bind to close history
         self.root.bind("<Button-1>", self.on_root_click)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.bind("<<LifecycleEvent>>", self.drain_ui_queue)
 
-    def load_history(self):
-        """Memuat riwayat dari file JSON"""
-        if os.path.exists(HISTORY_FILE):
-            try:
-                with open(HISTORY_FILE, 'r') as f:
-                    data = json.load(f)
-                    return data if isinstance(data, list) else []
-            except:
-                return []
-        return []
-
-    def save_history(self):
-        """Menyimpan riwayat ke file JSON"""
-        try:
-            with open(HISTORY_FILE, 'w') as f:
-                json.dump(self.history, f)
-        except:
-            pass
+        self.mark_startup("ui_built")
+        self.root.after_idle(self.mark_startup, "first_frame")
+        if FAST_START:
+            self.root.after_idle(self.mark_startup, "interactive")
+
+    def mark_startup(self, stage):
+        """Catat waktu (ms sejak proses mulai) untuk tahap startup: ui_built / first_frame / interactive"""
+        if stage not in self.startup_marks:
+            self.startup_marks[stage] = (time.perf_counter() - STARTUP_T0) * 1000
+        if "--startup-probe" in sys.argv and stage == "interactive":
+            self.root.after_idle(self.finish_startup_probe)
+
+    def finish_startup_probe(self):
+        print(json.dumps(self.startup_marks))
+        sys.stdout.flush()
+        self.root.destroy()
+
+    def create_session_manager(self):
+        """SessionManager lokal, atau client daemon jika --connect / use_daemon dan daemon aktif"""
+        if "--connect" in sys.argv or CONFIG["use_daemon"]:
+            if daemon_request({"op": "ping"}, quiet=True):
+                manager = RemoteSessionManager()
+                manager.sample_usage()
+                if len(manager):
+                    self.root.after_idle(self.start_status_animation)
+                    self.root.after_idle(self.refresh_session_rows)
+                return manager
+            print("Daemon not reachable, using local sessions")
+        return local_session_manager(self.artifacts)
+
+    def start_pool(self):
+        self.sessions.pool = DummyPool(self.sessions)
+        self.sessions.pool.warm([normalize_game_name(n) for n in CONFIG["pool_games"]])
 
     def add_to_history(self, game_name):
-        """Menambahkan game ke riwayat (Unik & FIFO)"""
-        if game_name in self.history:
-            self.history.remove(game_name)
-        self.history.insert(0, game_name)
-        
-        # Batasi riwayat hanya 5 item terakhir
-        if len(self.history) > 5:
-            self.history = self.history[:5]
-        
-        self.save_history()
+        """Catat launch ke HistoryStore & perbarui daftar popup (urut frecency)"""
+        self.history_store.record_launch(game_name)
+        self.history = self.history_store.top(HISTORY_LIMIT)
 
     def force_taskbar_appearance(self):
         try:
@@ -257,17 +3384,25 @@ class GameSimulatorApp:
             print(f"Taskbar fix error: {e}")
 
     def center_window(self):
-        self.root.update_idletasks()
-        w, h = 450, 420
+        # Ukuran window sudah fixed, jadi tidak perlu update_idletasks() sebelum menghitung posisi
+        w, h = APP_WIDTH, APP_HEIGHT
         x = (self.root.winfo_screenwidth() // 2) - (w // 2)
         y = (self.root.winfo_screenheight() // 2) - (h // 2)
         self.root.geometry(f'{w}x{h}+{int(x)}+{int(y)}')
 
     def fade_in_window(self):
         if self.alpha < 1.0:
-            self.alpha += 0.05
-            self.root.attributes("-alpha", self.alpha)
-            self.root.after(20, self.fade_in_window)
+            self.scheduler.start("fade", self.fade_step, interval_ms=20)
+        else:
+            self.mark_startup("interactive")
+
+    def fade_step(self, now):
+        self.alpha = min(1.0, self.alpha + 0.05)
+        self.root.attributes("-alpha", self.alpha)
+        if self.alpha >= 1.0:
+            self.mark_startup("interactive")
+            return False
+        return True
 
     def setup_ui(self):
         # --- TITLE BAR ---
@@ -324,14 +3459,13 @@ class GameSimulatorApp:
         
         tk.Frame(self.input_container, bg=THEME["primary"], height=2).pack(fill="x")
 
-        # --- HISTORY LISTBOX (Hidden by default) ---
-        self.history_frame = tk.Frame(self.root, bg=THEME["primary"]) # Frame tipis untuk border ungu
-        self.history_listbox = tk.Listbox(self.history_frame, font=(THEME["font_family"], 11),
-                                          bg=THEME["bg_popup"], fg=THEME["text_main"],
-                                          selectbackground=THEME["primary"], selectforeground="white",
-                                          highlightthickness=0, bd=0, activestyle="none", height=5)
-        self.history_listbox.pack(fill="both", expand=True, padx=1, pady=1)
-        self.history_listbox.bind("<<ListboxSelect>>", self.on_history_select)
+        # --- HISTORY / AUTOCOMPLETE POPUP (Hidden by default) ---
+        self.history_frame = VirtualList(self.root, rows=6, on_pick=self.on_history_select)
+        self.history_listbox = self.history_frame.listbox
+        self.entry_name.bind("<Down>", lambda e: self.history_frame.move_selection(1))
+        self.entry_name.bind("<Up>", lambda e: self.history_frame.move_selection(-1))
+        self.entry_name.bind("<Return>", self.on_entry_return)
+        self.entry_name.bind("<Escape>", lambda e: self.hide_history_popup())
 
         # --- ACTIONS AREA ---
         action_frame = tk.Frame(main_frame, bg=THEME["bg_main"])
@@ -341,15 +3475,42 @@ class GameSimulatorApp:
                                       width=220, height=45, bg_color=THEME["secondary"], hover_color="#00C853", text_color="black")
         self.btn_start.pack(pady=5)
 
-        self.btn_stop = SmoothButton(action_frame, text="STOP PROCESS", command=self.stop_simulation, 
+        self.btn_stop = SmoothButton(action_frame, text="STOP ALL", command=self.stop_simulation, 
                                      width=220, height=45, bg_color=THEME["danger"], hover_color=THEME["danger_hover"], text_color="black")
         self.btn_stop.pack(pady=5)
+
+        # --- SESSIONS LIST (satu baris per game yang jalan) ---
+        self.lbl_sessions = tk.Label(main_frame, text="ACTIVE SESSIONS (0)", bg=THEME["bg_main"], fg=THEME["primary"],
+                                     font=(THEME["font_family"], 8))
+        self.lbl_sessions.pack(anchor="w")
+        self.sessions_frame = tk.Frame(main_frame, bg=THEME["bg_surface"], height=110)
+        self.sessions_frame.pack(fill="x", pady=(2, 0))
+        self.sessions_frame.pack_propagate(False)
+        self.session_rows = {}
+        self.exited = {} # nama -> Session yang mati sendiri, ditampilkan sebentar dengan exit code-nya
+
+        # --- STATS (latensi launch/stop & cache, dari SessionManager) ---
+        self.lbl_stats = tk.Label(main_frame, text="", bg=THEME["bg_main"], fg=THEME["text_dim"],
+                                  font=(THEME["font_family"], 7), anchor="w")
+        self.lbl_stats.pack(fill="x", pady=(3, 0))
+
+        # Properti widget yang berubah-ubah di-update lewat ViewModel (hanya yang berbeda, maks 1x per frame)
+        self.view = ViewModel(self.root)
+        self.view.bind("start_state", self.btn_start.set_state)
+        self.view.bind("stop_state", self.btn_stop.set_state)
+        self.view.bind("status", lambda v: self.lbl_status_text.config(text=v[0], fg=v[1]))
+        self.view.bind("status_dot", lambda color: self.status_canvas.itemconfig(self.status_dot, fill=color))
+        self.view.bind("sessions_title", lambda text: self.lbl_sessions.config(text=text))
+        self.view.bind("stats", lambda text: self.lbl_stats.config(text=text))
+        self.view.applied.update({"start_state": "normal", "stop_state": "normal", "status_dot": "#444444",
+                                  "status": ("OFFLINE / IDLE", THEME["text_dim"]),
+                                  "sessions_title": "ACTIVE SESSIONS (0)", "stats": ""})
         
         self.update_button_states()
 
         # --- FOOTER (Source Code Button) ---
         footer_frame = tk.Frame(self.root, bg=THEME["bg_main"])
-        footer_frame.pack(side="bottom", pady=25)
+        footer_frame.pack(side="bottom", pady=20)
         
         self.btn_source = SmoothButton(footer_frame, text="SOURCE CODE", 
                                        command=lambda: webbrowser.open("https://github.com/DEX-1101/discord-game-spoofer"),
@@ -359,14 +3520,42 @@ class GameSimulatorApp:
                                        text_color="white")
         self.btn_source.pack()
 
-    # --- HISTORY LOGIC ---
+    # --- HISTORY & AUTOCOMPLETE LOGIC ---
+    def load_completion_index(self):
+        """Bangun index katalog di background agar tidak menunda frame pertama"""
+        def build():
+            self.completion = build_completion_index(self.history_store.ranked())
+        threading.Thread(target=build, daemon=True).start()
+
+    def current_segment(self):
+        """Bagian input setelah koma terakhir (yang sedang diketik)"""
+        return self.game_name_var.get().replace(";", ",").rsplit(",", 1)[-1].strip()
+
     def show_history_popup(self, event=None):
         if not self.history: return # Jangan muncul jika kosong
-        
-        # Reset listbox
-        self.history_listbox.delete(0, tk.END)
-        for item in self.history:
-            self.history_listbox.insert(tk.END, item)
+        self.show_suggestions([(name, name) for name in self.history])
+
+    def on_query_changed(self, *args):
+        """Dipanggil tiap keystroke (trace game_name_var): persempit saran tanpa scan ulang"""
+        if self.suppress_suggest: return
+        query = self.current_segment()
+        if not query:
+            self.hide_history_popup()
+            return
+        q = query.lower()
+        items = [(name, name) for name in self.history if q in name.lower()]
+        if self.completion:
+            known = {name for name, _ in items}
+            for exe, title in self.completion.query(query, limit=SUGGEST_LIMIT):
+                if exe not in known:
+                    items.append((exe, f"{exe}  —  {title}" if title else exe))
+        if items and not (len(items) == 1 and items[0][0].lower() == q):
+            self.show_suggestions(items)
+        else:
+            self.hide_history_popup()
+
+    def show_suggestions(self, items):
+        self.history_frame.set_items(items)
             
         # Hitung posisi absolute entry
         x = self.entry_name.winfo_rootx() - self.root.winfo_rootx()
@@ -380,44 +3569,45 @@ class GameSimulatorApp:
     def hide_history_popup(self):
         self.history_frame.place_forget()
 
-    def on_history_select(self, event):
-        selection = self.history_listbox.curselection()
-        if selection:
-            data = self.history_listbox.get(selection[0])
-            self.game_name_var.set(data)
+    def on_history_select(self, data):
+        """Ganti segmen yang sedang diketik dengan pilihan dari popup"""
+        head = self.game_name_var.get().replace(";", ",").rsplit(",", 1)
+        value = f"{head[0]}, {data}" if len(head) > 1 else data
+        self.suppress_suggest = True
+        try:
+            self.game_name_var.set(value)
+        finally:
+            self.suppress_suggest = False
+        self.hide_history_popup()
+        self.root.focus() # Hilangkan fokus dari entry agar popup tidak muncul lagi seketika
+
+    def on_entry_return(self, event=None):
+        if self.history_frame.winfo_ismapped() and self.history_frame.selected >= 0:
+            self.history_frame.pick()
+        else:
             self.hide_history_popup()
-            self.root.focus() # Hilangkan fokus dari entry agar popup tidak muncul lagi seketika
+            if not self.btn_start.is_disabled:
+                self.start_simulation()
+        return "break"
 
     def on_root_click(self, event):
         """Menutup popup jika klik di luar area entry atau listbox"""
         try:
             widget = event.widget
             # Jika yang diklik bukan entry dan bukan bagian dari listbox
-            if widget != self.entry_name and widget != self.history_listbox:
+            if widget not in (self.entry_name, self.history_listbox, self.history_frame.scrollbar):
                 self.hide_history_popup()
         except:
             pass
 
     # --- LOGIC UTAMA ---
     def update_button_states(self, *args):
-        # FIX: Sembunyikan history popup saat user mulai mengetik (trace triggered)
-        self.hide_history_popup()
-
         input_text = self.game_name_var.get().strip()
-        is_running = self.running_process is not None
+        is_running = len(self.sessions) > 0 or bool(self.pending)
 
-        if is_running:
-            self.btn_start.set_state("disabled")
-            self.btn_stop.set_state("normal")
-            self.entry_name.config(state="disabled", disabledbackground=THEME["bg_main"], disabledforeground=THEME["secondary"])
-            self.hide_history_popup() # Sembunyikan jika game jalan
-        else:
-            self.btn_stop.set_state("disabled")
-            self.entry_name.config(state="normal", bg=THEME["bg_surface"], fg="white")
-            if input_text:
-                self.btn_start.set_state("normal")
-            else:
-                self.btn_start.set_state("disabled")
+        # Tombol start tetap aktif saat ada game jalan agar bisa menambah sesi baru
+        self.view.set("start_state", "normal" if input_text else "disabled")
+        self.view.set("stop_state", "normal" if is_running else "disabled")
 
     def start_move(self, event):
         self.offset_x = event.x
@@ -429,133 +3619,249 @@ class GameSimulatorApp:
         y = self.root.winfo_y() + event.y - self.offset_y
         self.root.geometry(f"+{x}+{y}")
 
-    def animate_status(self):
-        if self.running_process:
-            self.pulse_time += 0.15
-            intensity = (math.sin(self.pulse_time) + 1) / 2 
-            col = interpolate_color("#006400", "#00FF00", intensity)
-            
-            self.status_canvas.itemconfig(self.status_dot, fill=col)
-            
-            game_name = os.path.basename(self.temp_exe_name)
-            self.lbl_status_text.config(text=f"PLAYING: {game_name}", fg=THEME["text_main"])
-            
-            self.anim_job = self.root.after(50, self.animate_status)
-        else:
-            self.lbl_status_text.config(text="OFFLINE / IDLE", fg=THEME["text_dim"])
-            self.status_canvas.itemconfig(self.status_dot, fill="#444444")
+    def start_status_animation(self):
+        if not self.scheduler.is_active("status"):
+            self.pulse_start = time.perf_counter()
+            self.scheduler.start("status", self.animate_status, interval_ms=50)
 
-    def start_simulation(self):
-        filename_input = self.game_name_var.get().strip()
-        if not filename_input: return
-        if not filename_input.endswith(".exe"): filename_input += ".exe"
+    def animate_status(self, now):
+        if not len(self.sessions):
+            self.reset_status()
+            return False
 
-        # Simpan ke history sebelum jalan
-        self.add_to_history(filename_input)
+        # ~3 rad/detik, sama dengan pulse lama (0.15 per 50ms)
+        intensity = (math.sin((now - self.pulse_start) * 3) + 1) / 2 
+        self.view.set("status_dot", self.pulse_ramp.at(intensity))
+        
+        # Sampling RSS/CPU dummy secukupnya (bukan tiap frame) & di luar thread Tk
+        wall = time.time()
+        if wall - self.last_usage_sample >= USAGE_SAMPLE_INTERVAL and not self.usage_sampling:
+            self.last_usage_sample = wall
+            self.usage_sampling = True
+            threading.Thread(target=self.sample_usage_worker, daemon=True).start()
+        
+        names = self.sessions.names()
+        label = names[0] if len(names) == 1 else f"{len(names)} GAMES"
+        self.view.set("status", (f"PLAYING: {label}{self.usage_text}", THEME["text_main"]))
+        return True
 
-        temp_dir = tempfile.gettempdir()
-        target_path = os.path.join(temp_dir, filename_input)
+    def sample_usage_worker(self):
+        try:
+            sessions = self.sessions.sample_usage()
+        except Exception:
+            sessions = None
+        self.post_to_ui(self.on_usage_sampled, sessions)
 
-        # Hapus file lama jika ada
-        if os.path.exists(target_path):
-            try:
-                os.remove(target_path)
-            except:
-                messagebox.showerror("Error", "File is locked. Close it in Task Manager.")
-                return
+    def on_usage_sampled(self, sessions):
+        self.usage_sampling = False
+        if sessions is None: return
+        usages = [s.usage for s in sessions if s.usage]
+        self.usage_text = f"  ·  {format_bytes(sum(u[0] for u in usages))}" if usages else ""
+        self.refresh_session_rows()
 
-        try:
-            # COPY EXECUTABLE SAAT INI (Baik itu python.exe atau Aplikasi.exe)
-            shutil.copy(sys.executable, target_path)
-            self.temp_exe_name = target_path
+    def reset_status(self):
+        self.view.set("status", ("OFFLINE / IDLE", THEME["text_dim"]))
+        self.view.set("status_dot", "#444444")
 
-            # LOGIKA UNTUK MENJALANKAN DUMMY PROCESS
-            # Jika dijalankan sebagai EXE (frozen), kita tidak bisa pakai -c.
-            # Kita harus pakai argumen khusus --dummy-mode.
-            
-            if getattr(sys, 'frozen', False):
-                # MODE EXE (Compiled)
-                # Jalankan target_path dengan argumen --dummy-mode
-                cmd = [self.temp_exe_name, "--dummy-mode"]
+    def refresh_session_rows(self):
+        """Sinkronkan baris di panel sesi dengan isi SessionManager & job yang masih berjalan"""
+        sessions = self.sessions.snapshot()
+        names = list(sessions) + [n for n in self.pending if n not in sessions]
+        names += [n for n in self.exited if n not in names]
+        for name in list(self.session_rows):
+            if name not in names:
+                self.session_rows.pop(name)[0].destroy()
+                self.view.unbind(("row", name))
+
+        for name in names:
+            if name not in self.session_rows:
+                row = tk.Frame(self.sessions_frame, bg=THEME["bg_surface"])
+                row.pack(fill="x", padx=8, pady=1)
+                lbl = tk.Label(row, bg=THEME["bg_surface"], fg=THEME["text_main"], anchor="w",
+                               font=(THEME["font_family"], 9))
+                lbl.pack(side="left", fill="x", expand=True)
+                btn = tk.Label(row, text="✕", bg=THEME["bg_surface"], fg=THEME["text_dim"], font=("Arial", 10), cursor="hand2")
+                btn.pack(side="right")
+                btn.bind("<Button-1>", lambda e, n=name: self.stop_session(n))
+                btn.bind("<Enter>", lambda e, b=btn: b.config(fg=THEME["danger"]))
+                btn.bind("<Leave>", lambda e, b=btn: b.config(fg=THEME["text_dim"]))
+                self.session_rows[name] = (row, lbl)
+                self.view.bind(("row", name), lambda text, l=lbl: l.config(text=text))
+
+            session = sessions.get(name)
+            if name in self.exited and name not in self.pending and not session:
+                exited = self.exited[name]
+                mins, secs = divmod(int(exited.uptime()), 60)
+                text = f"{name}  ·  exited (code {exited.exit_code}) after {mins:02d}:{secs:02d}"
+            elif name in self.pending or not session:
+                text = f"{name}  ·  {self.pending.get(name, 'starting')}..."
             else:
-                # MODE SCRIPT (Development)
-                # Jika development, sys.executable adalah python.exe
-                # Kita harus menyertakan script ini sendiri
-                current_script = os.path.abspath(__file__)
-                cmd = [self.temp_exe_name, current_script, "--dummy-mode"]
-            
-            # Jalankan tanpa creationflags khusus agar window behavior normal (biar child handle sendiri)
-            # Jika ingin menyembunyikan console di dev mode, bisa pakai flags, tapi untuk PyInstaller --windowed aman.
-            creation_flags = 0
-            if os.name == 'nt':
-                 # Opsional: Jika ingin benar-benar no window untuk process, tapi kita punya GUI di child
-                 # jadi biarkan default atau gunakan DETACHED_PROCESS jika perlu.
-                 # 0x08000000 = CREATE_NO_WINDOW
-                 creation_flags = 0x08000000 
-            
-            self.running_process = subprocess.Popen(cmd, creationflags=creation_flags)
+                mins, secs = divmod(int(session.uptime()), 60)
+                usage = f"  ·  {format_bytes(session.usage[0])} · CPU {session.usage[1]:.1f}s" if session.usage else ""
+                text = f"{name}  ·  {mins:02d}:{secs:02d}{usage}"
+                if session.policy_problems:
+                    text += f"  ·  ⚠ {', '.join(session.policy_problems)}"
+            self.view.set(("row", name), text)
 
-            self.pulse_time = 0
-            self.animate_status()
-            self.update_button_states()
+        self.view.set("sessions_title", f"ACTIVE SESSIONS ({len(sessions)})")
+        self.view.set("stats", metrics_summary(self.sessions))
 
-        except Exception as e:
-            messagebox.showerror("Fail", str(e))
-            self.cleanup()
+    # --- LIFECYCLE (dijalankan LifecycleWorker, hasil kembali ke thread Tk) ---
+    def post_to_ui(self, fn, *args):
+        """Dipanggil dari thread worker: antrikan fn untuk dijalankan di thread Tk"""
+        if self.closing:
+            return # event_generate dari thread lain menunggu thread Tk, yang sedang menutup app
+        self.ui_queue.put((fn, args))
+        try:
+            self.root.event_generate("<<LifecycleEvent>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass # Window sudah ditutup
 
-    def stop_simulation(self):
-        # UPDATE: Gunakan TASKKILL untuk mematikan tree process secara paksa
-        # Ini mengatasi masalah pada PyInstaller one-file dimana child process (Python payload)
-        # tidak ikut mati saat terminate() dipanggil pada parent (Bootloader).
-        if self.running_process:
+    def drain_ui_queue(self, event=None):
+        while not self.closing:
             try:
-                if os.name == 'nt':
-                    # /F = Force, /T = Tree (Kill children), /PID = Process ID
-                    # Gunakan creationflags=0x08000000 untuk menyembunyikan console window taskkill
-                    subprocess.call(
-                        ["taskkill", "/F", "/T", "/PID", str(self.running_process.pid)],
-                        stdout=subprocess.DEVNULL, 
-                        stderr=subprocess.DEVNULL,
-                        creationflags=0x08000000
-                    )
-                else:
-                    self.running_process.terminate()
-            except Exception:
-                # Fallback jika taskkill gagal
-                try: self.running_process.terminate() 
-                except: pass
-            
-            self.running_process = None
-        
-        if self.anim_job:
-            self.root.after_cancel(self.anim_job)
-            self.anim_job = None
-        
-        self.cleanup()
-        
-        # Reset Status
-        self.lbl_status_text.config(text="OFFLINE / IDLE", fg=THEME["text_dim"])
-        self.status_canvas.itemconfig(self.status_dot, fill="#444444")
-        
+                fn, args = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            fn(*args)
+
+    def start_simulation(self):
+        names = parse_game_list(self.game_name_var.get())
+        names = [n for n in names if n not in self.sessions.names() and self.pending.get(n) != "starting"]
+        if not names: return
+
+        # Simpan ke history sebelum jalan
+        for name in names:
+            self.add_to_history(name)
+
+        # Batch berjalan paralel di worker (batas CONFIG["launch_concurrency"])
+        for name in names:
+            self.exited.pop(name, None)
+            if self.lifecycle.launch(name, self.on_launch_done):
+                self.pending[name] = "starting"
+        self.refresh_session_rows()
         self.update_button_states()
 
-    def cleanup(self):
-        if self.temp_exe_name and os.path.exists(self.temp_exe_name):
-            try:
-                for _ in range(3):
-                    try: os.remove(self.temp_exe_name); break
-                    except: time.sleep(0.5)
-            except: pass
+    def on_launch_done(self, name, session, error):
+        if self.pending.get(name) == "starting":
+            del self.pending[name]
+        if error:
+            self.launch_errors[name] = error
+        if self.launch_errors and "starting" not in self.pending.values():
+            errors, self.launch_errors = self.launch_errors, {}
+            messagebox.showerror("Fail", "\n".join(f"{n}: {msg}" for n, msg in errors.items()))
+
+        if session:
+            self.last_usage_sample = 0
+            self.usage_text = ""
+            self.start_status_animation()
+        self.after_sessions_changed()
+
+    def stop_session(self, game_name):
+        """Stop satu game dari panel sesi (di background)"""
+        if self.exited.pop(game_name, None) and game_name not in self.sessions.names():
+            self.refresh_session_rows() # ✕ pada baris yang sudah exit: cukup tutup barisnya
+            return
+        if self.lifecycle.stop(game_name, self.on_stop_done):
+            self.pending[game_name] = "stopping"
+        self.refresh_session_rows()
+
+    def stop_simulation(self):
+        """Stop semua game yang sedang berjalan"""
+        for name in self.sessions.names():
+            self.stop_session(name)
+        if self.sessions.pool: # Worker standby game lain juga terlihat "playing"
+            self.lifecycle.executor.submit(self.sessions.pool.discard)
+
+    def on_stop_done(self, name, session, error):
+        if self.pending.get(name) == "stopping":
+            del self.pending[name]
+        if session:
+            self.history_store.record_end(name, session.uptime(), session.exit_code)
+        self.after_sessions_changed()
+
+    def on_session_exited(self, session):
+        """Dummy mati sendiri (crash / window ditutup): tampilkan exit code sebentar di barisnya"""
+        self.pending.pop(session.name, None)
+        self.history_store.record_end(session.name, session.uptime(), session.exit_code)
+        self.exited[session.name] = session
+        self.root.after(EXITED_ROW_MS, lambda: self.forget_exited(session))
+        self.after_sessions_changed()
+
+    def forget_exited(self, session):
+        if self.exited.get(session.name) is session:
+            del self.exited[session.name]
+            self.refresh_session_rows()
+
+    def after_sessions_changed(self):
+        if not len(self.sessions):
+            self.scheduler.stop("status")
+            # Reset Status
+            self.reset_status()
+        self.refresh_session_rows()
+        self.update_button_states()
 
     def on_close(self):
-        self.stop_simulation()
+        # Sembunyikan window dulu, lalu teardown di thread lain sementara event loop Tk tetap jalan:
+        # job lifecycle yang sedang berjalan mungkin masih menunggu event_generate-nya dilayani
+        if self.closing: return
+        self.closing = True
+        self.root.withdraw()
+        threading.Thread(target=self.teardown, name="teardown").start()
+        self.root.after(50, self.finish_close)
+
+    def teardown(self):
+        """Stop semua job & dummy agar tidak ada yang tertinggal (thread non-Tk)"""
+        try:
+            self.lifecycle.shutdown()
+            if not getattr(self.sessions, "detached", False):
+                for session in self.sessions.snapshot().values():
+                    self.history_store.record_end(session.name, session.uptime())
+            self.sessions.shutdown()
+            self.metrics.stop()
+        finally:
+            self.teardown_done.set()
+
+    def finish_close(self):
+        if not self.teardown_done.is_set():
+            self.root.after(50, self.finish_close)
+            return
         self.root.destroy()
 
 if __name__ == "__main__":
     # CEK ARGUMEN UNTUK MENENTUKAN MODE (MAIN APP atau DUMMY GAME)
-    if "--dummy-mode" in sys.argv:
-        run_dummy_mode()
+    # (--dummy-mode sudah ditangani di awal file sebelum import berat)
+    if "--measure-dummy" in sys.argv:
+        measure_dummy_footprint()
+    elif "--cache-stats" in sys.argv:
+        print_cache_stats()
+    elif "--measure-launch" in sys.argv:
+        measure_launch_latency()
+    elif "--check-startup" in sys.argv:
+        sys.exit(check_startup())
+    elif "--daemon" in sys.argv:
+        sys.exit(run_daemon())
+    elif "--quest" in sys.argv:
+        specs = [a for a in sys.argv[sys.argv.index("--quest") + 1:] if not a.startswith("--")]
+        sys.exit(run_quests(specs))
+    elif "--ctl" in sys.argv:
+        sys.exit(daemon_ctl(sys.argv[sys.argv.index("--ctl") + 1:]))
+    elif "--import-catalog" in sys.argv:
+        source = sys.argv[sys.argv.index("--import-catalog") + 1]
+        import_catalog(source, compact="--compact" in sys.argv)
     else:
+        profiler = None
+        if "--profile" in sys.argv:
+            # discordGS.py --profile [timeline.json]
+            args = sys.argv[sys.argv.index("--profile") + 1:]
+            path = args[0] if args and not args[0].startswith("--") else \
+                os.path.join(user_data_dir(), f"profile-{time.strftime('%Y%m%d-%H%M%S')}.json")
+            profiler = TkProfiler(path).install()
         root = tk.Tk()
         app = GameSimulatorApp(root)
-        root.mainloop()
\ No newline at end of file
+        if profiler:
+            profiler.start_probe(root)
+        root.mainloop()
+        if profiler:
+            profiler.write()
+            profiler.report()
\ No newline at end of file
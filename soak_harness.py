@@ -0,0 +1,216 @@
+"""
+Soak / stress test headless: berapa banyak dummy yang sanggup dijalankan bersamaan di mesin ini.
+
+Jumlah dummy dinaikkan bertahap (--step sampai --max) lewat SessionManager.launch_many,
+tiap level ditahan selama --hold detik sambil mencatat:
+  dummy RSS/CPU  - total & per dummy (sample_usage, sama dengan panel sesi di GUI)
+  controller     - RSS, jumlah FD terbuka & jumlah thread proses ini
+  latensi        - launch p95 untuk dummy baru, durasi sample_usage, dan lag thread controller
+                   (sleep 10 ms berulang; keterlambatan = kontensi GIL/CPU di controller)
+  kegagalan      - launch error & dummy yang mati sendiri selama hold
+  artifact       - jumlah file & byte di <workdir>/artifacts (cache executable milik ArtifactCache)
+Setelah semua di-stop dicek sisa proses dummy, file di registry & file temp yang tertinggal,
+serta isi direktori artifact: file di luar index cache (.part / bocor) & total byte dibanding budget.
+Level pertama yang melewati batas (--max-launch-ms / --max-lag-ms / error) dilaporkan sebagai titik patah.
+
+Contoh:
+  python soak_harness.py --step 8 --max 64 --hold 30
+  python soak_harness.py --step 16 --max 256 --hold 600 --output soak.json   # multi-jam: naikkan --hold
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import tempfile
+import threading
+import time
+
+import discordGS as app
+
+def open_fds():
+    for folder in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(folder))
+        except OSError:
+            continue
+    return None
+
+class LagProbe:
+    """Thread yang tidur 10 ms berulang & mencatat keterlambatannya bangun"""
+    INTERVAL = 0.01
+
+    def __init__(self):
+        self.samples = []
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while not self.stopping.is_set():
+            t0 = time.perf_counter()
+            time.sleep(self.INTERVAL)
+            self.samples.append(max(0.0, time.perf_counter() - t0 - self.INTERVAL))
+
+    def take(self):
+        samples, self.samples = self.samples, []
+        return samples
+
+    def stop(self):
+        self.stopping.set()
+        self.thread.join()
+
+def hold_level(manager, probe, hold, interval):
+    """Tahan level sekarang, return dict ringkasan sampel"""
+    rows = []
+    end = time.perf_counter() + hold
+    while True:
+        t0 = time.perf_counter()
+        sessions = manager.sample_usage()
+        sample_ms = (time.perf_counter() - t0) * 1000
+        usages = [s.usage for s in sessions if s.usage]
+        own = app._single_process_usage(os.getpid())
+        rows.append({
+            "dummy_rss": sum(u[0] for u in usages),
+            "dummy_cpu": sum(u[1] for u in usages),
+            "controller_rss": own[0] if own else None,
+            "fds": open_fds(),
+            "threads": threading.active_count(),
+            "sample_ms": sample_ms,
+        })
+        if time.perf_counter() >= end:
+            break
+        time.sleep(min(interval, max(0, end - time.perf_counter())))
+    lags = probe.take()
+    last = rows[-1]
+    return {
+        "dummy_rss": last["dummy_rss"],
+        "dummy_cpu_per_s": (last["dummy_cpu"] - rows[0]["dummy_cpu"]) / hold if hold else 0.0,
+        "controller_rss": last["controller_rss"],
+        "fds": last["fds"],
+        "threads": last["threads"],
+        "sample_ms_p95": app.percentile([r["sample_ms"] for r in rows], 95),
+        "lag_ms_p95": (app.percentile(lags, 95) or 0) * 1000,
+        "lag_ms_max": max(lags) * 1000 if lags else 0,
+    }
+
+def artifact_usage(cache):
+    """File di direktori artifact: jumlah, byte di disk (hardlink ke source = 0) & file di luar index cache"""
+    try:
+        src = os.stat(cache.source)
+    except OSError:
+        src = None
+    entries = cache.index["entries"]
+    files = disk = stray = 0
+    for folder, _, names in os.walk(cache.root):
+        for name in names:
+            path = os.path.join(folder, name)
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            files += 1
+            if not (src and (st.st_dev, st.st_ino) == (src.st_dev, src.st_ino)):
+                disk += st.st_size
+            key = os.path.relpath(path, cache.root).replace(os.sep, "/")
+            if key not in entries and not key.startswith(cache.INDEX_NAME):
+                stray += 1
+    return {"files": files, "bytes": disk, "stray": stray}
+
+def leftovers(workdir, prefix, cache):
+    """Sisa setelah teardown: proses dummy yang masih hidup, file temp/registry & isi direktori artifact"""
+    alive = [pid for pid, _, name in app.list_processes() if name.startswith(prefix[:15])]
+    temp_files = [f for f in os.listdir(tempfile.gettempdir()) if f.startswith(prefix)]
+    registry = os.path.join(workdir, "sessions")
+    registry_files = os.listdir(registry) if os.path.isdir(registry) else []
+    artifacts = artifact_usage(cache)
+    return {"processes": len(alive), "temp_files": len(temp_files), "registry_files": len(registry_files),
+            "artifact_files": artifacts["files"], "artifact_bytes": artifacts["bytes"],
+            "artifact_stray": artifacts["stray"]}
+
+def main():
+    parser = argparse.ArgumentParser(description="Scale/soak harness for discordGS dummies")
+    parser.add_argument("--step", type=int, default=8, help="Dummy tambahan per level")
+    parser.add_argument("--max", type=int, default=64, help="Jumlah dummy maksimal")
+    parser.add_argument("--hold", type=float, default=20.0, help="Detik menahan tiap level")
+    parser.add_argument("--interval", type=float, default=2.0, help="Detik antar sampel selama hold")
+    parser.add_argument("--max-launch-ms", type=float, default=1000.0, help="Batas launch p95 per level")
+    parser.add_argument("--max-lag-ms", type=float, default=50.0, help="Batas lag controller p95")
+    parser.add_argument("--output", help="Simpan hasil sebagai JSON")
+    args = parser.parse_args()
+
+    prefix = "SoakDummy"
+    workdir = tempfile.mkdtemp(prefix="dgs-soak-")
+    cache = app.ArtifactCache(os.path.join(workdir, "artifacts"))
+    manager = app.SessionManager(cache, registry=app.ProcessRegistry(workdir))
+    probe = LagProbe()
+    levels, breaking = [], None
+
+    print(f"{'dummies':>7} {'launch p95':>10} {'RSS/dummy':>10} {'dummy RSS':>10} {'ctl RSS':>9} {'FDs':>5} "
+          f"{'threads':>7} {'sample ms':>9} {'lag p95':>8} {'errors':>6} {'artifacts':>15}")
+    try:
+        count = 0
+        while count < args.max:
+            names = [f"{prefix}{i}.exe" for i in range(count, min(args.max, count + args.step))]
+            manager.latency = app.LatencyRecorder() # Latensi per level
+            t0 = time.perf_counter()
+            started, errors = manager.launch_many(names)
+            for session in started:
+                session.wait_ready(30)
+            ramp_s = time.perf_counter() - t0
+            count += len(started)
+            exits_before = manager.counters["unexpected_exits"]
+
+            level = hold_level(manager, probe, args.hold, args.interval)
+            launch = manager.latency.summary("launch_cold")
+            artifacts = artifact_usage(cache)
+            level.update({
+                "artifact_files": artifacts["files"], "artifact_bytes": artifacts["bytes"],
+                "dummies": len(manager), "ramp_s": ramp_s, "errors": errors,
+                "launch_ms_p95": (launch["p95"] or 0) * 1000,
+                "unexpected_exits": manager.counters["unexpected_exits"] - exits_before,
+            })
+            levels.append(level)
+            per_dummy = level["dummy_rss"] / level["dummies"] if level["dummies"] else 0
+            print(f"{level['dummies']:>7} {level['launch_ms_p95']:>10.1f} {app.format_bytes(per_dummy):>10} "
+                  f"{app.format_bytes(level['dummy_rss']):>10} {app.format_bytes(level['controller_rss'] or 0):>9} "
+                  f"{level['fds'] or 0:>5} {level['threads']:>7} {level['sample_ms_p95']:>9.1f} "
+                  f"{level['lag_ms_p95']:>8.1f} {len(errors):>6} "
+                  f"{str(level['artifact_files']) + ' / ' + app.format_bytes(level['artifact_bytes']):>15}")
+
+            reasons = []
+            if errors: reasons.append(f"{len(errors)} launch errors ({next(iter(errors.values()))})")
+            if level["unexpected_exits"]: reasons.append(f"{level['unexpected_exits']} dummies died during hold")
+            if level["launch_ms_p95"] > args.max_launch_ms: reasons.append(f"launch p95 {level['launch_ms_p95']:.0f} ms")
+            if level["lag_ms_p95"] > args.max_lag_ms: reasons.append(f"controller lag p95 {level['lag_ms_p95']:.0f} ms")
+            if reasons:
+                breaking = {"dummies": level["dummies"], "reasons": reasons}
+                break
+            if not started:
+                break
+    finally:
+        t0 = time.perf_counter()
+        manager.shutdown()
+        teardown_s = time.perf_counter() - t0
+        probe.stop()
+        time.sleep(0.5) # Beri waktu thread watcher mencatat exit & membersihkan registry
+        left = leftovers(workdir, prefix, cache)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\nTeardown: {teardown_s:.2f} s  ·  leftover processes {left['processes']}, "
+          f"temp files {left['temp_files']}, registry files {left['registry_files']}")
+    print(f"Artifacts: {left['artifact_files']} files, {app.format_bytes(left['artifact_bytes'])} on disk "
+          f"(budget {app.format_bytes(cache.budget_bytes)}), {left['artifact_stray']} outside the cache index")
+    if breaking:
+        print(f"Breaks at {breaking['dummies']} dummies: {'; '.join(breaking['reasons'])}")
+    else:
+        print(f"No break up to {levels[-1]['dummies'] if levels else 0} dummies")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "args": vars(args), "timestamp": time.time(), "levels": levels,
+                       "teardown_s": teardown_s, "leftovers": left, "break": breaking}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# discordGS.py adalah satu file di root repo (bukan package), jadi tambahkan root ke sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,44 @@
+"""ArtifactCache: hit/miss & eviction (budget byte dan batas jumlah entry)"""
+import os
+
+import discordGS as app
+
+def make_cache(tmp_path, **kwargs):
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"x" * 1000)
+    return app.ArtifactCache(str(tmp_path / "artifacts"), source=str(source), **kwargs)
+
+def test_prepare_reuses_entry(tmp_path):
+    cache = make_cache(tmp_path)
+    path = cache.prepare("Game.exe")
+    assert cache.prepare("Game.exe") == path
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert os.path.getsize(path) == 1000
+
+def test_zero_byte_entries_capped_by_count(tmp_path):
+    # Cache & source satu filesystem -> hardlink (0 byte tambahan); tanpa batas jumlah index tumbuh terus
+    cache = make_cache(tmp_path, max_entries=3)
+    paths = [cache.prepare(f"Game{i}.exe") for i in range(6)]
+    assert len(cache.index["entries"]) == 3
+    assert [os.path.exists(p) for p in paths] == [False] * 3 + [True] * 3
+    assert cache.stats()["disk_bytes"] == 0
+
+def test_copies_evicted_over_budget(tmp_path, monkeypatch):
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+    monkeypatch.setattr(app.os, "link", no_link)
+    monkeypatch.setattr(app.os, "symlink", no_link)
+    monkeypatch.setattr(app, "_reflink", no_link)
+    cache = make_cache(tmp_path, budget_bytes=2500)
+    paths = [cache.prepare(f"Game{i}.exe") for i in range(4)]
+    assert [os.path.exists(p) for p in paths] == [False, False, True, True]
+    assert cache.stats()["disk_bytes"] == 2000
+
+def test_hit_does_not_stat_other_entries(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path)
+    for i in range(5):
+        cache.prepare(f"Game{i}.exe")
+    calls = []
+    monkeypatch.setattr(cache, "disk_usage", lambda key: calls.append(key) or 0)
+    cache.prepare("Game0.exe")
+    assert calls == []
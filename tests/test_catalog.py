@@ -0,0 +1,224 @@
+"""Import katalog (--import-catalog): snapshot lokal, delta inkremental, kompaksi & ETag/304 via http.server"""
+import http.server
+import json
+import threading
+
+import pytest
+
+import discordGS as app
+
+def detectable(*apps):
+    """Snapshot format daftar detectable Discord dari pasangan (judul, exe)"""
+    return [{"name": title, "executables": [{"os": "win32", "name": f"bin/{exe}"}]} for title, exe in apps]
+
+def write_snapshot(tmp_path, data, name="snapshot.json"):
+    path = tmp_path / name
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+def read_delta(catalog_path):
+    with open(catalog_path + ".delta", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def effective(catalog_path):
+    catalog = app.CatalogFile(catalog_path)
+    try:
+        return {key: title for key, (_, title) in catalog.entries().items()}
+    finally:
+        catalog.close()
+
+BASE = [("Valorant", "VALORANT.exe"), ("Destiny 2", "destiny2.exe"), ("Minecraft", "javaw.exe"),
+        ("Fortnite", "FortniteClient.exe"), ("Apex Legends", "r5apex.exe")]
+
+def test_first_import_creates_catalog(tmp_path):
+    catalog_path = str(tmp_path / "catalog.bin")
+    result = app.import_catalog(write_snapshot(tmp_path, detectable(*BASE)), catalog_path)
+    assert result == {"added": 5, "removed": 0, "changed": 0}
+    assert not (tmp_path / "catalog.bin.delta").exists()
+
+    catalog = app.CatalogFile(catalog_path)
+    try:
+        assert len(catalog) == 5
+        assert [catalog.row(i) for i in catalog.prefix("dest", 10)] == [("destiny2.exe", "Destiny 2")]
+        assert [catalog.row(i)[0] for i in catalog.title_prefix("apex", 10)] == ["r5apex.exe"]
+    finally:
+        catalog.close()
+
+def test_incremental_import_writes_only_diff(tmp_path):
+    catalog_path = str(tmp_path / "catalog.bin")
+    app.import_catalog(write_snapshot(tmp_path, detectable(*BASE)), catalog_path)
+    main_before = (tmp_path / "catalog.bin").read_bytes()
+
+    updated = BASE[1:] + [("Rocket League", "RocketLeague.exe")] # -Valorant +Rocket League
+    result = app.import_catalog(write_snapshot(tmp_path, detectable(*updated)), catalog_path, compact_ratio=10)
+    assert result == {"added": 1, "removed": 1, "changed": 0}
+    assert read_delta(catalog_path) == [{"op": "add", "exe": "RocketLeague.exe", "title": "Rocket League"},
+                                        {"op": "del", "exe": "VALORANT.exe"}]
+    assert (tmp_path / "catalog.bin").read_bytes() == main_before # File utama tidak ditulis ulang
+    assert "valorant.exe" not in effective(catalog_path)
+    assert effective(catalog_path)["rocketleague.exe"] == "Rocket League"
+
+def test_changed_entries(tmp_path):
+    catalog_path = str(tmp_path / "catalog.bin")
+    app.import_catalog(write_snapshot(tmp_path, detectable(*BASE)), catalog_path)
+
+    renamed = [("Destiny 2: Lightfall", "destiny2.exe")] + [a for a in BASE if a[1] != "destiny2.exe"]
+    result = app.import_catalog(write_snapshot(tmp_path, detectable(*renamed)), catalog_path, compact_ratio=10)
+    assert result == {"added": 0, "removed": 0, "changed": 1}
+    assert read_delta(catalog_path) == [{"op": "add", "exe": "destiny2.exe", "title": "Destiny 2: Lightfall",
+                                         "changed": True}]
+    assert effective(catalog_path)["destiny2.exe"] == "Destiny 2: Lightfall"
+
+    # Entry yang ditimpa delta tidak muncul dua kali di autocomplete
+    catalog = app.CatalogFile(catalog_path)
+    try:
+        index = app.CompletionIndex(catalog.sources(), catalog.removed)
+        assert index.query("destiny") == [("destiny2.exe", "Destiny 2: Lightfall")]
+    finally:
+        catalog.close()
+
+def test_compaction_past_ratio(tmp_path):
+    catalog_path = str(tmp_path / "catalog.bin")
+    app.import_catalog(write_snapshot(tmp_path, detectable(*BASE)), catalog_path)
+
+    # 1 dari 5 entry berubah = 20% < 25%: delta dipakai
+    app.import_catalog(write_snapshot(tmp_path, detectable(*BASE[:4])), catalog_path)
+    assert len(read_delta(catalog_path)) == 1
+
+    # Delta jadi 2 baris = 40% > 25%: file utama ditulis ulang & delta dihapus
+    app.import_catalog(write_snapshot(tmp_path, detectable(*BASE[:3])), catalog_path)
+    assert not (tmp_path / "catalog.bin.delta").exists()
+    catalog = app.CatalogFile(catalog_path)
+    try:
+        assert len(catalog) == 3
+    finally:
+        catalog.close()
+
+def test_truncated_catalog_raises_value_error(tmp_path):
+    path = tmp_path / "catalog.bin"
+    app.write_catalog(str(path), [(exe, title) for title, exe in BASE])
+    full = path.read_bytes()
+    header = app.CatalogFile.HEADER.size
+    for content in (b"", full[:4], full[:header], full[:header + 8], full[:-6]):
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            app.CatalogFile(str(path))
+
+def test_import_rebuilds_unreadable_catalog(tmp_path):
+    (tmp_path / "catalog.bin").write_bytes(b"")
+    result = app.import_catalog(write_snapshot(tmp_path, detectable(*BASE)), str(tmp_path / "catalog.bin"))
+    assert result["added"] == 5
+
+class SnapshotHandler(http.server.BaseHTTPRequestHandler):
+    body = b""
+    etag = '"v1"'
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def snapshot_server():
+    SnapshotHandler.requests = []
+    server = http.server.HTTPServer(("127.0.0.1", 0), SnapshotHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def test_http_etag_not_modified(tmp_path, snapshot_server):
+    catalog_path = str(tmp_path / "catalog.bin")
+    url = f"http://127.0.0.1:{snapshot_server.server_port}/detectable.json"
+    SnapshotHandler.body = json.dumps(detectable(*BASE)).encode()
+
+    assert app.import_catalog(url, catalog_path)["added"] == 5
+    assert app.import_catalog(url, catalog_path) == {"added": 0, "removed": 0, "changed": 0}
+    assert SnapshotHandler.requests == [None, '"v1"']
+    assert not (tmp_path / "catalog.bin.delta").exists()
+
+    # ETag baru: snapshot diambil ulang & hanya diff-nya yang masuk delta
+    SnapshotHandler.etag = '"v2"'
+    SnapshotHandler.body = json.dumps(detectable(*BASE[1:])).encode()
+    try:
+        assert app.import_catalog(url, catalog_path, compact_ratio=10)["removed"] == 1
+    finally:
+        SnapshotHandler.etag = '"v1"'
+    assert read_delta(catalog_path) == [{"op": "del", "exe": "VALORANT.exe"}]
+
+def subsequence_gaps(query, key):
+    """Referensi fuzzy: jumlah celah subsequence match paling kiri, None jika tidak cocok"""
+    pos, gaps = -1, 0
+    for ch in query:
+        nxt = key.find(ch, pos + 1)
+        if nxt < 0: return None
+        gaps += nxt - pos - 1
+        pos = nxt
+    return gaps
+
+def test_fuzzy_section_matches_reference(tmp_path):
+    entries = [(exe, title) for title, exe in BASE] + [("Épée.exe", "Légende d'été"), ("x[y]^-z.exe", "")]
+    path = str(tmp_path / "catalog.bin")
+    app.write_catalog(path, entries)
+    catalog = app.CatalogFile(path)
+    try:
+        assert catalog.fuzzy_range is not None
+        for query in ("dst2", "vlr", "ée", "été", "[]^", "y]-", "zzz", "a e"):
+            got = sorted((score - len(query.encode()) - 1, catalog.row(i)[0])
+                         for score, i in catalog.fuzzy(app.fuzzy_pattern(query)))
+            keys = {exe: f"{exe} {title}".lower() for exe, title in entries}
+            expected = sorted((subsequence_gaps(query, key), exe) for exe, key in keys.items()
+                              if subsequence_gaps(query, key) is not None)
+            if query.isascii():
+                assert got == expected, query
+            else: # Skor dihitung dalam byte UTF-8; yang dibandingkan cukup himpunan match-nya
+                assert {exe for _, exe in got} == {exe for _, exe in expected}, query
+    finally:
+        catalog.close()
+
+def test_fuzzy_query_narrows_previous_candidates(tmp_path):
+    path = str(tmp_path / "catalog.bin")
+    app.write_catalog(path, [(exe, title) for title, exe in BASE])
+    catalog = app.CatalogFile(path)
+    try:
+        index = app.CompletionIndex(catalog.sources(), catalog.removed)
+        assert ("destiny2.exe", "Destiny 2") in index.query("ds")
+        assert index._last_fuzzy[0] == "ds"
+        assert index.query("dst2") == [("destiny2.exe", "Destiny 2")]
+        assert index.query("dst2q") == []
+    finally:
+        catalog.close()
+
+def test_import_rewrites_catalog_without_fuzzy_section(tmp_path):
+    path = tmp_path / "catalog.bin"
+    app.write_catalog(str(path), [(exe, title) for title, exe in BASE])
+    # Katalog dari versi sebelum section fuzzy: flags 0, tanpa section & trailer
+    catalog = app.CatalogFile(str(path))
+    end = catalog.fuzzy_range and app.CatalogFile.FUZZY_TRAILER.unpack_from(catalog.mm, len(catalog.mm) - 8)[0]
+    catalog.close()
+    data = bytearray(path.read_bytes()[:end])
+    data[6:8] = b"\0\0"
+    path.write_bytes(bytes(data))
+
+    old = app.CatalogFile(str(path))
+    try:
+        assert old.fuzzy_range is None and old.fuzzy(app.fuzzy_pattern("dst")) == []
+    finally:
+        old.close()
+    app.import_catalog(write_snapshot(tmp_path, detectable(*BASE)), str(path))
+    new = app.CatalogFile(str(path))
+    try:
+        assert new.fuzzy_range is not None
+    finally:
+        new.close()
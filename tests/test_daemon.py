@@ -0,0 +1,140 @@
+"""SpooferDaemon: op IPC lewat socket, client paralel, dan penolakan daemon kedua"""
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import discordGS as app
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason="test memakai Unix socket")
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv("DGS_DATA_DIR", str(tmp_path))
+    daemon = app.SpooferDaemon(app.daemon_address())
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.time() + 10
+    while not app.daemon_request({"op": "ping"}, daemon.address, quiet=True):
+        assert time.time() < deadline, "daemon tidak mulai listen"
+        time.sleep(0.02)
+    yield daemon
+    app.daemon_request({"op": "shutdown"}, daemon.address, quiet=True)
+    thread.join(timeout=15)
+    assert not thread.is_alive()
+
+def request(daemon, **kwargs):
+    return app.daemon_request(kwargs, daemon.address)
+
+def names(response):
+    return sorted(s["name"] for s in response["sessions"])
+
+def test_ping_and_unknown_op(daemon):
+    assert request(daemon, op="ping") == {"ok": True, "pid": os.getpid()}
+    response = request(daemon, op="bogus")
+    assert not response["ok"] and "unknown op" in response["error"]
+    assert not request(daemon, op="start")["ok"] # Field "game" hilang: error, bukan koneksi putus
+
+def test_start_list_stop(daemon):
+    response = request(daemon, op="start", game="IpcA")
+    assert response["ok"] and response["session"]["name"] == "IpcA.exe"
+    assert names(request(daemon, op="list")) == ["IpcA.exe"]
+    duplicate = request(daemon, op="start", game="IpcA.exe")
+    assert not duplicate["ok"] and "already running" in duplicate["error"]
+
+    response = request(daemon, op="stop", game="IpcA.exe")
+    assert response["ok"] and response["session"]["name"] == "IpcA.exe"
+    listing = request(daemon, op="list")
+    assert listing["sessions"] == []
+    assert not request(daemon, op="stop", game="IpcA.exe")["ok"]
+
+def test_batch_and_stop_all(daemon):
+    request(daemon, op="start", game="IpcB")
+    response = request(daemon, op="batch", games=["IpcB", "IpcC", "IpcD", "IpcC"])
+    assert names(response) == ["IpcC.exe", "IpcD.exe"]
+    assert not response["ok"] and list(response["errors"]) == ["IpcB.exe"]
+    assert names(request(daemon, op="list", usage=True)) == ["IpcB.exe", "IpcC.exe", "IpcD.exe"]
+    assert request(daemon, op="stop_all")["ok"]
+    assert request(daemon, op="list")["sessions"] == []
+
+def test_ended_lists_exited_session(daemon):
+    session = request(daemon, op="start", game="IpcE")["session"]
+    os.kill(session["pid"], 9)
+    deadline = time.time() + 10
+    while True:
+        ended = request(daemon, op="list")["ended"]
+        if ended: break
+        assert time.time() < deadline, "sesi yang mati tidak muncul di ended"
+        time.sleep(0.05)
+    assert ended[0]["name"] == "IpcE.exe" and ended[0]["exit_code"] is not None
+
+def test_quest_and_status(daemon):
+    response = request(daemon, op="quest", entries=[{"game": "IpcQ", "minutes": 0.01}])
+    assert response["ok"] and [e["game"] for e in response["entries"]] == ["IpcQ.exe"]
+    deadline = time.time() + 30
+    while True:
+        entries = request(daemon, op="quest_status")["entries"]
+        if entries[0]["status"] not in ("queued", "running"): break
+        assert time.time() < deadline, "quest tidak selesai"
+        time.sleep(0.1)
+    assert entries[0]["status"] == "done"
+    assert os.path.exists(os.path.join(os.environ["DGS_DATA_DIR"], "quests.json"))
+
+def test_metrics(daemon):
+    request(daemon, op="start", game="IpcM")
+    text = request(daemon, op="metrics")["text"]
+    assert "dgs_launches_total 1" in text.splitlines()
+    assert "dgs_sessions 1" in text.splitlines()
+
+def test_concurrent_clients(daemon):
+    games = [f"IpcPar{i}" for i in range(6)] * 2 # Setiap game di-start dua kali dari client berbeda
+    with ThreadPoolExecutor(max_workers=len(games)) as executor:
+        responses = list(executor.map(lambda g: request(daemon, op="start", game=g), games))
+    assert sum(r["ok"] for r in responses) == 6
+    assert all("already running" in r["error"] for r in responses if not r["ok"])
+    assert names(request(daemon, op="list")) == sorted(f"IpcPar{i}.exe" for i in range(6))
+
+def test_second_daemon_refused_before_spawning(daemon, monkeypatch, capsys):
+    def constructed(*args, **kwargs):
+        raise AssertionError("SpooferDaemon dibuat padahal daemon lain masih hidup")
+    monkeypatch.setattr(app, "SpooferDaemon", constructed)
+    assert app.run_daemon(daemon.address) == 1
+    assert "already running" in capsys.readouterr().out
+    assert request(daemon, op="ping")["ok"] # Daemon pertama tidak terganggu
+
+def test_connected_quests_run_in_daemon_scheduler(daemon, monkeypatch, capsys):
+    def constructed(*args, **kwargs):
+        raise AssertionError("--connect tidak boleh membuat QuestScheduler lokal")
+    monkeypatch.setattr(app, "QuestScheduler", constructed)
+    monkeypatch.setattr(app.sys, "argv", ["discordGS.py", "--quest", "IpcR:0.01", "--connect"])
+    watch = app.watch_daemon_quests
+    monkeypatch.setattr(app, "watch_daemon_quests", lambda specs: watch(specs, interval=0.05))
+    assert app.run_quests(["IpcR:0.01"]) == 0
+    assert "IpcR.exe: done" in capsys.readouterr().out
+    entries = request(daemon, op="quest_status")["entries"]
+    assert [(e["game"], e["status"], e["attempts"]) for e in entries] == [("IpcR.exe", "done", 0)]
+
+def test_local_quests_refused_while_queue_is_owned(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("DGS_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(app.sys, "argv", ["discordGS.py", "--quest", "IpcL:1"])
+    def spawned(*args, **kwargs):
+        raise AssertionError("manager dibuat padahal antrian dimiliki proses lain")
+    monkeypatch.setattr(app, "local_session_manager", spawned)
+    owner = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    try:
+        (tmp_path / "quests.json.lock").write_text(str(owner.pid))
+        assert app.run_quests(["IpcL:1"]) == 1
+        assert f"owned by pid {owner.pid}" in capsys.readouterr().out
+        assert not (tmp_path / "quests.json").exists()
+    finally:
+        owner.kill()
+        owner.wait()
+    scheduler = app.QuestScheduler(None)
+    assert scheduler.acquire() is None # Lock basi dari pemilik yang sudah mati diambil alih
+    assert (tmp_path / "quests.json.lock").read_text() == str(os.getpid())
+    scheduler.release()
+    assert not (tmp_path / "quests.json.lock").exists()
@@ -0,0 +1,104 @@
+"""HistoryStore: log append-only, load top-N, baris terpotong, kompaksi & migrasi game_history.json"""
+import json
+import os
+import threading
+
+import pytest
+
+import discordGS as app
+
+@pytest.fixture(autouse=True)
+def no_legacy_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path) # game_history.json lama dibaca relatif ke cwd
+
+def test_append_and_reload(tmp_path):
+    store = app.HistoryStore(str(tmp_path))
+    store.record_launch("A.exe", ts=1000)
+    store.record_launch("A.exe", ts=1001)
+    store.record_end("A.exe", 12.34, exit_code=-15)
+
+    reloaded = app.HistoryStore(str(tmp_path))
+    stats = reloaded.stats("A.exe")
+    assert stats["count"] == 2
+    assert stats["total"] == 12.3
+    assert stats["last"] == 1001
+    assert stats["last_exit"] == -15
+
+def test_load_limit_reads_top_n_from_index(tmp_path):
+    store = app.HistoryStore(str(tmp_path))
+    store.COMPACT_EVERY = 10 ** 6 # Kompaksi hanya lewat compact() di bawah (bukan di background)
+    for i in range(10):
+        for _ in range(i + 1): # Game9 paling sering -> skor tertinggi
+            store.record_launch(f"Game{i}.exe")
+    store.compact()
+
+    top = app.HistoryStore(str(tmp_path), load_limit=3)
+    assert top.ranked() == ["Game9.exe", "Game8.exe", "Game7.exe"]
+    assert len(app.HistoryStore(str(tmp_path)).ranked()) == 10
+
+def test_torn_last_line_is_dropped(tmp_path):
+    store = app.HistoryStore(str(tmp_path))
+    store.record_launch("A.exe")
+    with open(store.log_path(store.gen), "ab") as f:
+        f.write(b'{"e":"launch","g":"B.e') # Crash di tengah write
+
+    reloaded = app.HistoryStore(str(tmp_path))
+    assert reloaded.ranked() == ["A.exe"]
+
+def test_compaction_rotates_log_and_keeps_counts(tmp_path):
+    store = app.HistoryStore(str(tmp_path))
+    for _ in range(3):
+        store.record_launch("A.exe")
+    old_gen = store.gen
+    store.compact()
+
+    assert store.gen == old_gen + 1
+    assert not os.path.exists(store.log_path(old_gen))
+    with open(store.index_path, encoding="utf-8") as f:
+        assert json.loads(f.readline()) == {"gen": old_gen + 1, "offset": 0}
+    store.record_launch("A.exe")
+    assert app.HistoryStore(str(tmp_path)).stats("A.exe")["count"] == 4
+
+def test_record_during_compaction_is_not_blocked_or_lost(tmp_path, monkeypatch):
+    store = app.HistoryStore(str(tmp_path))
+    store.record_launch("A.exe")
+    recorded = threading.Event()
+    read_index = store._read_index
+
+    def slow_read_index(limit=None):
+        # record_launch dari thread lain harus selesai selagi kompaksi masih membaca & menulis index
+        writer = threading.Thread(target=lambda: (store.record_launch("B.exe"), recorded.set()))
+        writer.start()
+        writer.join(5)
+        return read_index(limit)
+
+    monkeypatch.setattr(store, "_read_index", slow_read_index)
+    store.compact()
+    assert recorded.is_set()
+    assert store.stats("B.exe")["count"] == 1
+
+    reloaded = app.HistoryStore(str(tmp_path))
+    assert reloaded.stats("A.exe")["count"] == 1
+    assert reloaded.stats("B.exe")["count"] == 1
+
+def test_interrupted_compaction_still_reads_new_generation(tmp_path):
+    store = app.HistoryStore(str(tmp_path))
+    store.record_launch("A.exe")
+    store.gen += 1 # Rotasi sudah terjadi, index belum sempat ditulis
+    store.record_launch("B.exe")
+
+    reloaded = app.HistoryStore(str(tmp_path))
+    assert set(reloaded.ranked()) == {"A.exe", "B.exe"}
+    assert reloaded.gen == store.gen
+
+def test_legacy_history_migrated_once(tmp_path):
+    with open(app.HISTORY_FILE, "w") as f:
+        json.dump(["Newest.exe", "Older.exe"], f)
+
+    store = app.HistoryStore(str(tmp_path / "data"))
+    assert store.most_recent() == "Newest.exe"
+    assert set(store.ranked()) == {"Newest.exe", "Older.exe"}
+
+    store.compact()
+    again = app.HistoryStore(str(tmp_path / "data"))
+    assert again.stats("Newest.exe")["count"] == 1
@@ -0,0 +1,61 @@
+"""Nama file executable dummy & launcher symlink (Linux)"""
+import os
+import sys
+
+import pytest
+
+import discordGS as app
+
+@pytest.mark.parametrize("game_name, expected", [
+    ("Game.exe", "Game.exe"),
+    ("My Game.exe", "My Game.exe"),
+    ("Jeu été.exe", "Jeu été.exe"),
+    ("a/b.exe", "a_b.exe"),
+    ("../evil.exe", ".._evil.exe"),
+    ("tab\there.exe", "tab_here.exe"),
+    (".", "_."),
+    ("..", "_.."),
+])
+def test_safe_exe_filename(game_name, expected):
+    assert app.safe_exe_filename(game_name) == expected
+
+def test_safe_exe_filename_stays_in_folder(tmp_path):
+    for game_name in ("..", "../x.exe", "a/../../b.exe"):
+        path = os.path.join(tmp_path, app.safe_exe_filename(game_name))
+        assert os.path.dirname(os.path.realpath(path)) == os.path.realpath(tmp_path)
+
+@pytest.mark.parametrize("game_name", ["VeryLongGameName.exe", "ééééééééé.exe", "Épée Légendaire.exe"])
+def test_process_name_matches_truncated_comm(game_name):
+    # Linux memotong comm di 15 byte, bisa di tengah karakter UTF-8
+    comm = app.safe_exe_filename(game_name).encode("utf-8")[:15].decode(errors="replace")
+    expected = game_name if os.name == 'nt' else comm
+    assert app.process_name_matches(expected, game_name)
+    assert not app.process_name_matches(expected[:-1] + "x", game_name)
+
+def read_proc(pid):
+    with open(f"/proc/{pid}/comm", "rb") as f:
+        comm = f.read().rstrip(b"\n")
+    with open(f"/proc/{pid}/cmdline", "rb") as f:
+        argv0 = f.read().split(b"\0", 1)[0].decode()
+    return comm, argv0
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="symlink launcher is Linux-only")
+@pytest.mark.parametrize("game_name", ["Game.exe", "My Game.exe", "VeryLongGameName.exe", "a/b.exe",
+                                       "Jeu été.exe", "ééééééééé.exe"])
+def test_symlink_launch_process_name(tmp_path, monkeypatch, game_name):
+    def no_hardlink(src, dst):
+        raise OSError("cross-device link")
+    monkeypatch.setattr(app.os, "link", no_hardlink) # Paksa jalur symlink seperti cache beda filesystem
+
+    manager = app.SessionManager(app.ArtifactCache(str(tmp_path / "artifacts")))
+    session = manager.start_process(game_name)
+    try:
+        assert os.path.islink(session.exe_path)
+        assert session.wait_ready(30)
+        filename = app.safe_exe_filename(game_name)
+        comm, argv0 = read_proc(session.process.pid)
+        assert comm == filename.encode("utf-8")[:15]
+        assert os.path.basename(argv0) == filename
+        assert app.process_name_matches(comm.decode("utf-8", errors="replace"), filename)
+    finally:
+        manager.discard_process(session)
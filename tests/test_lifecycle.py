@@ -0,0 +1,40 @@
+"""LifecycleWorker: job per nama berurutan & antrian tidak menyimpan job yang sudah selesai"""
+import threading
+import time
+
+import discordGS as app
+
+class FakeManager:
+    max_parallel = 4
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def spawn(self, name):
+        time.sleep(0.01)
+        with self.lock:
+            self.calls.append(("launch", name))
+        return name
+
+    def stop(self, name):
+        with self.lock:
+            self.calls.append(("stop", name))
+        return name
+
+def test_jobs_for_one_name_run_in_order_and_tails_are_pruned():
+    manager, done = FakeManager(), []
+    worker = app.LifecycleWorker(manager, lambda callback, *args: callback(*args))
+    on_done = lambda name, result, error: done.append((name, error))
+    for i in range(50):
+        worker.launch(f"Game{i}.exe", on_done)
+    worker.stop("Game0.exe", on_done)
+    deadline = time.time() + 10
+    while len(done) < 51 and time.time() < deadline:
+        time.sleep(0.01)
+    worker.shutdown()
+
+    assert len(done) == 51
+    assert manager.calls.index(("launch", "Game0.exe")) < manager.calls.index(("stop", "Game0.exe"))
+    assert worker.tails == {}
+    assert not worker.busy("Game0.exe")
@@ -0,0 +1,54 @@
+"""DummyPool: tidak overfill, tidak diisi ulang setelah acquire, dan standby ikut mati saat stop"""
+import time
+
+import pytest
+
+import discordGS as app
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = app.SessionManager(app.ArtifactCache(str(tmp_path / "artifacts")))
+    manager.pool = app.DummyPool(manager, size=1, idle_timeout=60)
+    yield manager
+    manager.shutdown()
+
+def idle_count(pool, name, settle=3.0):
+    """Tunggu start yang masih berjalan selesai, lalu hitung worker standby"""
+    deadline = time.time() + settle
+    while time.time() < deadline:
+        with pool.lock:
+            if not pool.pending[name]: break
+        time.sleep(0.02)
+    with pool.lock:
+        return len(pool.idle.get(name, []))
+
+def test_repeated_warm_does_not_overfill(manager):
+    for _ in range(3):
+        manager.pool.warm(["PoolA.exe"])
+    time.sleep(0.2)
+    assert idle_count(manager.pool, "PoolA.exe") == 1
+
+def test_acquire_does_not_refill_and_stop_discards(manager):
+    manager.pool.warm(["PoolA.exe", "PoolB.exe"])
+    time.sleep(0.2)
+    assert idle_count(manager.pool, "PoolA.exe") == 1
+    for session in manager.pool.idle["PoolA.exe"]:
+        assert session.wait_ready(30)
+
+    session = manager.spawn("PoolA.exe")
+    assert session.warm
+    time.sleep(0.2)
+    assert idle_count(manager.pool, "PoolA.exe") == 0
+
+    manager.stop("PoolA.exe")
+    assert session.process.poll() is not None
+    assert idle_count(manager.pool, "PoolB.exe") == 1
+    manager.stop_all()
+    assert idle_count(manager.pool, "PoolB.exe") == 0
+
+def test_stop_during_warm_drops_late_worker(manager):
+    manager.pool.warm(["PoolA.exe"])
+    while not manager.pool.pending["PoolA.exe"]: # Stop saat start worker masih berjalan
+        time.sleep(0.001)
+    manager.stop("PoolA.exe")
+    assert idle_count(manager.pool, "PoolA.exe") == 0
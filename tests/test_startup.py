@@ -0,0 +1,32 @@
+"""Regresi cold-start: budget STARTUP_BUDGET_MS (sama dengan discordGS.py --check-startup)"""
+import os
+import sys
+
+import pytest
+
+import discordGS as app
+
+def has_display():
+    if sys.platform.startswith("linux"):
+        return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    return True
+
+def test_import_budget():
+    import_ms = app.measure_import_ms()
+    assert import_ms is not None
+    assert import_ms <= app.STARTUP_BUDGET_MS["import"]
+
+def test_no_heavy_imports_at_module_load():
+    # Modul yang sengaja di-lazy-load (lihat LazyModule) tidak boleh ikut ter-import oleh `import discordGS`
+    lazy = ("tkinter.messagebox", "shutil", "subprocess", "tempfile", "ctypes", "webbrowser")
+    code = f"import sys, discordGS; print(','.join(m for m in {lazy!r} if m in sys.modules))"
+    out = app.subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(app.__file__)),
+                             capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == ""
+
+@pytest.mark.skipif(not has_display(), reason="first-frame probe needs a display")
+def test_first_frame_budget():
+    result = app.measure_first_frame_ms()
+    assert result is not None, "--startup-probe did not report a first frame"
+    assert result["first_frame"] <= app.STARTUP_BUDGET_MS["first_frame"]